@@ -0,0 +1,87 @@
+"""Add attendance rollup tables (daily per org unit, monthly per employee)
+
+Revision ID: 004_add_attendance_stats
+Revises: 003_add_fk_constraints
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_add_attendance_stats"
+down_revision: Union[str, None] = "003_add_fk_constraints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attendance_daily_stats",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("attendance_date", sa.Date(), nullable=False),
+        sa.Column("org_unit_id", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("attendance_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("work_hours", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("overtime_hours", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "attendance_date",
+            "org_unit_id",
+            "status",
+            name="uq_attendance_daily_stats_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        "ix_attendance_daily_stats_org_unit_id",
+        "attendance_daily_stats",
+        ["org_unit_id"],
+    )
+
+    op.create_table(
+        "attendance_monthly_stats",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False),
+        sa.Column("attendance_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("work_hours", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("overtime_hours", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "employee_id", "month", "status", name="uq_attendance_monthly_stats_key"
+        ),
+    )
+    op.create_index(
+        "ix_attendance_monthly_stats_month",
+        "attendance_monthly_stats",
+        ["month"],
+    )
+
+    # Backfill from existing attendances
+    op.execute("""
+        INSERT INTO attendance_daily_stats
+            (attendance_date, org_unit_id, status, attendance_count, work_hours, overtime_hours)
+        SELECT attendance_date, org_unit_id, status, count(*),
+               coalesce(sum(work_hours), 0), coalesce(sum(overtime_hours), 0)
+        FROM attendances
+        GROUP BY attendance_date, org_unit_id, status
+    """)
+    op.execute("""
+        INSERT INTO attendance_monthly_stats
+            (employee_id, month, status, attendance_count, work_hours, overtime_hours)
+        SELECT employee_id, date_trunc('month', attendance_date)::date, status, count(*),
+               coalesce(sum(work_hours), 0), coalesce(sum(overtime_hours), 0)
+        FROM attendances
+        GROUP BY employee_id, date_trunc('month', attendance_date)::date, status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attendance_monthly_stats_month", table_name="attendance_monthly_stats")
+    op.drop_table("attendance_monthly_stats")
+    op.drop_index("ix_attendance_daily_stats_org_unit_id", table_name="attendance_daily_stats")
+    op.drop_table("attendance_daily_stats")
@@ -0,0 +1,44 @@
+"""Add composite date indexes for attendance and leave lookups
+
+Dashboard and scheduler queries filter attendances by attendance_date
+(plus status) and leave_requests by date range, optionally per employee.
+(employee_id, attendance_date) is already covered by
+uq_attendance_employee_date.
+
+Revision ID: 005_add_date_composite_indexes
+Revises: 004_add_attendance_stats
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_add_date_composite_indexes"
+down_revision: Union[str, None] = "004_add_attendance_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_attendances_date_status",
+        "attendances",
+        ["attendance_date", "status"],
+    )
+    op.create_index(
+        "ix_leave_requests_dates",
+        "leave_requests",
+        ["start_date", "end_date"],
+    )
+    op.create_index(
+        "ix_leave_requests_employee_dates",
+        "leave_requests",
+        ["employee_id", "start_date", "end_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leave_requests_employee_dates", table_name="leave_requests")
+    op.drop_index("ix_leave_requests_dates", table_name="leave_requests")
+    op.drop_index("ix_attendances_date_status", table_name="attendances")
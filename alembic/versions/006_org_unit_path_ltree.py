@@ -0,0 +1,50 @@
+"""Convert org_units.path to ltree with a GiST index
+
+Subtree lookups used LIKE 'path%' on a varchar, which also matched
+siblings sharing a prefix ("1" matched "10.x"). ltree <@ / @> compare
+whole labels and are served by the GiST index. Existing dotted id paths
+are valid ltree values and are converted in place.
+
+Revision ID: 006_org_unit_path_ltree
+Revises: 005_add_date_composite_indexes
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_org_unit_path_ltree"
+down_revision: Union[str, None] = "005_add_date_composite_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS ltree")
+
+    op.drop_index("ix_org_units_path_pattern", table_name="org_units")
+    op.drop_index("ix_org_units_path", table_name="org_units")
+
+    op.execute(
+        "ALTER TABLE org_units ALTER COLUMN path TYPE ltree USING path::ltree"
+    )
+    # Level selalu sama dengan kedalaman path
+    op.execute("UPDATE org_units SET level = nlevel(path) WHERE level <> nlevel(path)")
+
+    op.create_index(
+        "ix_org_units_path_gist", "org_units", ["path"], postgresql_using="gist"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_org_units_path_gist", table_name="org_units")
+
+    op.execute(
+        "ALTER TABLE org_units ALTER COLUMN path TYPE varchar(500) USING path::text"
+    )
+
+    op.create_index("ix_org_units_path", "org_units", ["path"])
+    op.create_index(
+        "ix_org_units_path_pattern", "org_units", ["path"], postgresql_using="btree"
+    )
@@ -1,29 +1,152 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, declarative_base
+from typing import AsyncGenerator, Dict
 from contextlib import asynccontextmanager
+from fastapi import Request
 from app.config.settings import settings
+from app.config.db_pool import Workload, create_workload_engine
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    pool_size=10,
-    max_overflow=20,
-)
+# One primary pool per workload so e.g. scheduler jobs cannot starve the API
+engines: Dict[str, AsyncEngine] = {
+    workload: create_workload_engine(settings.database_url, workload)
+    for workload in Workload.ALL
+}
 
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+# Optional read replica (POSTGRES_REPLICA_SERVER), only for workloads that
+# serve reads (HTTP API and gRPC). Missing entry = reads on primary.
+read_engines: Dict[str, AsyncEngine] = (
+    {
+        workload: create_workload_engine(
+            settings.read_database_url, workload, role="replica"
+        )
+        for workload in (Workload.HTTP, Workload.GRPC)
+    }
+    if settings.read_database_url
+    else {}
 )
 
+# Backward-compatible alias: primary engine of the HTTP workload
+engine = engines[Workload.HTTP]
+
+# Session.info keys
+PRIMARY_PINNED = "primary_pinned"
+WORKLOAD = "workload"
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to the read replica.
+
+    Read-your-writes: the first flush or DML statement pins the session to
+    primary for the rest of its life, so anything read after a commit (e.g.
+    the fresh attendance returned by check-in) comes from primary.
+    SELECT ... FOR UPDATE and raw text() statements always go to primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        workload = self.info.get(WORKLOAD, Workload.HTTP)
+        primary = engines[workload].sync_engine
+        replica = read_engines.get(workload)
+        if replica is None:
+            return primary
+
+        if self.info.get(PRIMARY_PINNED) or self._flushing:
+            self.info[PRIMARY_PINNED] = True
+            return primary
+
+        if isinstance(clause, Select) and clause._for_update_arg is None:
+            return replica.sync_engine
+
+        if clause is not None and getattr(clause, "is_dml", False):
+            self.info[PRIMARY_PINNED] = True
+        return primary
+
+
+def use_primary(session: AsyncSession) -> AsyncSession:
+    """
+    Escape hatch: pin a routed session to primary (read-your-writes).
+
+    Use before reads that must see data committed moments ago, e.g. in a
+    GET handler that follows up on a write from another request.
+    """
+    session.info[PRIMARY_PINNED] = True
+    return session
+
+
+def _primary_sessionmaker(workload: str) -> async_sessionmaker:
+    return async_sessionmaker(
+        engines[workload],
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+def _routing_sessionmaker(workload: str) -> async_sessionmaker:
+    return async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        info={WORKLOAD: workload},
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+session_makers: Dict[str, async_sessionmaker] = {
+    workload: _primary_sessionmaker(workload) for workload in Workload.ALL
+}
+read_session_makers: Dict[str, async_sessionmaker] = {
+    workload: _routing_sessionmaker(workload)
+    for workload in (Workload.HTTP, Workload.GRPC)
+}
+
+# HTTP workload session factories
+AsyncSessionLocal = session_makers[Workload.HTTP]
+AsyncReadSessionLocal = read_session_makers[Workload.HTTP]
+
+# gRPC workload session factories
+GrpcSessionLocal = session_makers[Workload.GRPC]
+GrpcReadSessionLocal = read_session_makers[Workload.GRPC]
+
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped session.
+
+    Read-only HTTP methods get a replica-routed session (Queries, dashboard,
+    reports); write methods stay on primary so validation reads and the
+    response after commit always see the latest data.
+    """
+    session_factory = (
+        AsyncReadSessionLocal
+        if request.method in _SAFE_METHODS
+        else AsyncSessionLocal
+    )
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+@asynccontextmanager
+async def get_db_context(
+    workload: str = Workload.HTTP,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Context manager untuk get database session di luar FastAPI dependency.
+
+    Scheduled jobs pass Workload.SCHEDULER, event handlers Workload.CONSUMER
+    so they draw from their own pools.
+    """
+    async with session_makers[workload]() as session:
         try:
             yield session
         finally:
@@ -31,11 +154,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 @asynccontextmanager
-async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
+async def get_read_db_context(
+    workload: str = Workload.HTTP,
+) -> AsyncGenerator[AsyncSession, None]:
     """
-    Context manager untuk get database session di scheduled jobs.
+    Context manager untuk read-only session (replica jika dikonfigurasi),
+    dipakai gRPC read RPCs dan report.
     """
-    async with AsyncSessionLocal() as session:
+    async with read_session_makers[workload]() as session:
         try:
             yield session
         finally:
@@ -0,0 +1,165 @@
+"""
+Database connection pools per workload.
+
+HTTP API, gRPC server, event consumer and scheduler jobs each get their own
+engine (and pool) so a heavy nightly job cannot starve API requests. Every
+pool is instrumented with queue wait time and timeout counters.
+"""
+
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
+
+from app.config.settings import settings
+
+
+class Workload:
+    """Workload names; each one owns a separate connection pool."""
+
+    HTTP = "http"
+    GRPC = "grpc"
+    CONSUMER = "consumer"
+    SCHEDULER = "scheduler"
+
+    ALL = (HTTP, GRPC, CONSUMER, SCHEDULER)
+
+
+class PoolMetrics:
+    """Acquisition counters for one pool (process-local)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_acquisition(self, *_: Any) -> None:
+        self.acquisitions += 1
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+
+class InstrumentedQueue(AsyncAdaptedQueue):
+    """
+    Pool queue that times how long checkout waits for an idle connection.
+
+    Only the queue wait is measured (connect time of new/overflow
+    connections is not); a blocking get that gives up is a pool timeout and
+    is counted separately instead of as wait.
+    """
+
+    metrics: PoolMetrics
+
+    def get(self, block: bool = True, timeout: Any = None):
+        start = time.perf_counter()
+        try:
+            item = super().get(block, timeout)
+        except Empty:
+            if block:
+                self.metrics.timeouts += 1
+            else:
+                self.metrics.record_wait(time.perf_counter() - start)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return item
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool whose queue records wait/timeout metrics."""
+
+    metrics: PoolMetrics
+
+
+_engines: Dict[str, AsyncEngine] = {}
+
+
+def _pool_settings(workload: str) -> Dict[str, int]:
+    prefix = f"DB_{workload.upper()}"
+    return {
+        "pool_size": getattr(settings, f"{prefix}_POOL_SIZE"),
+        "max_overflow": getattr(settings, f"{prefix}_MAX_OVERFLOW"),
+        "statement_timeout_ms": getattr(settings, f"{prefix}_STATEMENT_TIMEOUT_MS"),
+    }
+
+
+def create_workload_engine(url: str, workload: str, role: str = "primary") -> AsyncEngine:
+    """
+    Create an engine with its own instrumented pool for a workload.
+
+    Args:
+        url: Database URL (primary or replica)
+        workload: One of Workload.ALL
+        role: "primary" or "replica" (metrics/application_name label)
+    """
+    name = f"{workload}:{role}"
+    config = _pool_settings(workload)
+
+    # Subclass per engine so metrics survive pool.recreate() (dispose)
+    metrics = PoolMetrics(name)
+    queue_class = type(
+        "InstrumentedQueue", (InstrumentedQueue,), {"metrics": metrics}
+    )
+    pool_class = type(
+        "InstrumentedQueuePool",
+        (InstrumentedQueuePool,),
+        {"metrics": metrics, "_queue_class": queue_class},
+    )
+    # Successful checkouts (idle or newly created connection)
+    event.listen(pool_class, "checkout", metrics.record_acquisition)
+
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=pool_class,
+        pool_size=config["pool_size"],
+        max_overflow=config["max_overflow"],
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=True,
+        connect_args={
+            "timeout": settings.DB_CONNECT_TIMEOUT_SECONDS,
+            "server_settings": {
+                "application_name": f"hris-{workload}",
+                "statement_timeout": str(config["statement_timeout_ms"]),
+            },
+        },
+    )
+    _engines[name] = engine
+    return engine
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every workload pool, for the /metrics endpoint."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        metrics: PoolMetrics = pool.metrics
+        stats[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "acquisitions": metrics.acquisitions,
+            "timeouts": metrics.timeouts,
+            "wait_seconds_total": round(metrics.wait_seconds_total, 6),
+            "wait_seconds_max": round(metrics.wait_seconds_max, 6),
+            "wait_seconds_avg": (
+                round(metrics.wait_seconds_total / metrics.acquisitions, 6)
+                if metrics.acquisitions
+                else 0.0
+            ),
+        }
+    return stats
+
+
+async def dispose_all() -> None:
+    """Close every workload pool (application shutdown)."""
+    for engine in _engines.values():
+        await engine.dispose()
@@ -16,6 +16,34 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = Field(...)
     POSTGRES_PORT: str = Field(...)
 
+    # Optional read replica (same credentials/database as primary)
+    POSTGRES_REPLICA_SERVER: Optional[str] = Field(
+        default=None, description="Read replica host; unset = all reads on primary"
+    )
+    POSTGRES_REPLICA_PORT: Optional[str] = Field(
+        default=None, description="Read replica port (default: POSTGRES_PORT)"
+    )
+
+    # Connection pools per workload (see app/config/db_pool.py)
+    DB_POOL_TIMEOUT_SECONDS: int = Field(
+        default=10, description="Max seconds to wait for a pooled connection"
+    )
+    DB_CONNECT_TIMEOUT_SECONDS: int = Field(
+        default=10, description="Max seconds to open a new Postgres connection"
+    )
+    DB_HTTP_POOL_SIZE: int = Field(default=10)
+    DB_HTTP_MAX_OVERFLOW: int = Field(default=20)
+    DB_HTTP_STATEMENT_TIMEOUT_MS: int = Field(default=30000)
+    DB_GRPC_POOL_SIZE: int = Field(default=5)
+    DB_GRPC_MAX_OVERFLOW: int = Field(default=10)
+    DB_GRPC_STATEMENT_TIMEOUT_MS: int = Field(default=30000)
+    DB_CONSUMER_POOL_SIZE: int = Field(default=2)
+    DB_CONSUMER_MAX_OVERFLOW: int = Field(default=3)
+    DB_CONSUMER_STATEMENT_TIMEOUT_MS: int = Field(default=60000)
+    DB_SCHEDULER_POOL_SIZE: int = Field(default=2)
+    DB_SCHEDULER_MAX_OVERFLOW: int = Field(default=2)
+    DB_SCHEDULER_STATEMENT_TIMEOUT_MS: int = Field(default=600000)
+
     REDIS_HOST: str = Field(...)
     REDIS_PORT: int = Field(...)
     REDIS_PASSWORD: str = ""
@@ -43,6 +71,37 @@ class Settings(BaseSettings):
         default=3600,
         description="TTL for JWKS cache in seconds (default: 1 hour)"
     )
+    VERIFIED_TOKEN_CACHE_MAXSIZE: int = Field(
+        default=10000,
+        description="Max verified access tokens kept to skip repeat RS256 verification",
+    )
+
+    # CurrentUser cache (in-process LRU in front of Redis)
+    CURRENT_USER_CACHE_TTL_SECONDS: int = Field(
+        default=300, description="TTL for resolved CurrentUser in Redis"
+    )
+    CURRENT_USER_CACHE_LOCAL_TTL_SECONDS: int = Field(
+        default=30, description="TTL for resolved CurrentUser in the in-process LRU"
+    )
+    CURRENT_USER_CACHE_LOCAL_MAXSIZE: int = Field(
+        default=10000, description="Max entries in the in-process CurrentUser LRU"
+    )
+
+    # Dashboard widget cache (Redis)
+    DASHBOARD_CACHE_TTL_SECONDS: int = Field(
+        default=120,
+        description="TTL for cached personal/team dashboard widgets",
+    )
+    DASHBOARD_SHARED_REFRESH_SECONDS: int = Field(
+        default=60,
+        description="Company-wide (HR admin) widget is recomputed at most this often; older entries are served stale while one worker refreshes",
+    )
+
+    # Paginated list totals
+    PAGINATION_ESTIMATE_MIN_ROWS: int = Field(
+        default=100000,
+        description="Unfiltered lists on tables at least this large report pg_class.reltuples as total instead of an exact count",
+    )
 
     # SSO Service for user sync
     SSO_SERVICE_URL: str = Field(default="http://localhost:8001")
@@ -99,6 +158,14 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def read_database_url(self) -> Optional[str]:
+        """Database URL for the read replica, or None if not configured"""
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_SERVER}:{port}/{self.POSTGRES_DB}"
+
     @property
     def sync_database_url(self) -> str:
         """Database URL for synchronous operations (scripts, migrations)"""
@@ -0,0 +1,15 @@
+from app.core.cache.invalidation_bus import InvalidationBus, invalidation_bus
+from app.core.cache.current_user_cache import CurrentUserCache, current_user_cache
+from app.core.cache.dashboard_cache import DashboardCache, dashboard_cache
+from app.core.cache.subordinate_cache import SubordinateCache, subordinate_cache
+
+__all__ = [
+    "InvalidationBus",
+    "invalidation_bus",
+    "CurrentUserCache",
+    "current_user_cache",
+    "DashboardCache",
+    "dashboard_cache",
+    "SubordinateCache",
+    "subordinate_cache",
+]
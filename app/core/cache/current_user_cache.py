@@ -0,0 +1,222 @@
+"""
+CurrentUser Cache.
+
+Two-tier cache for the resolved CurrentUser used by get_current_user:
+- L1: in-process TTL LRU (per worker, short TTL)
+- L2: Redis (shared across workers, longer TTL)
+
+Invalidations are broadcast over the invalidation bus so every worker
+drops its L1 entry, not only the one that handled the write.
+
+Every invalidation also bumps a generation (per user, and a global one for
+invalidate_all). Callers take the generation before reading the DB and
+pass it to set(); an entry read before a concurrent invalidation is not
+cached, so revoked roles/permissions cannot outlive it.
+
+Only the HRIS-derived part (roles, permissions, employee_id, org_unit_id,
+is_active) is meaningful here; SSO profile fields are overlaid from the
+token on every request by the caller.
+"""
+
+import uuid
+from typing import Iterable, Optional, Union
+
+import redis.asyncio as aioredis
+from cachetools import TTLCache
+
+from app.config.settings import settings
+from app.config.redis import redis_client
+from app.core.cache.invalidation_bus import InvalidationBus, invalidation_bus
+from app.core.schemas.current_user import CurrentUser
+from app.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+UserId = Union[str, uuid.UUID]
+
+# Store the entry only if neither generation moved since the DB read began
+_SET_IF_CURRENT_SCRIPT = """
+local current = (redis.call("get", KEYS[2]) or "0") .. ":" .. (redis.call("get", KEYS[3]) or "0")
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call("set", KEYS[1], ARGV[2], "EX", ARGV[3])
+return 1
+"""
+
+
+class CurrentUserCache:
+    """In-process LRU in front of Redis, keyed by user UUID."""
+
+    BUS_TOPIC = "current_user"
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        bus: Optional[InvalidationBus] = None,
+        ttl_seconds: int = 300,
+        local_ttl_seconds: int = 30,
+        local_maxsize: int = 10000,
+        key_prefix: str = "hris:current_user",
+    ):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._local: TTLCache = TTLCache(maxsize=local_maxsize, ttl=local_ttl_seconds)
+        self.bus = bus
+        if bus is not None:
+            bus.subscribe(self.BUS_TOPIC, self._on_invalidate)
+
+    def _key(self, user_id: UserId) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def _version_key(self, user_id: UserId) -> str:
+        return f"{self.key_prefix}:version:{user_id}"
+
+    @property
+    def _global_version_key(self) -> str:
+        return f"{self.key_prefix}:version"
+
+    @property
+    def _version_ttl(self) -> int:
+        # Outlives any DB read; an expired version only skips one write
+        return self.ttl_seconds * 10
+
+    async def generation(self, user_id: UserId) -> Optional[str]:
+        """
+        Current generation of user_id, to be taken before the DB read and
+        passed to set(). None if Redis is unavailable (nothing is cached).
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._version_key(str(user_id)))
+                pipe.get(self._global_version_key)
+                user_version, global_version = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"CurrentUser cache generation read failed for {user_id}: {e}")
+            return None
+        return f"{user_version or 0}:{global_version or 0}"
+
+    async def get(self, user_id: UserId) -> Optional[CurrentUser]:
+        """Get cached CurrentUser, checking local LRU first then Redis."""
+        key = str(user_id)
+        cached = self._local.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            raw = await self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"CurrentUser cache read failed for {key}: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        try:
+            user = CurrentUser.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"Invalid CurrentUser cache entry for {key}: {e}")
+            return None
+
+        self._local[key] = user
+        return user
+
+    async def set(self, user: CurrentUser, generation: Optional[str]) -> None:
+        """
+        Store CurrentUser in both tiers if generation (from generation(),
+        taken before the DB read) is still current.
+        """
+        if generation is None:
+            return
+        key = str(user.id)
+        try:
+            written = await self.redis.eval(
+                _SET_IF_CURRENT_SCRIPT,
+                3,
+                self._key(key),
+                self._version_key(key),
+                self._global_version_key,
+                generation,
+                user.model_dump_json(),
+                self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"CurrentUser cache write failed for {key}: {e}")
+            return
+
+        if written:
+            # No await since the check: a later invalidation's bus message
+            # still drops this L1 entry
+            self._local[key] = user
+        else:
+            logger.info(f"CurrentUser {key} invalidated during load, not cached")
+
+    async def invalidate(self, user_id: Optional[UserId]) -> None:
+        """Drop a single user from both tiers."""
+        if not user_id:
+            return
+        await self.invalidate_many([user_id])
+
+    async def invalidate_many(self, user_ids: Iterable[Optional[UserId]]) -> None:
+        """Drop multiple users from both tiers."""
+        keys = {str(user_id) for user_id in user_ids if user_id}
+        if not keys:
+            return
+
+        for key in keys:
+            self._local.pop(key, None)
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*[self._key(key) for key in keys])
+                for key in sorted(keys):
+                    version_key = self._version_key(key)
+                    pipe.incr(version_key)
+                    pipe.expire(version_key, self._version_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"CurrentUser cache invalidation failed: {e}")
+
+        if self.bus is not None:
+            await self.bus.publish(self.BUS_TOPIC, sorted(keys))
+
+    async def invalidate_all(self) -> None:
+        """Drop every cached user (e.g. after role-permission changes)."""
+        self._local.clear()
+        try:
+            # Bump first: in-flight loads stop writing before the flush
+            await self.redis.incr(self._global_version_key)
+            keys = [
+                key
+                async for key in self.redis.scan_iter(f"{self.key_prefix}:*")
+                if not key.startswith(f"{self.key_prefix}:version")
+            ]
+            if keys:
+                await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"CurrentUser cache flush failed: {e}")
+
+        if self.bus is not None:
+            await self.bus.publish(self.BUS_TOPIC, "*")
+
+    def _on_invalidate(self, payload) -> None:
+        """Bus handler: drop L1 entries invalidated by any worker."""
+        if payload == "*":
+            self._local.clear()
+            return
+        for key in payload or []:
+            self._local.pop(str(key), None)
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier (useful for testing)."""
+        self._local.clear()
+
+
+current_user_cache = CurrentUserCache(
+    redis=redis_client,
+    bus=invalidation_bus,
+    ttl_seconds=settings.CURRENT_USER_CACHE_TTL_SECONDS,
+    local_ttl_seconds=settings.CURRENT_USER_CACHE_LOCAL_TTL_SECONDS,
+    local_maxsize=settings.CURRENT_USER_CACHE_LOCAL_MAXSIZE,
+)
@@ -0,0 +1,336 @@
+"""
+Dashboard Widget Cache.
+
+Redis cache for serialized dashboard widgets, one hash per scope with one
+field per target date:
+- employee:{employee_id}  personal widget; dropped on check-in/check-out
+                          and leave-request changes
+- team:{org_unit_id}      team widget; dropped on leave-request changes
+- hr_admin                company-wide widget shared by every HR admin,
+                          refreshed at most every `shared_refresh_seconds`
+                          with stale-while-revalidate; a cold miss is
+                          loaded by one worker while the others wait
+
+Dropping a scope is a single DEL regardless of how many dates are cached.
+Redis failures degrade to computing the widget directly.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import redis.asyncio as aioredis
+
+from app.config.settings import settings
+from app.config.redis import redis_client
+from app.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+Loader = Callable[[], Awaitable[str]]
+
+HR_ADMIN_SCOPE = "hr_admin"
+
+# Delete the lock only if it is still ours (it may have expired and been
+# taken by another worker in the meantime)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Store the field only if the scope was not invalidated since the load began
+_WRITE_IF_CURRENT_SCRIPT = """
+if (redis.call("get", KEYS[2]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("hset", KEYS[1], ARGV[2], ARGV[3])
+redis.call("expire", KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def employee_scope(employee_id: int) -> str:
+    return f"employee:{employee_id}"
+
+
+def team_scope(org_unit_id: int) -> str:
+    return f"team:{org_unit_id}"
+
+
+class DashboardCache:
+    """Per-scope widget cache with hit/miss counters per widget kind."""
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        ttl_seconds: int = 120,
+        shared_refresh_seconds: int = 60,
+        load_wait_seconds: float = 5.0,
+        key_prefix: str = "hris:dashboard",
+    ):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.shared_refresh_seconds = shared_refresh_seconds
+        self.load_wait_seconds = load_wait_seconds
+        self.key_prefix = key_prefix
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.stale: Counter = Counter()
+        self._refreshing: Set[asyncio.Task] = set()
+
+    def _key(self, scope: str) -> str:
+        return f"{self.key_prefix}:{scope}"
+
+    def _version_key(self, scope: str) -> str:
+        return f"{self.key_prefix}:{scope}:version"
+
+    @staticmethod
+    def _kind(scope: str) -> str:
+        return scope.split(":", 1)[0]
+
+    async def _read(self, scope: str, field: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await self.redis.hget(self._key(scope), field)
+        except Exception as e:
+            logger.warning(f"Dashboard cache read failed for {scope}: {e}")
+            return None
+        return self._decode(raw)
+
+    async def _read_versioned(
+        self, scope: str, field: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Entry plus the scope version; version None = Redis unavailable."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hget(self._key(scope), field)
+                pipe.get(self._version_key(scope))
+                raw, version = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Dashboard cache read failed for {scope}: {e}")
+            return None, None
+        return self._decode(raw), version or "0"
+
+    @staticmethod
+    def _decode(raw: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    async def _write(self, scope: str, field: str, payload: str, ttl: int) -> None:
+        entry = json.dumps({"at": time.time(), "payload": payload})
+        key = self._key(scope)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, field, entry)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Dashboard cache write failed for {scope}: {e}")
+
+    async def _write_if_current(
+        self, scope: str, field: str, payload: str, ttl: int, version: str
+    ) -> None:
+        entry = json.dumps({"at": time.time(), "payload": payload})
+        try:
+            written = await self.redis.eval(
+                _WRITE_IF_CURRENT_SCRIPT,
+                2,
+                self._key(scope),
+                self._version_key(scope),
+                version,
+                field,
+                entry,
+                ttl,
+            )
+            if not written:
+                logger.info(f"Dashboard cache {scope} invalidated during load, not cached")
+        except Exception as e:
+            logger.warning(f"Dashboard cache write failed for {scope}: {e}")
+
+    async def get_or_load(self, scope: str, field: str, loader: Loader) -> str:
+        """
+        Cached payload younger than ttl_seconds, else load and store it.
+
+        The scope version is read before loading; a load that overlaps an
+        invalidate() is returned but not cached. Loaders of invalidated
+        scopes must read from primary.
+        """
+        kind = self._kind(scope)
+        entry, version = await self._read_versioned(scope, field)
+        if entry and time.time() - entry["at"] < self.ttl_seconds:
+            self.hits[kind] += 1
+            return entry["payload"]
+
+        self.misses[kind] += 1
+        payload = await loader()
+        if version is not None:
+            await self._write_if_current(
+                scope, field, payload, self.ttl_seconds, version
+            )
+        return payload
+
+    async def get_or_load_shared(self, scope: str, field: str, loader: Loader) -> str:
+        """
+        Stale-while-revalidate: an entry older than shared_refresh_seconds is
+        still returned, and a single worker (Redis SET NX lock) refreshes it
+        in the background. A missing entry is loaded by the lock holder only;
+        other requests wait briefly for its write.
+        """
+        kind = self._kind(scope)
+        entry = await self._read(scope, field)
+        if entry is None:
+            self.misses[kind] += 1
+            return await self._load_shared(scope, field, loader)
+
+        if time.time() - entry["at"] < self.shared_refresh_seconds:
+            self.hits[kind] += 1
+        else:
+            self.stale[kind] += 1
+            await self._schedule_refresh(scope, field, loader)
+        return entry["payload"]
+
+    @property
+    def _shared_ttl(self) -> int:
+        # Keep stale entries around long enough to be served while refreshing
+        return self.shared_refresh_seconds * 10
+
+    def _lock_key(self, scope: str, field: str) -> str:
+        return f"{self._key(scope)}:refresh:{field}"
+
+    async def _acquire_lock(self, lock_key: str) -> Optional[str]:
+        """Owner token if the lock was taken, None if held by another worker."""
+        token = uuid.uuid4().hex
+        acquired = await self.redis.set(
+            lock_key, token, nx=True, ex=self.shared_refresh_seconds
+        )
+        return token if acquired else None
+
+    async def _release_lock(self, scope: str, lock_key: str, token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"Dashboard cache lock release failed for {scope}: {e}")
+
+    async def _load_shared(self, scope: str, field: str, loader: Loader) -> str:
+        """Cold path: single-flight load behind the refresh lock."""
+        lock_key = self._lock_key(scope, field)
+        try:
+            token = await self._acquire_lock(lock_key)
+        except Exception as e:
+            logger.warning(f"Dashboard cache load lock failed for {scope}: {e}")
+            return await loader()
+
+        if token is None:
+            entry = await self._wait_for_entry(scope, field, lock_key)
+            if entry is not None:
+                return entry["payload"]
+            # Pemegang lock gagal / terlalu lama: hitung sendiri
+            payload = await loader()
+            await self._write(scope, field, payload, self._shared_ttl)
+            return payload
+
+        try:
+            payload = await loader()
+            await self._write(scope, field, payload, self._shared_ttl)
+            return payload
+        finally:
+            await self._release_lock(scope, lock_key, token)
+
+    async def _wait_for_entry(
+        self, scope: str, field: str, lock_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait up to load_wait_seconds for the lock holder's write. Polls the
+        lock (exponential backoff); the entry is read once it is released.
+        """
+        deadline = time.monotonic() + self.load_wait_seconds
+        interval = 0.02
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.redis.exists(lock_key):
+                    break
+            except Exception as e:
+                logger.warning(f"Dashboard cache lock check failed for {scope}: {e}")
+                break
+            interval = min(interval * 2, 0.5)
+        return await self._read(scope, field)
+
+    async def _schedule_refresh(self, scope: str, field: str, loader: Loader) -> None:
+        lock_key = self._lock_key(scope, field)
+        try:
+            token = await self._acquire_lock(lock_key)
+        except Exception as e:
+            logger.warning(f"Dashboard cache refresh lock failed for {scope}: {e}")
+            return
+        if token is None:
+            return  # Another worker is already refreshing
+
+        async def refresh() -> None:
+            try:
+                payload = await loader()
+                await self._write(scope, field, payload, self._shared_ttl)
+            except Exception as e:
+                logger.warning(f"Dashboard cache refresh failed for {scope}: {e}")
+            finally:
+                await self._release_lock(scope, lock_key, token)
+
+        task = asyncio.create_task(refresh())
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def invalidate(self, *scopes: str) -> None:
+        """Drop every cached date for the given scopes and bump their versions."""
+        if not scopes:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*[self._key(scope) for scope in scopes])
+                for scope in scopes:
+                    version_key = self._version_key(scope)
+                    pipe.incr(version_key)
+                    # Outlives any load; an expired version only skips one write
+                    pipe.expire(version_key, self.ttl_seconds * 10)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Dashboard cache invalidation failed: {e}")
+
+    async def invalidate_employee(
+        self, employee_id: Optional[int], org_unit_id: Optional[int] = None
+    ) -> None:
+        """Drop the employee's personal widget and, if given, their team widget."""
+        scopes = []
+        if employee_id:
+            scopes.append(employee_scope(employee_id))
+        if org_unit_id:
+            scopes.append(team_scope(org_unit_id))
+        await self.invalidate(*scopes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/stale counters per widget kind (process-local)."""
+        result = {}
+        for kind in sorted(set(self.hits) | set(self.misses) | set(self.stale)):
+            hits = self.hits[kind] + self.stale[kind]
+            total = hits + self.misses[kind]
+            result[kind] = {
+                "hits": self.hits[kind],
+                "stale_hits": self.stale[kind],
+                "misses": self.misses[kind],
+                "hit_ratio": (hits / total) if total else 0.0,
+            }
+        return result
+
+
+dashboard_cache = DashboardCache(
+    redis=redis_client,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+    shared_refresh_seconds=settings.DASHBOARD_SHARED_REFRESH_SECONDS,
+)
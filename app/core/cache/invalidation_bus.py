@@ -0,0 +1,88 @@
+"""
+Cross-worker Cache Invalidation Bus.
+
+In-process caches (CurrentUser L1, permission registry) live per worker, so
+an invalidation in one worker must reach the others. Messages are published
+on one Redis pub/sub channel as {"topic": ..., "payload": ...}; every worker
+runs a listener (started in lifespan) that dispatches them to the handlers
+subscribed for that topic, including the publishing worker itself.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import redis.asyncio as aioredis
+
+from app.config.redis import redis_client
+from app.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+Handler = Callable[[Any], Union[None, Awaitable[None]]]
+
+
+class InvalidationBus:
+    def __init__(self, redis: aioredis.Redis, channel: str = "hris:invalidate"):
+        self.redis = redis
+        self.channel = channel
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    async def publish(self, topic: str, payload: Any = None) -> None:
+        """Broadcast to every worker. Failures are logged, never raised."""
+        try:
+            await self.redis.publish(
+                self.channel, json.dumps({"topic": topic, "payload": payload})
+            )
+        except Exception as e:
+            logger.warning(f"Invalidation publish failed for {topic}: {e}")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            await self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Invalidation listener error, reconnecting: {e}")
+                await asyncio.sleep(1)
+
+    async def _dispatch(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.warning(f"Invalid invalidation message: {raw!r}")
+            return
+
+        for handler in self._handlers.get(message.get("topic"), []):
+            try:
+                result = handler(message.get("payload"))
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Invalidation handler failed for {message}: {e}")
+
+
+invalidation_bus = InvalidationBus(redis=redis_client)
@@ -0,0 +1,121 @@
+"""
+Subordinate Set Cache.
+
+Redis set of all transitive subordinate ids per supervisor
+(hris:subordinates:{supervisor_id}), so "my team" scope resolution and
+membership checks do not re-run the recursive reporting-tree CTE.
+
+Sets are loaded lazily on first use. EmployeeCommands drops the sets of
+every supervisor up the chain whenever a reporting line changes
+(supervisor_id update, create, delete, restore) and bumps their version
+keys; a load that started before the bump does not write its (possibly
+stale) result back. The TTL is only a safety net.
+"""
+
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+import redis.asyncio as aioredis
+
+from app.config.redis import redis_client
+from app.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Marks a computed set so employees without subordinates are cached too
+# (Redis drops empty sets); employee ids start at 1.
+_SENTINEL = "0"
+
+# Replace the set only if the version is unchanged since the load started
+_WRITE_IF_CURRENT_SCRIPT = """
+if (redis.call("get", KEYS[2]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("del", KEYS[1])
+redis.call("sadd", KEYS[1], unpack(ARGV, 3))
+redis.call("expire", KEYS[1], ARGV[2])
+return 1
+"""
+
+
+class SubordinateCache:
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        ttl_seconds: int = 3600,
+        key_prefix: str = "hris:subordinates",
+    ):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _key(self, supervisor_id: int) -> str:
+        return f"{self.key_prefix}:{supervisor_id}"
+
+    def _version_key(self, supervisor_id: int) -> str:
+        return f"{self.key_prefix}:{supervisor_id}:version"
+
+    async def get_or_load(
+        self,
+        supervisor_id: int,
+        loader: Callable[[int], Awaitable[List[int]]],
+    ) -> List[int]:
+        """
+        All transitive subordinate ids of supervisor_id.
+
+        The loader must read from primary: a replica may still miss the
+        reporting-line change that caused the invalidation.
+        """
+        key = self._key(supervisor_id)
+        version_key = self._version_key(supervisor_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.smembers(key)
+                pipe.get(version_key)
+                members, version = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Subordinate cache read failed for {supervisor_id}: {e}")
+            return await loader(supervisor_id)
+
+        if members:
+            return sorted(int(m) for m in members if m != _SENTINEL)
+
+        ids = await loader(supervisor_id)
+        try:
+            written = await self.redis.eval(
+                _WRITE_IF_CURRENT_SCRIPT,
+                2,
+                key,
+                version_key,
+                version or "0",
+                self.ttl_seconds,
+                _SENTINEL,
+                *ids,
+            )
+            if not written:
+                logger.info(
+                    f"Subordinate cache invalidated during load of {supervisor_id}, "
+                    f"result not cached"
+                )
+        except Exception as e:
+            logger.warning(f"Subordinate cache write failed for {supervisor_id}: {e}")
+        return ids
+
+    async def invalidate_many(self, supervisor_ids: Iterable[Optional[int]]) -> None:
+        """Drop the sets and bump their versions (in-flight loads won't write)."""
+        ids = sorted({i for i in supervisor_ids if i})
+        if not ids:
+            return
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*[self._key(i) for i in ids])
+                for i in ids:
+                    version_key = self._version_key(i)
+                    pipe.incr(version_key)
+                    # Outlives any load; an expired version only skips one write
+                    pipe.expire(version_key, self.ttl_seconds * 24)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Subordinate cache invalidation failed: {e}")
+
+
+subordinate_cache = SubordinateCache(redis=redis_client)
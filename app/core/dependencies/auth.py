@@ -9,13 +9,14 @@ from fastapi import Depends, HTTPException, status
 from typing import Optional
 
 from app.core.schemas import CurrentUser
+from app.core.cache import current_user_cache
 from app.core.exceptions import UnauthorizedException
 from app.core.utils.logging import get_logger
 from app.core.security.jwt import jwt_bearer, verify_token_locally
 from app.modules.users.users.use_cases.create_user_from_sso import (
-    CreateUserFromSSOUseCase,
     CreateUserFromSSODTO,
 )
+from app.modules.users.users.utils.jit_provisioning import jit_provisioner
 
 logger = get_logger(__name__)
 
@@ -27,16 +28,15 @@ async def get_current_user(
     Get current user with local JWT validation (hybrid approach).
 
     1. Validate token locally with public key (no network call)
-    2. Find/create HRIS user by id (SSO UUID)
-    3. Get HRIS-specific roles/permissions
+    2. Return cached CurrentUser if available (no DB round trip)
+    3. Resolve user, roles, permissions and employee in one query
+       (JIT-provision the user first if not found) and cache the result
     """
-    from app.modules.users.users.repositories import UserQueries, UserCommands
-    from app.modules.users.rbac.repositories import RoleQueries, RoleCommands
-    from app.modules.employees.repositories import EmployeeQueries
+    from app.modules.users.users.repositories import UserQueries
     from app.config.database import get_db_context
 
     try:
-        payload = verify_token_locally(token)
+        payload = await verify_token_locally(token)
 
         import uuid
         
@@ -53,47 +53,52 @@ async def get_current_user(
         sso_role = payload.get("role", "user")
         sso_email = payload.get("email")
 
+        cached_user = await current_user_cache.get(user_id)
+        if cached_user:
+            if not cached_user.is_active:
+                raise UnauthorizedException("Akun pengguna tidak aktif di HRIS")
+            return cached_user.with_profile(
+                name=sso_name or "", email=sso_email, sso_role=sso_role
+            )
+
+        # Taken before the DB read: an invalidation in between skips the write
+        generation = await current_user_cache.generation(user_id)
+
         async with get_db_context() as db:
             user_queries = UserQueries(db)
-            user_commands = UserCommands(db)
-            role_queries = RoleQueries(db)
-            role_commands = RoleCommands(db)
-            employee_queries = EmployeeQueries(db)
 
-            user = await user_queries.get_by_id(user_id)
+            identity = await user_queries.get_auth_identity(user_id)
 
-            if not user:
-                use_case = CreateUserFromSSOUseCase(
-                    user_commands, role_queries, role_commands
+            if not identity:
+                await jit_provisioner.provision(
+                    CreateUserFromSSODTO(
+                        id=user_id,
+                        name=sso_name or "",
+                        email=sso_email,
+                        role=sso_role,
+                    )
                 )
-                dto = CreateUserFromSSODTO(
-                    id=user_id,
-                    name=sso_name or "",
-                    email=sso_email,
-                    role=sso_role,
-                )
-                user = await use_case.execute(dto)
-                await db.commit()
-
-            if not user.is_active:
-                raise UnauthorizedException("Akun pengguna tidak aktif di HRIS")
 
-            user_roles = await role_queries.get_user_roles(user.id)
-            user_permissions = await role_queries.get_user_permissions(user.id)
+                identity = await user_queries.get_auth_identity(user_id)
+                if not identity:
+                    raise UnauthorizedException("Gagal membuat pengguna HRIS")
 
-            employee = await employee_queries.get_by_user_id(user.id)
+            if not identity["is_active"]:
+                raise UnauthorizedException("Akun pengguna tidak aktif di HRIS")
 
-            return CurrentUser(
-                id=user.id,
-                employee_id=employee.id if employee else None,
-                org_unit_id=employee.org_unit_id if employee else None,
+            current_user = CurrentUser(
+                id=user_id,
+                employee_id=identity["employee_id"],
+                org_unit_id=identity["org_unit_id"],
                 name=sso_name or "",
                 email=sso_email,
                 sso_role=sso_role,
-                roles=user_roles or [],
-                permissions=user_permissions or [],
-                is_active=user.is_active,
+                roles=identity["roles"],
+                permissions=identity["permissions"],
+                is_active=identity["is_active"],
             )
+            await current_user_cache.set(current_user, generation)
+            return current_user
 
     except UnauthorizedException as e:
         raise HTTPException(
@@ -0,0 +1,32 @@
+"""
+Request-scoped entity loaders.
+
+FastAPI resolves a dependency once per request, so every service that
+depends on LoadersDep in the same request shares one EntityLoaders and its
+memo.
+"""
+
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies.database import PostgresDB
+from app.core.utils.dataloader import DataLoader
+from app.modules.employees.models.employee import Employee
+from app.modules.employees.repositories import EmployeeQueries
+
+
+class EntityLoaders:
+    """Batched by-id loaders for Employee on one session."""
+
+    def __init__(self, db: AsyncSession):
+        self.employees: DataLoader[int, Employee] = DataLoader(
+            EmployeeQueries(db).batch_get
+        )
+
+
+def get_loaders(db: PostgresDB) -> EntityLoaders:
+    return EntityLoaders(db)
+
+
+LoadersDep = Annotated[EntityLoaders, Depends(get_loaders)]
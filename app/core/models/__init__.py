@@ -1,3 +1,4 @@
 from .base_model import TimestampMixin
+from .types import Ltree
 
-__all__ = ["TimestampMixin"]
+__all__ = ["TimestampMixin", "Ltree"]
@@ -0,0 +1,41 @@
+"""
+Custom column types.
+"""
+
+from typing import Any
+
+from sqlalchemy import cast, Text
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.types import UserDefinedType
+
+
+class Ltree(UserDefinedType):
+    """
+    PostgreSQL ltree (requires the ltree extension).
+
+    Values are exposed as dotted strings ("1.4.12"). asyncpg has no ltree
+    codec, so binds are cast to ltree and results are read back as text.
+
+    Usage:
+        OrgUnit.path.descendant_of(root.path)   # path <@ root.path
+        OrgUnit.path.ancestor_of(unit.path)     # path @> unit.path
+    Both operators include the node itself and are served by a GiST index.
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "LTREE"
+
+    def bind_expression(self, bindvalue: Any) -> ColumnElement:
+        return cast(bindvalue, self)
+
+    def column_expression(self, col: Any) -> ColumnElement:
+        return cast(col, Text)
+
+    class comparator_factory(UserDefinedType.Comparator):
+        def descendant_of(self, other: Any) -> ColumnElement:
+            return self.op("<@", is_comparison=True)(other)
+
+        def ancestor_of(self, other: Any) -> ColumnElement:
+            return self.op("@>", is_comparison=True)(other)
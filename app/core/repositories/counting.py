@@ -0,0 +1,91 @@
+"""
+Total-count helpers for paginated list queries.
+
+The classic `SELECT count(*) FROM (<filtered query>)` re-scans the whole
+filtered set on every page. These helpers let list repositories:
+- skip the total entirely (infinite scroll clients never show it)
+- get it in the same statement as the page via `COUNT(*) OVER()`
+- use the planner estimate from `pg_class.reltuples` for unfiltered lists
+  on large tables, where an exact count is the expensive part
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.settings import settings
+
+_TOTAL_LABEL = "_total_count"
+
+
+async def estimated_row_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    Planner row estimate for a table.
+
+    Returns None if the table has never been analyzed or the estimate is below
+    PAGINATION_ESTIMATE_MIN_ROWS (small tables are cheap to count exactly).
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table_name},
+    )
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < settings.PAGINATION_ESTIMATE_MIN_ROWS:
+        return None
+    return int(estimate)
+
+
+async def exact_count(db: AsyncSession, query) -> int:
+    """Exact row count of a filtered (unpaginated) select."""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar_one()
+
+
+async def fetch_page(
+    db: AsyncSession,
+    base_query,
+    page_query,
+    include_total: bool = True,
+    window_total: bool = True,
+    estimate_table: Optional[str] = None,
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Execute a page query and resolve the total according to the caller's needs.
+
+    Args:
+        db: Session to run on
+        base_query: Filtered query without ordering/offset/limit (for counting)
+        page_query: base_query with ordering and OFFSET/keyset + LIMIT applied
+        include_total: If False, no count is run and total is None
+        window_total: Whether COUNT(*) OVER() on page_query equals the total
+            (False in keyset mode, where the cursor predicate narrows the set)
+        estimate_table: Table name whose reltuples estimate may be used; only
+            pass it when base_query has no WHERE clause
+
+    Returns:
+        (items, total) - total is None when include_total is False
+    """
+    if not include_total:
+        result = await db.execute(page_query)
+        return list(result.scalars().all()), None
+
+    if estimate_table:
+        estimate = await estimated_row_count(db, estimate_table)
+        if estimate is not None:
+            result = await db.execute(page_query)
+            return list(result.scalars().all()), estimate
+
+    if window_total:
+        result = await db.execute(
+            page_query.add_columns(func.count().over().label(_TOTAL_LABEL))
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        # Page past the end: the window has no rows to report a total on
+        return [], await exact_count(db, base_query)
+
+    total = await exact_count(db, base_query)
+    result = await db.execute(page_query)
+    return list(result.scalars().all()), total
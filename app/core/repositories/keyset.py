@@ -0,0 +1,101 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination makes Postgres read and discard every skipped row, so deep
+pages get slower the further you go. Keyset pagination instead filters on the
+last sort key of the previous page (`WHERE (sort, id) < (:sort, :id)`), so
+page N costs the same as page 1 as long as the sort columns are indexed.
+
+Cursors are opaque to clients: a urlsafe base64 of the JSON-encoded sort key.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+from sqlalchemy import and_, or_, tuple_
+
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor string."""
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor back into sort key values typed after `columns`.
+
+    Raises:
+        BadRequestException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, list) or len(payload) != len(columns):
+            raise ValueError("cursor length mismatch")
+
+        values: List[Any] = []
+        for column, value in zip(columns, payload):
+            if value is None:
+                values.append(None)
+                continue
+            python_type = column.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif python_type is date:
+                values.append(date.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+        return values
+    except Exception:
+        raise BadRequestException("Cursor tidak valid")
+
+
+def keyset_condition(
+    columns: Sequence[Any],
+    values: Sequence[Any],
+    descending: bool = True,
+    nulls_last: bool = False,
+):
+    """
+    Build the WHERE clause selecting rows after `values` in sort order.
+
+    All columns share one direction; the last column must be unique (usually
+    the primary key). With `nulls_last`, the first column may be NULL and
+    NULLs sort after every non-NULL value (matches `.desc().nulls_last()`).
+    """
+
+    def after(cols: Sequence[Any], vals: Sequence[Any]):
+        if len(cols) == 1:
+            return cols[0] < vals[0] if descending else cols[0] > vals[0]
+        if descending:
+            return tuple_(*cols) < tuple_(*vals)
+        return tuple_(*cols) > tuple_(*vals)
+
+    if not nulls_last:
+        return after(columns, values)
+
+    first, rest = columns[0], columns[1:]
+    if values[0] is None:
+        # Already inside the NULL tail: only remaining NULL rows qualify
+        return and_(first.is_(None), after(rest, values[1:]))
+    return or_(after(columns, values), first.is_(None))
+
+
+def build_next_cursor(
+    items: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], Sequence[Any]],
+) -> Optional[str]:
+    """Cursor for the page after `items`, or None if this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(key(items[-1]))
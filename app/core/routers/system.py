@@ -2,9 +2,12 @@
 System and health check endpoints.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from app.config.settings import settings
+from app.core.schemas import CurrentUser
+from app.core.security.rbac import require_role
+from app.core.dependencies.auth import get_current_user
 
 router = APIRouter()
 
@@ -29,3 +32,18 @@ async def health_check():
             "version": settings.APP_VERSION,
         }
     )
+
+
+@router.get("/metrics")
+@require_role("super_admin")
+async def metrics(current_user: CurrentUser = Depends(get_current_user)):
+    """In-process cache and connection pool metrics for this worker (super admin only)."""
+    from app.config.db_pool import pool_stats
+    from app.core.cache import dashboard_cache
+    from app.core.security.token_cache import verified_token_cache
+
+    return {
+        "verified_token_cache": verified_token_cache.stats(),
+        "dashboard_cache": dashboard_cache.stats(),
+        "db_pools": pool_stats(),
+    }
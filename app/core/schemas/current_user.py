@@ -6,9 +6,11 @@ Combines data from:
 """
 
 import uuid
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from typing import Optional, List
 
+from app.core.security.permission_registry import permission_registry
+
 
 class CurrentUser(BaseModel):
     """Schema for authenticated user data."""
@@ -29,7 +31,34 @@ class CurrentUser(BaseModel):
     permissions: List[str] = []  # HRIS permissions
 
     is_active: bool = True
-    
+
+    # Compiled permission bitset (process-local, never serialized)
+    _permission_mask: Optional[int] = PrivateAttr(default=None)
+
+    @property
+    def permission_mask(self) -> int:
+        """Permission bitset compiled once per instance from roles/permissions."""
+        if self._permission_mask is None:
+            self._permission_mask = permission_registry.mask_for(
+                self.roles, self.permissions
+            )
+        return self._permission_mask
+
+    def with_profile(
+        self, name: str, email: Optional[str], sso_role: str
+    ) -> "CurrentUser":
+        """
+        Copy with SSO profile fields overlaid from the token.
+
+        The compiled mask is carried over explicitly: it depends only on
+        roles/permissions, so the cached instance compiles it once.
+        """
+        user = self.model_copy(
+            update={"name": name, "email": email, "sso_role": sso_role}
+        )
+        user._permission_mask = self.permission_mask
+        return user
+
     @property
     def full_name(self) -> str:
         """Alias for name for backward compatibility."""
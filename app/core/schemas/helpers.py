@@ -89,7 +89,8 @@ def create_paginated_response(
     data: List[T],
     page: int,
     limit: int,
-    total_items: int,
+    total_items: Optional[int],
+    next_cursor: Optional[str] = None,
 ) -> PaginatedResponse[T]:
     """
     Create type-safe paginated data response.
@@ -99,7 +100,8 @@ def create_paginated_response(
         data: List of data items (typed as List[T])
         page: Current page number
         limit: Items per page
-        total_items: Total number of items
+        total_items: Total number of items (None if the total was skipped)
+        next_cursor: Opaque cursor for the next page (keyset mode), if any
 
     Returns:
         PaginatedResponse[T] with structure:
@@ -114,7 +116,8 @@ def create_paginated_response(
                 "total_items": 100,
                 "total_pages": 10,
                 "has_prev_page": False,
-                "has_next_page": True
+                "has_next_page": True,
+                "next_cursor": "WzEwXQ"
             }
         }
 
@@ -128,8 +131,10 @@ def create_paginated_response(
         )
         # Returns PaginatedResponse[EmployeeResponse]
     """
-    meta_dict = calculate_pagination_meta(page, limit, total_items)
-    meta = PaginationMeta(**meta_dict)
+    meta_dict = calculate_pagination_meta(
+        page, limit, total_items, has_next_page=next_cursor is not None
+    )
+    meta = PaginationMeta(**meta_dict, next_cursor=next_cursor)
 
     return PaginatedResponse[T](
         error=False,
@@ -1,4 +1,4 @@
-from typing import List, Generic, TypeVar
+from typing import List, Generic, Optional, TypeVar
 from pydantic import BaseModel
 from app.core.schemas.base import BaseResponse
 
@@ -10,10 +10,11 @@ class PaginationMeta(BaseModel):
 
     page: int
     limit: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
     has_prev_page: bool
     has_next_page: bool
+    next_cursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseResponse, Generic[T]):
@@ -1,16 +1,21 @@
 """
 JWKS (JSON Web Key Set) Client.
 
-Fetches and caches the public key from SSO's JWKS endpoint for JWT verification.
+Async, kid-aware key store for SSO's JWKS endpoint:
+- Every key in the JWKS is kept, indexed by kid
+- Keys are held as pre-parsed jose Key objects (no PEM re-parsing per request)
+- A background asyncio task refreshes the key set before it expires
+- Unknown kid triggers one single-flight re-fetch (rate limited)
+- Listeners are notified when the key set changes (e.g. to flush caches)
 """
 
+import asyncio
 import time
 import httpx
-from typing import Optional
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
-import base64
+from typing import Callable, Dict, List, Optional
+
+from jose import jwk
+from jose.backends.base import Key
 
 from app.config.settings import settings
 from app.core.utils.logging import get_logger
@@ -19,120 +24,231 @@ logger = get_logger(__name__)
 
 
 class JWKSClient:
-    """Client to fetch and cache public keys from SSO JWKS endpoint."""
+    """Async key store for public keys from SSO JWKS endpoint."""
 
     def __init__(
         self,
         jwks_url: str,
         cache_ttl_seconds: int = 3600,
         fallback_pem_path: Optional[str] = None,
+        algorithm: str = "RS256",
+        refresh_ahead_ratio: float = 0.8,
+        retry_interval_seconds: int = 60,
+        min_refetch_interval_seconds: int = 30,
     ):
         self.jwks_url = jwks_url
         self.cache_ttl_seconds = cache_ttl_seconds
         self.fallback_pem_path = fallback_pem_path
-        self._cached_pem: Optional[str] = None
-        self._cache_expires_at: float = 0
-
-    def _base64url_decode(self, data: str) -> bytes:
-        """Decode base64url encoded string (no padding)."""
-        padding = 4 - len(data) % 4
-        if padding != 4:
-            data += "=" * padding
-        return base64.urlsafe_b64decode(data)
-
-    def _jwk_to_pem(self, jwk: dict) -> str:
-        """Convert JWK to PEM format."""
-        n = int.from_bytes(self._base64url_decode(jwk["n"]), byteorder="big")
-        e = int.from_bytes(self._base64url_decode(jwk["e"]), byteorder="big")
-
-        public_numbers = RSAPublicNumbers(e, n)
-        public_key = public_numbers.public_key(default_backend())
-
-        pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-        return pem.decode("utf-8")
+        self.algorithm = algorithm
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.retry_interval_seconds = retry_interval_seconds
+        self.min_refetch_interval_seconds = min_refetch_interval_seconds
+
+        self._keys: Dict[str, Key] = {}
+        self._default_kid: Optional[str] = None
+        self._fallback_key: Optional[Key] = None
+        self._expires_at: float = 0
+        self._last_fetch_at: float = 0
+
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_key_set_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked whenever the key set changes."""
+        self._listeners.append(callback)
 
-    def _fetch_jwks(self) -> Optional[dict]:
-        """Fetch JWKS from SSO endpoint."""
+    def _notify_key_set_changed(self) -> None:
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"JWKS key set listener failed: {e}")
+
+    def _construct_key(self, key_data) -> Key:
+        """Build a pre-parsed jose Key from a JWK dict or PEM string."""
+        return jwk.construct(key_data, algorithm=self.algorithm)
+
+    async def _fetch_jwks(self) -> Optional[dict]:
+        """Fetch JWKS from SSO endpoint without blocking the event loop."""
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(self.jwks_url)
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.get(self.jwks_url)
                 response.raise_for_status()
                 return response.json()
         except Exception as e:
             logger.warning(f"Failed to fetch JWKS from {self.jwks_url}: {e}")
             return None
 
-    def _load_fallback_pem(self) -> Optional[str]:
-        """Load fallback PEM file."""
+    def _load_fallback_key(self) -> Optional[Key]:
+        """Load fallback PEM file once and keep it pre-parsed."""
+        if self._fallback_key is not None:
+            return self._fallback_key
         if not self.fallback_pem_path:
             return None
         try:
             with open(self.fallback_pem_path, "r") as f:
-                return f.read()
+                self._fallback_key = self._construct_key(f.read())
+            return self._fallback_key
         except Exception as e:
             logger.warning(f"Failed to load fallback PEM: {e}")
             return None
 
-    def get_public_key(self, kid: Optional[str] = None) -> str:
+    async def refresh(self) -> bool:
+        """
+        Fetch JWKS and atomically replace the key set.
+
+        Returns:
+            True if the key set was refreshed from JWKS, False otherwise.
         """
-        Get the public key in PEM format.
-        
+        self._last_fetch_at = time.time()
+        jwks = await self._fetch_jwks()
+        if not jwks or not jwks.get("keys"):
+            return False
+
+        keys: Dict[str, Key] = {}
+        default_kid: Optional[str] = None
+        for key_data in jwks["keys"]:
+            if key_data.get("use", "sig") != "sig":
+                continue
+            kid = key_data.get("kid") or ""
+            try:
+                keys[kid] = self._construct_key(key_data)
+            except Exception as e:
+                logger.warning(f"Skipping invalid JWK (kid={kid}): {e}")
+                continue
+            if default_kid is None:
+                default_kid = kid
+
+        if not keys:
+            return False
+
+        changed = {kid: k.to_dict() for kid, k in keys.items()} != {
+            kid: k.to_dict() for kid, k in self._keys.items()
+        }
+
+        self._keys = keys
+        self._default_kid = default_kid
+        self._expires_at = time.time() + self.cache_ttl_seconds
+        if changed:
+            self._notify_key_set_changed()
+        logger.info(f"Loaded {len(keys)} key(s) from JWKS (kids={list(keys)})")
+        return True
+
+    async def _refresh_single_flight(self) -> bool:
+        """Refresh key set, sharing one in-flight fetch between callers."""
+        if self._inflight is not None:
+            return await asyncio.shield(self._inflight)
+
+        loop = asyncio.get_running_loop()
+        self._inflight = loop.create_future()
+        try:
+            refreshed = await self.refresh()
+            self._inflight.set_result(refreshed)
+            return refreshed
+        except Exception as e:
+            self._inflight.set_exception(e)
+            raise
+        finally:
+            self._inflight = None
+
+    def _lookup(self, kid: Optional[str]) -> Optional[Key]:
+        if not kid:
+            return self._default_key()
+        return self._keys.get(kid)
+
+    def _default_key(self) -> Optional[Key]:
+        if self._default_kid is not None:
+            return self._keys.get(self._default_kid)
+        return None
+
+    async def get_public_key(self, kid: Optional[str] = None) -> Key:
+        """
+        Get the pre-parsed public key for a kid.
+
         Args:
-            kid: Key ID to match (optional). If not provided, uses first key.
-            
+            kid: Key ID from the token header (optional). If not provided,
+                uses the first key in the JWKS. An unknown kid also falls
+                back to that key when the JWKS holds exactly one key.
+
         Returns:
-            Public key in PEM format.
-            
+            jose Key object ready for signature verification.
+
         Raises:
             RuntimeError: If no public key is available.
         """
-        now = time.time()
-
-        # Return cached key if still valid
-        if self._cached_pem and now < self._cache_expires_at:
-            return self._cached_pem
-
-        # Try to fetch fresh JWKS
-        jwks = self._fetch_jwks()
-        if jwks and "keys" in jwks and len(jwks["keys"]) > 0:
-            # Find matching key by kid, or use first key
-            key = None
-            if kid:
-                for k in jwks["keys"]:
-                    if k.get("kid") == kid:
-                        key = k
-                        break
-            if not key:
-                key = jwks["keys"][0]
-
-            self._cached_pem = self._jwk_to_pem(key)
-            self._cache_expires_at = now + self.cache_ttl_seconds
-            logger.info(f"Fetched and cached public key from JWKS (kid={key.get('kid')})")
-            return self._cached_pem
-
-        # Fallback to file-based key
-        fallback = self._load_fallback_pem()
-        if fallback:
-            logger.warning("Using fallback PEM file for public key")
-            self._cached_pem = fallback
-            # Cache fallback for shorter period to retry JWKS sooner
-            self._cache_expires_at = now + 300  # 5 minutes
-            return self._cached_pem
-
-        # If we have stale cache, use it
-        if self._cached_pem:
-            logger.warning("JWKS unavailable, using stale cached key")
-            return self._cached_pem
-
-        raise RuntimeError("No public key available from JWKS or fallback")
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        # Unknown kid (or empty store): re-fetch once, rate limited
+        if time.time() - self._last_fetch_at >= self.min_refetch_interval_seconds:
+            await self._refresh_single_flight()
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+
+        # Single-key JWKS: same behaviour as before kid indexing
+        if len(self._keys) == 1:
+            logger.warning(f"Unknown kid={kid}, using the only JWKS key")
+            return self._default_key()
+
+        fallback = self._load_fallback_key()
+        if fallback is not None:
+            logger.warning(f"Using fallback PEM file for public key (kid={kid})")
+            return fallback
+
+        raise RuntimeError(f"No public key available for kid={kid}")
+
+    async def _refresh_loop(self) -> None:
+        """Background task: refresh key set before it expires."""
+        while True:
+            remaining = max(self._expires_at - time.time(), 0)
+            if self._keys and remaining > 0:
+                delay = max(
+                    remaining - self.cache_ttl_seconds * (1 - self.refresh_ahead_ratio),
+                    1,
+                )
+            else:
+                delay = self.retry_interval_seconds
+            await asyncio.sleep(delay)
+
+            try:
+                await self._refresh_single_flight()
+            except Exception as e:
+                logger.warning(f"Background JWKS refresh failed: {e}")
+
+    async def start(self) -> None:
+        """Load the initial key set and start the background refresh task."""
+        try:
+            await self._refresh_single_flight()
+        except Exception as e:
+            logger.warning(f"Initial JWKS load failed: {e}")
+
+        if not self._keys:
+            self._load_fallback_key()
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
 
     def clear_cache(self):
-        """Clear the cached key (useful for testing or key rotation)."""
-        self._cached_pem = None
-        self._cache_expires_at = 0
+        """Clear the cached keys (useful for testing or key rotation)."""
+        self._keys = {}
+        self._default_kid = None
+        self._fallback_key = None
+        self._expires_at = 0
+        self._last_fetch_at = 0
+        self._notify_key_set_changed()
 
 
 # Singleton instance
@@ -147,5 +263,6 @@ def get_jwks_client() -> JWKSClient:
             jwks_url=f"{settings.SSO_SERVICE_URL}/.well-known/jwks.json",
             cache_ttl_seconds=getattr(settings, "JWKS_CACHE_TTL_SECONDS", 3600),
             fallback_pem_path=settings.JWT_PUBLIC_KEY_PATH,
+            algorithm=settings.JWT_ALGORITHM,
         )
     return _jwks_client
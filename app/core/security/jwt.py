@@ -3,21 +3,29 @@
 from fastapi import HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
+from jose.backends.base import Key
 from typing import Optional
 
 from app.config.settings import settings
 from app.core.exceptions import UnauthorizedException
 from app.core.security.jwks_client import get_jwks_client
+from app.core.security.token_cache import verified_token_cache
 
+get_jwks_client().add_key_set_listener(verified_token_cache.clear)
 
-def _get_public_key() -> str:
-    """Get public key from JWKS client (cached, with fallback)."""
-    return get_jwks_client().get_public_key()
 
+async def _get_public_key(token: str) -> Key:
+    """Get pre-parsed public key for the token's kid from the JWKS key store."""
+    kid = jwt.get_unverified_header(token).get("kid")
+    return await get_jwks_client().get_public_key(kid)
 
-def verify_token_locally(token: str) -> dict:
+
+async def verify_token_locally(token: str) -> dict:
     """
-    Verify JWT token locally using cached public key.
+    Verify JWT token locally using the key matching the token's kid.
+
+    Previously verified tokens are served from the verified-token cache
+    until their exp, skipping signature verification.
     
     Args:
         token: encoded JWT token string
@@ -28,9 +36,13 @@ def verify_token_locally(token: str) -> dict:
     Raises:
         UnauthorizedException: If token is invalid or expired
     """
+    cached = verified_token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
-            token, _get_public_key(), algorithms=[settings.JWT_ALGORITHM]
+            token, await _get_public_key(token), algorithms=[settings.JWT_ALGORITHM]
         )
         if payload.get("type") != "access":
             raise UnauthorizedException("Invalid token type")
@@ -41,6 +53,7 @@ def verify_token_locally(token: str) -> dict:
                 f"Token not valid for this application. Expected '{settings.CLIENT_ID}', got '{token_client_id}'"
             )
 
+        verified_token_cache.set(token, payload)
         return payload
     except JWTError as e:
         raise UnauthorizedException(f"Invalid token: {str(e)}")
@@ -0,0 +1,71 @@
+"""
+Permission Registry.
+
+Maps each permission code to a bit index so permission checks become a
+single bitwise operation on an integer mask.
+
+Bits are assigned on first sight and never renumbered within a process, so
+masks compiled by decorators at import time stay valid after the registry
+is (re)loaded from the `permissions` table. Bit indices are process-local:
+masks must never be persisted or shared across workers.
+"""
+
+from typing import Iterable, List
+
+from app.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SUPER_ADMIN_ROLE = "super_admin"
+
+# Invalidation bus topic: every worker reloads from the permissions table
+RELOAD_TOPIC = "permission_registry"
+
+# Super admin mask: every bit set (-1 & x == x for any x)
+ALL_PERMISSIONS = -1
+
+
+class PermissionRegistry:
+    """Process-local permission code -> bit index registry."""
+
+    def __init__(self):
+        self._bits: dict[str, int] = {}
+        self.version = 0
+
+    def bit(self, code: str) -> int:
+        """Get the bit for a permission code, assigning one if unseen."""
+        index = self._bits.get(code)
+        if index is None:
+            index = len(self._bits)
+            self._bits[code] = index
+        return 1 << index
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """Compile permission codes into a single mask."""
+        result = 0
+        for code in codes:
+            result |= self.bit(code)
+        return result
+
+    def mask_for(self, roles: Iterable[str], permissions: Iterable[str]) -> int:
+        """Compile a user's mask; super_admin gets every permission."""
+        if SUPER_ADMIN_ROLE in roles:
+            return ALL_PERMISSIONS
+        return self.mask(permissions)
+
+    def load(self, codes: Iterable[str]) -> None:
+        """Register permission codes (e.g. from the permissions table)."""
+        before = len(self._bits)
+        for code in codes:
+            self.bit(code)
+        self.version += 1
+        logger.info(
+            f"Permission registry loaded: {len(self._bits)} codes "
+            f"({len(self._bits) - before} new, version={self.version})"
+        )
+
+    def codes(self) -> List[str]:
+        return list(self._bits)
+
+
+permission_registry = PermissionRegistry()
@@ -1,12 +1,30 @@
 from functools import wraps
 from typing import List, Union
 from app.core.exceptions import ForbiddenException
+from app.core.security.permission_registry import permission_registry
+
+
+def _user_attr(user, name: str, default):
+    return user.get(name, default) if isinstance(user, dict) else getattr(user, name, default)
+
+
+def _permission_mask(user) -> int:
+    """Get user's compiled permission mask (CurrentUser carries it precomputed)."""
+    mask = None if isinstance(user, dict) else getattr(user, "permission_mask", None)
+    if mask is None:
+        mask = permission_registry.mask_for(
+            _user_attr(user, "roles", []), _user_attr(user, "permissions", [])
+        )
+    return mask
 
 
 def require_permission(permission: Union[str, List[str]], require_all: bool = False):
     """
     Decorator to require specific permission(s) for an endpoint.
 
+    Required permissions are compiled into a bitmask once at decoration time,
+    so each check is a single bitwise operation.
+
     Args:
         permission: Single permission string or list of permissions
         require_all: If True, user must have ALL permissions. If False, user needs ANY permission.
@@ -15,6 +33,20 @@ def require_permission(permission: Union[str, List[str]], require_all: bool = Fa
         @require_permission("employee.read")
         @require_permission(["employee.read", "employee.update"], require_all=True)
     """
+    if isinstance(permission, str):
+        required_mask = permission_registry.bit(permission)
+        error_message = f"Akses ditolak. Memerlukan izin: {permission}"
+    elif require_all:
+        required_mask = permission_registry.mask(permission)
+        error_message = (
+            f"Akses ditolak. Memerlukan semua izin: {', '.join(permission)}"
+        )
+    else:
+        required_mask = permission_registry.mask(permission)
+        error_message = (
+            f"Akses ditolak. Memerlukan salah satu izin: {', '.join(permission)}"
+        )
+    match_all = isinstance(permission, str) or require_all
 
     def decorator(func):
         @wraps(func)
@@ -25,36 +57,10 @@ def require_permission(permission: Union[str, List[str]], require_all: bool = Fa
             if not current_user:
                 raise ForbiddenException("Autentikasi pengguna diperlukan")
 
-            # Super admin bypass
-            user_roles = current_user.get("roles", []) if isinstance(current_user, dict) else getattr(current_user, "roles", [])
-            if "super_admin" in user_roles:
-                return await func(*args, **kwargs)
-
-            # Check permissions
-            user_permissions = current_user.get("permissions", []) if isinstance(current_user, dict) else getattr(current_user, "permissions", [])
-
-            if isinstance(permission, str):
-                # Single permission check
-                if permission not in user_permissions:
-                    raise ForbiddenException(
-                        f"Akses ditolak. Memerlukan izin: {permission}"
-                    )
-
-            elif isinstance(permission, list):
-                # Multiple permissions check
-                if require_all:
-                    # User must have ALL permissions
-                    missing = [p for p in permission if p not in user_permissions]
-                    if missing:
-                        raise ForbiddenException(
-                            f"Akses ditolak. Memerlukan semua izin: {', '.join(permission)}"
-                        )
-                else:
-                    # User must have ANY permission
-                    if not any(p in user_permissions for p in permission):
-                        raise ForbiddenException(
-                            f"Akses ditolak. Memerlukan salah satu izin: {', '.join(permission)}"
-                        )
+            # Super admin mask has every bit set
+            granted = _permission_mask(current_user) & required_mask
+            if (granted != required_mask) if match_all else (granted == 0):
+                raise ForbiddenException(error_message)
 
             return await func(*args, **kwargs)
 
@@ -120,13 +126,8 @@ def has_permission(user, permission: str) -> bool:
     if not user:
         return False
 
-    # Super admin has all permissions
-    user_roles = user.get("roles", []) if isinstance(user, dict) else getattr(user, "roles", [])
-    if "super_admin" in user_roles:
-        return True
-
-    user_permissions = user.get("permissions", []) if isinstance(user, dict) else getattr(user, "permissions", [])
-    return permission in user_permissions
+    # Super admin mask has every bit set
+    return bool(_permission_mask(user) & permission_registry.bit(permission))
 
 
 def has_role(user, role: str) -> bool:
@@ -0,0 +1,65 @@
+"""
+Verified Token Cache.
+
+Bounded cache of verified JWT claims so repeat requests with the same access
+token skip RS256 signature verification. Entries are keyed by a SHA-256 hash
+of the token and expire at the token's `exp` claim.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+from cachetools import TLRUCache
+
+from app.config.settings import settings
+
+
+class VerifiedTokenCache:
+    """TLRU cache of verified claims with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 10000):
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, payload, _now: payload["exp"],
+            timer=time.time,
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims if the token was verified and has not expired."""
+        payload = self._cache.get(self._key(token))
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache verified claims until the token's exp."""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+        self._cache[self._key(token)] = payload
+
+    def clear(self) -> None:
+        """Flush all entries (e.g. when the JWKS key set changes)."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
+
+
+verified_token_cache = VerifiedTokenCache(maxsize=settings.VERIFIED_TOKEN_CACHE_MAXSIZE)
@@ -0,0 +1,104 @@
+"""
+DataLoader: batches and memoizes lookups by key.
+
+Every `load(key)` issued in the same event-loop tick is coalesced into a
+single call to the batch function (typically one `WHERE id IN (...)`
+query), and each key is fetched at most once for the lifetime of the
+loader. Create one loader per request so the memo never outlives the
+session it reads from.
+"""
+
+import asyncio
+from operator import attrgetter
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Iterable[V]]],
+        key: Callable[[V], K] = attrgetter("id"),
+    ):
+        """
+        Args:
+            batch_load: Fetches values for a list of keys (missing keys are
+                simply absent from the result)
+            key: Key of a loaded value
+        """
+        self._batch_load = batch_load
+        self._key = key
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+        # Strong refs: the event loop only keeps weak refs to tasks
+        self._dispatching: Set[asyncio.Task] = set()
+
+    def load(self, key: Optional[K]) -> Awaitable[Optional[V]]:
+        """Value for key (None if not found); batched with same-tick loads."""
+        loop = asyncio.get_running_loop()
+        if key is None:
+            future = loop.create_future()
+            future.set_result(None)
+            return future
+
+        future = self._cache.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._queue:
+                loop.call_soon(self._schedule_dispatch)
+            self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Optional[K]]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, value: V) -> None:
+        """Seed the memo with an already loaded value."""
+        key = self._key(value)
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """Forget one key (e.g. after it was modified) or everything."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._dispatching.add(task)
+        task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        try:
+            values = await self._batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {self._key(value): value for value in values}
+        for key in keys:
+            future = self._cache.get(key)
+            if future is not None and not future.done():
+                future.set_result(found.get(key))
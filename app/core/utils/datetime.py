@@ -55,3 +55,11 @@ def is_future(dt: datetime) -> bool:
 def get_iso_timestamp() -> str:
     """Get current timestamp in ISO 8601 format with timezone"""
     return datetime.now(timezone.utc).isoformat()
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def month_end(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
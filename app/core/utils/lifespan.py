@@ -6,11 +6,27 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.tasks.scheduler_startup import setup_scheduler, shutdown_scheduler
 from app.core.messaging import message_engine
+from app.core.security.jwks_client import get_jwks_client
+from app.core.security.permission_registry import (
+    RELOAD_TOPIC as PERMISSION_RELOAD_TOPIC,
+    permission_registry,
+)
+from app.core.cache.invalidation_bus import invalidation_bus
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+async def load_permission_registry() -> None:
+    """Register every permission code from the permissions table."""
+    from app.config.database import get_db_context
+    from app.modules.users.rbac.repositories import RoleQueries
+
+    async with get_db_context() as db:
+        permissions = await RoleQueries(db).get_all_permissions()
+    permission_registry.load(p.code for p in permissions)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -26,6 +42,23 @@ async def lifespan(app: FastAPI):
 
     consumer = None
 
+    # Startup: JWKS key store (background refresh)
+    logger.info("Loading JWKS key store...")
+    jwks_client = get_jwks_client()
+    await jwks_client.start()
+
+    # Startup: Cross-worker cache invalidation listener
+    invalidation_bus.subscribe(
+        PERMISSION_RELOAD_TOPIC, lambda _: load_permission_registry()
+    )
+    await invalidation_bus.start()
+
+    # Startup: Permission bitset registry
+    try:
+        await load_permission_registry()
+    except Exception as e:
+        logger.warning(f"Permission registry load failed: {e}")
+
     # Startup: Scheduler
     logger.info("Starting scheduler...")
     await setup_scheduler()
@@ -93,7 +126,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"RabbitMQ disconnect error: {e}")
 
+    # Shutdown: JWKS key store
+    await jwks_client.stop()
+
+    # Shutdown: Invalidation listener
+    await invalidation_bus.stop()
+
     # Shutdown: Stop scheduler
     logger.info("Stopping scheduler...")
     await shutdown_scheduler()
     logger.info("Scheduler stopped")
+
+    # Shutdown: Database pools
+    from app.config.db_pool import dispose_all
+
+    await dispose_all()
+    logger.info("Database pools closed")
@@ -1,8 +1,29 @@
 import math
+from typing import Optional
 
 
-def calculate_pagination_meta(page: int, limit: int, total_items: int) -> dict:
-    """Calculate pagination metadata"""
+def calculate_pagination_meta(
+    page: int,
+    limit: int,
+    total_items: Optional[int],
+    has_next_page: Optional[bool] = None,
+) -> dict:
+    """
+    Calculate pagination metadata.
+
+    When total_items is None (total skipped by the client), total_pages is None
+    and has_next_page must be supplied by the caller.
+    """
+    if total_items is None:
+        return {
+            "page": page,
+            "limit": limit,
+            "total_items": None,
+            "total_pages": None,
+            "has_prev_page": page > 1,
+            "has_next_page": bool(has_next_page),
+        }
+
     total_pages = math.ceil(total_items / limit) if limit > 0 else 0
     has_prev_page = page > 1
     has_next_page = page < total_pages
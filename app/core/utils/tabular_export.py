@@ -0,0 +1,90 @@
+"""
+Tabular export utility (CSV / XLSX) untuk StreamingResponse.
+
+Rows dikonsumsi dari async iterator satu per satu sehingga memory tetap
+datar berapapun jumlah row:
+- CSV: di-encode dan di-yield per batch row
+- XLSX: openpyxl write_only menulis row ke file sementara di disk, file
+  hasil save() kemudian di-yield per chunk
+"""
+
+import csv
+import io
+import tempfile
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+from anyio import to_thread
+from openpyxl import Workbook
+
+
+class ExportFormat:
+    CSV = "csv"
+    XLSX = "xlsx"
+
+    ALL = (CSV, XLSX)
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+_CSV_FLUSH_ROWS = 500
+_FILE_CHUNK_SIZE = 64 * 1024
+# XLSX yang lebih kecil dari ini tidak menyentuh disk saat di-save
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+async def stream_csv(
+    header: Sequence[str], rows: AsyncIterator[Iterable[Any]]
+) -> AsyncIterator[bytes]:
+    """Stream rows sebagai CSV UTF-8 (dengan BOM agar terbaca benar di Excel)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+
+    pending = 0
+    async for row in rows:
+        writer.writerow(["" if value is None else value for value in row])
+        pending += 1
+        if pending >= _CSV_FLUSH_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+async def stream_xlsx(
+    sheet_title: str, header: Sequence[str], rows: AsyncIterator[Iterable[Any]]
+) -> AsyncIterator[bytes]:
+    """Stream rows sebagai XLSX menggunakan openpyxl write_only workbook."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title[:31])
+    sheet.append(list(header))
+
+    async for row in rows:
+        sheet.append(list(row))
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as output:
+        await to_thread.run_sync(workbook.save, output)
+        output.seek(0)
+        while True:
+            chunk = output.read(_FILE_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def stream_export(
+    export_format: str,
+    sheet_title: str,
+    header: Sequence[str],
+    rows: AsyncIterator[Iterable[Any]],
+) -> AsyncIterator[bytes]:
+    """Pilih writer berdasarkan format (ExportFormat.CSV / ExportFormat.XLSX)."""
+    if export_format == ExportFormat.CSV:
+        return stream_csv(header, rows)
+    return stream_xlsx(sheet_title, header, rows)
@@ -11,7 +11,7 @@ import grpc
 
 from proto.employee import employee_pb2, employee_pb2_grpc
 from proto.common import common_pb2
-from app.config.database import AsyncSessionLocal
+from app.config.database import GrpcSessionLocal, GrpcReadSessionLocal
 from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.org_units.repositories import OrgUnitQueries
 from app.modules.users.users.repositories import UserQueries, UserCommands
@@ -27,9 +27,9 @@ logger = logging.getLogger(__name__)
 class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
     """gRPC Handler for Employee master data operations."""
 
-    async def _get_service(self):
+    async def _get_service(self, read_only: bool = False):
         """Create EmployeeService with all dependencies."""
-        session = AsyncSessionLocal()
+        session = (GrpcReadSessionLocal if read_only else GrpcSessionLocal)()
 
         employee_queries = EmployeeQueries(session)
         employee_commands = EmployeeCommands(session)
@@ -59,7 +59,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info(f"gRPC GetEmployee called: {request.employee_id}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 employee = await service.get(request.employee_id)
                 return employee_to_proto(employee)
@@ -82,7 +82,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info(f"gRPC GetEmployeeByNumber called: {request.employee_number}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 employee = await service.get_by_code(request.employee_number)
                 if not employee:
@@ -111,7 +111,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info(f"gRPC GetEmployeeByEmail called: {request.employee_email}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 employee = await service.get_by_email(request.employee_email)
                 if not employee:
@@ -140,7 +140,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info("gRPC ListEmployees called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
@@ -319,7 +319,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info(f"gRPC BatchGetEmployees called: {len(request.employee_ids)} IDs")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 employees = []
                 for emp_id in request.employee_ids:
@@ -346,7 +346,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         )
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
@@ -387,7 +387,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         )
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
@@ -476,7 +476,7 @@ class EmployeeHandler(employee_pb2_grpc.EmployeeServiceServicer):
         logger.info("gRPC ListDeletedEmployees called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
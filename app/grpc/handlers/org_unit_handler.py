@@ -10,7 +10,7 @@ import grpc
 
 from proto.org_unit import org_unit_pb2, org_unit_pb2_grpc
 from proto.common import common_pb2
-from app.config.database import AsyncSessionLocal
+from app.config.database import GrpcSessionLocal, GrpcReadSessionLocal
 from app.modules.org_units.repositories import OrgUnitQueries, OrgUnitCommands
 from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.org_units.services.org_unit_service import OrgUnitService
@@ -24,9 +24,9 @@ logger = logging.getLogger(__name__)
 class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
     """gRPC Handler for OrgUnit master data operations."""
 
-    async def _get_service(self):
+    async def _get_service(self, read_only: bool = False):
         """Create OrgUnitService with all dependencies."""
-        session = AsyncSessionLocal()
+        session = (GrpcReadSessionLocal if read_only else GrpcSessionLocal)()
 
         org_unit_queries = OrgUnitQueries(session)
         org_unit_commands = OrgUnitCommands(session)
@@ -50,7 +50,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info(f"gRPC GetOrgUnit called: {request.org_unit_id}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 org_unit = await service.get_org_unit(request.org_unit_id)
                 if not org_unit:
@@ -79,7 +79,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info(f"gRPC GetOrgUnitByCode called: {request.org_unit_code}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 org_unit = await service.get_org_unit_by_code(request.org_unit_code)
                 if not org_unit:
@@ -108,7 +108,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info("gRPC ListOrgUnits called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
@@ -264,7 +264,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info(f"gRPC GetOrgUnitChildren called: {request.org_unit_parent_id}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
@@ -300,7 +300,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info("gRPC GetOrgUnitHierarchy called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 root_id = (
                     request.root_org_unit_id
@@ -341,7 +341,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info(f"gRPC BatchGetOrgUnits called: {len(request.org_unit_ids)} IDs")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 org_units = []
                 for ou_id in request.org_unit_ids:
@@ -363,7 +363,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info("gRPC GetOrgUnitTypes called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 types = await service.get_org_unit_types()
                 return org_unit_pb2.GetOrgUnitTypesResponse(types=types)
@@ -380,7 +380,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info(f"gRPC GetOrgUnitAncestors called: {request.org_unit_id}")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 org_unit = await service.get_org_unit(request.org_unit_id)
                 if not org_unit:
@@ -459,7 +459,7 @@ class OrgUnitHandler(org_unit_pb2_grpc.OrgUnitServiceServicer):
         logger.info("gRPC ListDeletedOrgUnits called")
 
         try:
-            service, session = await self._get_service()
+            service, session = await self._get_service(read_only=True)
             async with session:
                 page = request.pagination.page if request.pagination.page > 0 else 1
                 limit = request.pagination.limit if request.pagination.limit > 0 else 10
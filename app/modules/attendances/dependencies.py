@@ -5,6 +5,7 @@ Attendance Module Dependencies
 from typing import Annotated
 from fastapi import Depends
 from app.core.dependencies.database import PostgresDB
+from app.core.dependencies.loaders import LoadersDep
 from app.modules.attendances.repositories import AttendanceQueries, AttendanceCommands
 from app.modules.leave_requests.repositories import LeaveRequestQueries
 from app.modules.employees.repositories import EmployeeQueries
@@ -53,8 +54,11 @@ def get_attendance_service(
     employee_queries: EmployeeQueriesDep,
     leave_queries: LeaveRequestQueriesDep,
     holiday_queries: HolidayQueriesDep,
+    loaders: LoadersDep,
 ) -> AttendanceService:
-    return AttendanceService(queries, commands, employee_queries, leave_queries, holiday_queries)
+    return AttendanceService(
+        queries, commands, employee_queries, leave_queries, holiday_queries, loaders
+    )
 
 
 AttendanceServiceDep = Annotated[AttendanceService, Depends(get_attendance_service)]
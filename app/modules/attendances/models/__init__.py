@@ -1,5 +1,9 @@
 """Attendance models."""
 
 from app.modules.attendances.models.attendances import Attendance
+from app.modules.attendances.models.attendance_stats import (
+    AttendanceDailyStat,
+    AttendanceMonthlyStat,
+)
 
-__all__ = ["Attendance"]
+__all__ = ["Attendance", "AttendanceDailyStat", "AttendanceMonthlyStat"]
@@ -0,0 +1,70 @@
+from sqlalchemy import Integer, Date, DateTime, Numeric, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional
+from datetime import date as DateType, datetime as DateTimeType
+from decimal import Decimal
+from app.config.database import Base
+
+
+class AttendanceDailyStat(Base):
+    """Rollup jumlah attendance per (tanggal, org unit, status).
+
+    Dipelihara incremental oleh AttendanceCommands dan diperbaiki setiap malam
+    oleh ReconcileAttendanceStatsJob. org_unit_id NULL = attendance tanpa org unit.
+    """
+
+    __tablename__ = "attendance_daily_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    attendance_date: Mapped[DateType] = mapped_column(Date, nullable=False)
+    org_unit_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    attendance_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    work_hours: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    overtime_hours: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0
+    )
+    updated_at: Mapped[DateTimeType] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "attendance_date",
+            "org_unit_id",
+            "status",
+            name="uq_attendance_daily_stats_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AttendanceDailyStat(date={self.attendance_date}, org_unit_id={self.org_unit_id}, status={self.status}, count={self.attendance_count})>"
+
+
+class AttendanceMonthlyStat(Base):
+    """Rollup attendance per employee per bulan (month = tanggal 1) dan status."""
+
+    __tablename__ = "attendance_monthly_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    employee_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    month: Mapped[DateType] = mapped_column(Date, nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    attendance_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    work_hours: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    overtime_hours: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0
+    )
+    updated_at: Mapped[DateTimeType] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "employee_id", "month", "status", name="uq_attendance_monthly_stats_key"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AttendanceMonthlyStat(employee_id={self.employee_id}, month={self.month}, status={self.status}, count={self.attendance_count})>"
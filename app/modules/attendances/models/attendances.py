@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import String, Integer, Date, DateTime, Text, Numeric, UniqueConstraint, ForeignKey
+from sqlalchemy import String, Integer, Date, DateTime, Text, Numeric, UniqueConstraint, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
@@ -118,6 +118,8 @@ class Attendance(Base, TimestampMixin):
         UniqueConstraint(
             "employee_id", "attendance_date", name="uq_attendance_employee_date"
         ),
+        # Unique constraint di atas sudah melayani (employee_id, attendance_date)
+        Index("ix_attendances_date_status", "attendance_date", "status"),
     )
 
     def __repr__(self) -> str:
@@ -1,4 +1,15 @@
-from app.modules.attendances.repositories.queries import AttendanceQueries
-from app.modules.attendances.repositories.commands import AttendanceCommands
+from app.modules.attendances.repositories.queries import (
+    AttendanceQueries,
+    AttendanceStatsQueries,
+)
+from app.modules.attendances.repositories.commands import (
+    AttendanceCommands,
+    AttendanceStatsCommands,
+)
 
-__all__ = ["AttendanceQueries", "AttendanceCommands"]
+__all__ = [
+    "AttendanceQueries",
+    "AttendanceStatsQueries",
+    "AttendanceCommands",
+    "AttendanceStatsCommands",
+]
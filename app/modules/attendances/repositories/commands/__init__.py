@@ -1,3 +1,6 @@
 from app.modules.attendances.repositories.commands.attendances_commands import AttendanceCommands
+from app.modules.attendances.repositories.commands.attendance_stats_commands import (
+    AttendanceStatsCommands,
+)
 
-__all__ = ["AttendanceCommands"]
+__all__ = ["AttendanceCommands", "AttendanceStatsCommands"]
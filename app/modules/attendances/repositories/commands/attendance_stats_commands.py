@@ -0,0 +1,268 @@
+"""
+Attendance Stats Command Repository - Maintains the attendance rollup tables
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from sqlalchemy import and_, delete, func, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.utils.datetime import month_end, month_start
+from app.modules.attendances.models.attendances import Attendance
+from app.modules.attendances.models.attendance_stats import (
+    AttendanceDailyStat,
+    AttendanceMonthlyStat,
+)
+
+_FACT_FIELDS = (
+    "employee_id",
+    "org_unit_id",
+    "attendance_date",
+    "status",
+    "work_hours",
+    "overtime_hours",
+)
+
+
+class AttendanceFacts(NamedTuple):
+    """The attendance fields that feed the rollups."""
+
+    employee_id: int
+    org_unit_id: Optional[int]
+    attendance_date: date
+    status: str
+    work_hours: Optional[Decimal]
+    overtime_hours: Optional[Decimal]
+
+    @classmethod
+    def from_row(cls, row) -> "AttendanceFacts":
+        """From a Row selecting/returning FACT_COLUMNS."""
+        return cls(*(getattr(row, field) for field in _FACT_FIELDS))
+
+    @classmethod
+    def current(cls, attendance: Attendance) -> "AttendanceFacts":
+        return cls(*(getattr(attendance, field) for field in _FACT_FIELDS))
+
+    @classmethod
+    def previous(cls, attendance: Attendance) -> Optional["AttendanceFacts"]:
+        """Values as last loaded from the database (None for a new object)."""
+        state = inspect(attendance)
+        if not state.has_identity:
+            return None
+        values = []
+        for field in _FACT_FIELDS:
+            history = state.attrs[field].history
+            if history.deleted:
+                values.append(history.deleted[0])
+            elif history.unchanged:
+                values.append(history.unchanged[0])
+            else:
+                values.append(getattr(attendance, field))
+        return cls(*values)
+
+
+# Rows per multi-row upsert (6 binds per row, asyncpg limit is 32767)
+_UPSERT_CHUNK_SIZE = 1000
+
+# Attendance columns in AttendanceFacts order, for RETURNING / SELECT
+FACT_COLUMNS = tuple(getattr(Attendance, field) for field in _FACT_FIELDS)
+
+
+def _hours(value) -> Decimal:
+    """Hours as stored by Numeric(5, 2) (check-out assigns floats)."""
+    if not value:
+        return Decimal(0)
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _sort_key(item) -> Tuple:
+    # org_unit_id may be None; None sorts first
+    return tuple((value is not None, value) for value in item[0])
+
+
+class AttendanceStatsCommands:
+    """
+    Write operations for attendance_daily_stats / attendance_monthly_stats.
+
+    None of these commit: they run inside the caller's attendance write so
+    the rollups change in the same transaction as the attendance rows.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(
+        self,
+        old: Iterable[AttendanceFacts] = (),
+        new: Iterable[AttendanceFacts] = (),
+    ) -> None:
+        """
+        Incremental update: subtract `old` facts, add `new` facts.
+
+        Deltas are grouped per touched (date, org_unit, status) and
+        (employee, month, status) key and upserted as count = count + delta,
+        in key order so concurrent writers lock rollup rows consistently.
+        """
+        daily: Dict[Tuple, List] = {}
+        monthly: Dict[Tuple, List] = {}
+
+        def add(facts: AttendanceFacts, sign: int) -> None:
+            work = _hours(facts.work_hours) * sign
+            overtime = _hours(facts.overtime_hours) * sign
+            for bucket, key in (
+                (daily, (facts.attendance_date, facts.org_unit_id, facts.status)),
+                (monthly, (facts.employee_id, month_start(facts.attendance_date), facts.status)),
+            ):
+                delta = bucket.setdefault(key, [0, 0, 0])
+                delta[0] += sign
+                delta[1] += work
+                delta[2] += overtime
+
+        for facts in old:
+            add(facts, -1)
+        for facts in new:
+            add(facts, 1)
+
+        daily_rows = [
+            {
+                "attendance_date": key[0],
+                "org_unit_id": key[1],
+                "status": key[2],
+                "attendance_count": delta[0],
+                "work_hours": delta[1],
+                "overtime_hours": delta[2],
+            }
+            for key, delta in sorted(daily.items(), key=_sort_key)
+            if any(delta)
+        ]
+        monthly_rows = [
+            {
+                "employee_id": key[0],
+                "month": key[1],
+                "status": key[2],
+                "attendance_count": delta[0],
+                "work_hours": delta[1],
+                "overtime_hours": delta[2],
+            }
+            for key, delta in sorted(monthly.items(), key=_sort_key)
+            if any(delta)
+        ]
+
+        await self._upsert_delta(
+            AttendanceDailyStat, "uq_attendance_daily_stats_key", daily_rows
+        )
+        await self._upsert_delta(
+            AttendanceMonthlyStat, "uq_attendance_monthly_stats_key", monthly_rows
+        )
+
+    async def _upsert_delta(self, model, constraint: str, rows: List[dict]) -> None:
+        for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+            stmt = insert(model).values(rows[start : start + _UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint=constraint,
+                set_={
+                    "attendance_count": model.attendance_count
+                    + stmt.excluded.attendance_count,
+                    "work_hours": model.work_hours + stmt.excluded.work_hours,
+                    "overtime_hours": model.overtime_hours
+                    + stmt.excluded.overtime_hours,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt)
+
+    async def rebuild(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+    ) -> Dict[str, int]:
+        """
+        Recompute rollups from attendances (ReconcileAttendanceStatsJob only;
+        writes keep the rollups current through apply()).
+
+        Daily rows are rebuilt for every org unit on [start_date, end_date];
+        monthly rows for every month overlapping the range, limited to
+        employee_ids when given.
+
+        Returns:
+            {"daily_rows": rows written, "monthly_rows": rows written}
+        """
+        await self.db.execute(
+            delete(AttendanceDailyStat).where(
+                AttendanceDailyStat.attendance_date.between(start_date, end_date)
+            )
+        )
+        daily_source = (
+            select(
+                Attendance.attendance_date,
+                Attendance.org_unit_id,
+                Attendance.status,
+                func.count(),
+                func.coalesce(func.sum(Attendance.work_hours), 0),
+                func.coalesce(func.sum(Attendance.overtime_hours), 0),
+            )
+            .where(Attendance.attendance_date.between(start_date, end_date))
+            .group_by(
+                Attendance.attendance_date, Attendance.org_unit_id, Attendance.status
+            )
+        )
+        daily_result = await self.db.execute(
+            insert(AttendanceDailyStat).from_select(
+                [
+                    AttendanceDailyStat.attendance_date,
+                    AttendanceDailyStat.org_unit_id,
+                    AttendanceDailyStat.status,
+                    AttendanceDailyStat.attendance_count,
+                    AttendanceDailyStat.work_hours,
+                    AttendanceDailyStat.overtime_hours,
+                ],
+                daily_source,
+            )
+        )
+
+        first_month = month_start(start_date)
+        last_month = month_start(end_date)
+        month_filter = [AttendanceMonthlyStat.month.between(first_month, last_month)]
+        source_filter = [
+            Attendance.attendance_date.between(first_month, month_end(end_date))
+        ]
+        if employee_ids is not None:
+            month_filter.append(AttendanceMonthlyStat.employee_id.in_(employee_ids))
+            source_filter.append(Attendance.employee_id.in_(employee_ids))
+
+        await self.db.execute(delete(AttendanceMonthlyStat).where(and_(*month_filter)))
+        month = func.date_trunc("month", Attendance.attendance_date).cast(
+            AttendanceMonthlyStat.month.type
+        )
+        monthly_source = (
+            select(
+                Attendance.employee_id,
+                month,
+                Attendance.status,
+                func.count(),
+                func.coalesce(func.sum(Attendance.work_hours), 0),
+                func.coalesce(func.sum(Attendance.overtime_hours), 0),
+            )
+            .where(and_(*source_filter))
+            .group_by(Attendance.employee_id, month, Attendance.status)
+        )
+        monthly_result = await self.db.execute(
+            insert(AttendanceMonthlyStat).from_select(
+                [
+                    AttendanceMonthlyStat.employee_id,
+                    AttendanceMonthlyStat.month,
+                    AttendanceMonthlyStat.status,
+                    AttendanceMonthlyStat.attendance_count,
+                    AttendanceMonthlyStat.work_hours,
+                    AttendanceMonthlyStat.overtime_hours,
+                ],
+                monthly_source,
+            )
+        )
+        return {
+            "daily_rows": daily_result.rowcount,
+            "monthly_rows": monthly_result.rowcount,
+        }
@@ -2,25 +2,68 @@
 Attendance Command Repository - Write operations
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from datetime import date
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    and_,
+    any_,
+    case,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.attendances.models.attendances import Attendance
+from app.modules.attendances.repositories.commands.attendance_stats_commands import (
+    FACT_COLUMNS,
+    AttendanceFacts,
+    AttendanceStatsCommands,
+)
+
+# Rows per multi-row INSERT; keeps bind params well under asyncpg's 32767 limit
+BULK_CHUNK_SIZE = 1000
 
 
 class AttendanceCommands:
-    """Write operations for Attendance"""
+    """
+    Write operations for Attendance.
+
+    Every write also maintains the attendance rollups in the same
+    transaction by applying deltas for exactly the rows it changed: old
+    values come from the object history or from rows locked FOR UPDATE
+    before a set-based write, new values from RETURNING (see
+    AttendanceStatsCommands.apply).
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.stats = AttendanceStatsCommands(db)
 
     async def create(self, attendance: Attendance) -> Attendance:
         self.db.add(attendance)
+        await self.db.flush()
+        await self.stats.apply(new=[AttendanceFacts.current(attendance)])
         await self.db.commit()
         await self.db.refresh(attendance)
         return attendance
 
     async def update(self, attendance: Attendance) -> Attendance:
+        old = AttendanceFacts.previous(attendance)
+        new = AttendanceFacts.current(attendance)
+        if old != new:
+            await self.stats.apply(
+                old=[old] if old else [],
+                new=[new],
+            )
         await self.db.commit()
         await self.db.refresh(attendance)
         return attendance
@@ -33,6 +76,319 @@ class AttendanceCommands:
         if not attendance:
             return False
 
+        await self.stats.apply(old=[AttendanceFacts.current(attendance)])
         await self.db.delete(attendance)
         await self.db.commit()
         return True
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        on_conflict: Optional[Sequence[str]] = None,
+        on_conflict_set: Optional[Mapping[str, Any]] = None,
+        on_conflict_where=None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> Dict[str, int]:
+        """
+        Insert banyak attendance sekaligus, upsert pada (employee_id, attendance_date).
+
+        Rows dikirim sebagai multi-row INSERT ... ON CONFLICT ON CONSTRAINT
+        uq_attendance_employee_date per chunk, semuanya dalam satu transaksi.
+
+        Args:
+            rows: Dict kolom Attendance per row (semua row harus punya key sama)
+            on_conflict: Kolom yang di-update dari EXCLUDED saat konflik;
+                None dan tanpa on_conflict_set = DO NOTHING
+            on_conflict_set: Nilai tambahan untuk DO UPDATE SET (mis. updated_by)
+            on_conflict_where: Kondisi DO UPDATE ... WHERE; row yang tidak
+                memenuhi tidak di-update
+            chunk_size: Jumlah row per statement
+
+        Returns:
+            {"created": rows inserted, "updated": rows updated}
+        """
+        created = 0
+        updated = 0
+        if not rows:
+            return {"created": created, "updated": updated}
+
+        old_facts: List[AttendanceFacts] = []
+        new_facts: List[AttendanceFacts] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = list(rows[start : start + chunk_size])
+            # Nilai lama untuk delta rollup; row dikunci sampai commit
+            existing = await self.db.execute(
+                select(*FACT_COLUMNS)
+                .where(
+                    tuple_(Attendance.employee_id, Attendance.attendance_date).in_(
+                        [(row["employee_id"], row["attendance_date"]) for row in chunk]
+                    )
+                )
+                .with_for_update()
+            )
+            previous = {
+                (facts.employee_id, facts.attendance_date): facts
+                for facts in map(AttendanceFacts.from_row, existing.all())
+            }
+
+            stmt = insert(Attendance).values(chunk)
+
+            set_: Dict[str, Any] = {
+                column: stmt.excluded[column] for column in (on_conflict or ())
+            }
+            set_.update(on_conflict_set or {})
+            if set_:
+                set_["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_attendance_employee_date",
+                    set_=set_,
+                    where=on_conflict_where,
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(
+                    constraint="uq_attendance_employee_date"
+                )
+
+            # xmax = 0 only for freshly inserted tuples
+            stmt = stmt.returning(
+                literal_column("(xmax = 0)").label("inserted"), *FACT_COLUMNS
+            )
+            result = await self.db.execute(stmt)
+            for row in result.all():
+                facts = AttendanceFacts.from_row(row)
+                new_facts.append(facts)
+                if row.inserted:
+                    created += 1
+                    continue
+                updated += 1
+                old = previous.get((facts.employee_id, facts.attendance_date))
+                if old is not None:
+                    old_facts.append(old)
+
+        await self.stats.apply(old=old_facts, new=new_facts)
+        await self.db.commit()
+        return {"created": created, "updated": updated}
+
+    async def bulk_update_status(
+        self,
+        filters: List[Any],
+        new_status: str,
+        values: Optional[Mapping[str, Any]] = None,
+    ) -> int:
+        """
+        Set status untuk semua attendance yang cocok dengan filters.
+
+        Args:
+            filters: Kondisi WHERE (SQLAlchemy expressions, digabung AND)
+            new_status: Status baru
+            values: Kolom tambahan yang ikut di-set (mis. updated_by)
+
+        Returns:
+            Jumlah row yang di-update
+        """
+        # Kunci row target dulu untuk nilai lama (delta rollup)
+        locked = await self.db.execute(
+            select(Attendance.id, *FACT_COLUMNS)
+            .where(and_(*filters))
+            .with_for_update()
+        )
+        previous = {row.id: AttendanceFacts.from_row(row) for row in locked.all()}
+        if not previous:
+            await self.db.commit()
+            return 0
+
+        stmt = (
+            update(Attendance)
+            # Satu bind array (bukan satu bind per id)
+            .where(Attendance.id == any_(literal(list(previous), ARRAY(Integer))))
+            .values(status=new_status, updated_at=func.now(), **(values or {}))
+            .returning(Attendance.id, *FACT_COLUMNS)
+        )
+        result = await self.db.execute(stmt)
+        updated_rows = result.all()
+        await self.stats.apply(
+            old=[previous[row.id] for row in updated_rows],
+            new=[AttendanceFacts.from_row(row) for row in updated_rows],
+        )
+        await self.db.commit()
+        return len(updated_rows)
+
+    async def create_daily_for_active_employees(
+        self, attendance_date: date, on_site_only: bool = False
+    ) -> Dict[str, int]:
+        """
+        Generate attendance rows for every active employee in one statement.
+
+        INSERT ... SELECT ... ON CONFLICT (employee_id, attendance_date) DO
+        NOTHING, with status computed in SQL:
+        - "leave" jika ada leave request yang mencakup attendance_date
+        - "hybrid" untuk employee dengan site hybrid
+        - "absent" selain itu
+        Employee di org unit Direktorat di-skip; jika on_site_only, hanya
+        employee dengan site on_site yang dibuatkan.
+
+        Returns:
+            {"total": active employees, "created": rows inserted}
+        """
+        from app.modules.employees.models.employee import Employee
+        from app.modules.org_units.models.org_unit import OrgUnit
+        from app.modules.leave_requests.models.leave_request import LeaveRequest
+        from app.core.enums.org_unit import OrgUnitType
+
+        active = (
+            select(
+                Employee.id.label("employee_id"),
+                Employee.org_unit_id.label("org_unit_id"),
+                Employee.site.label("site"),
+                OrgUnit.type.label("org_unit_type"),
+            )
+            .select_from(Employee)
+            .outerjoin(OrgUnit, OrgUnit.id == Employee.org_unit_id)
+            .where(Employee.is_active.is_(True), Employee.deleted_at.is_(None))
+            .cte("active_employees")
+        )
+
+        on_leave = exists().where(
+            and_(
+                LeaveRequest.employee_id == active.c.employee_id,
+                LeaveRequest.start_date <= attendance_date,
+                LeaveRequest.end_date >= attendance_date,
+            )
+        )
+        status = case(
+            (on_leave, literal("leave")),
+            (active.c.site == "hybrid", literal("hybrid")),
+            else_=literal("absent"),
+        )
+
+        eligible = select(
+            active.c.employee_id,
+            active.c.org_unit_id,
+            literal(attendance_date).label("attendance_date"),
+            status.label("status"),
+            func.now().label("created_at"),
+            func.now().label("updated_at"),
+        ).where(
+            or_(
+                active.c.org_unit_type.is_(None),
+                active.c.org_unit_type != OrgUnitType.DIREKTORAT.value,
+            )
+        )
+        if on_site_only:
+            eligible = eligible.where(active.c.site == "on_site")
+
+        inserted = (
+            insert(Attendance)
+            .from_select(
+                [
+                    Attendance.employee_id,
+                    Attendance.org_unit_id,
+                    Attendance.attendance_date,
+                    Attendance.status,
+                    Attendance.created_at,
+                    Attendance.updated_at,
+                ],
+                eligible,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Attendance.employee_id, Attendance.attendance_date]
+            )
+            .returning(*FACT_COLUMNS)
+            .cte("inserted")
+        )
+
+        # Row baru dikembalikan untuk delta rollup; total ikut di setiap row
+        total = select(func.count()).select_from(active).scalar_subquery()
+        result = await self.db.execute(
+            select(total.label("total"), *inserted.c).select_from(inserted)
+        )
+        created_rows = result.all()
+        if created_rows:
+            await self.stats.apply(
+                new=[AttendanceFacts.from_row(row) for row in created_rows]
+            )
+            total_count = created_rows[0].total
+        else:
+            total_count = (
+                await self.db.execute(select(func.count()).select_from(active))
+            ).scalar_one()
+        await self.db.commit()
+        return {"total": total_count, "created": len(created_rows)}
+
+    async def mark_invalid_no_checkout(self, attendance_date: date) -> Dict[str, int]:
+        """
+        Mark attendance yang check-in tanpa check-out sebagai "invalid".
+
+        Satu statement: CTE kandidat (attendances LEFT JOIN employees LEFT JOIN
+        org_units) lalu UPDATE ... FROM kandidat ... RETURNING id. Attendance
+        dengan status invalid/leave tidak ikut kandidat; employee di org unit
+        Direktorat dihitung sebagai skipped dan tidak di-update.
+
+        Returns:
+            {"total_found": kandidat, "updated": rows updated,
+             "skipped": kandidat Direktorat}
+        """
+        from app.modules.employees.models.employee import Employee
+        from app.modules.org_units.models.org_unit import OrgUnit
+        from app.core.enums.org_unit import OrgUnitType
+
+        candidates = (
+            select(
+                Attendance.id.label("id"),
+                Attendance.status.label("old_status"),
+                OrgUnit.type.label("org_unit_type"),
+            )
+            .select_from(Attendance)
+            .outerjoin(Employee, Employee.id == Attendance.employee_id)
+            .outerjoin(OrgUnit, OrgUnit.id == Employee.org_unit_id)
+            .where(
+                Attendance.attendance_date == attendance_date,
+                Attendance.check_in_time.isnot(None),
+                Attendance.check_out_time.is_(None),
+                Attendance.status.notin_(["invalid", "leave"]),
+            )
+            # Status lama yang dikunci = status yang benar-benar diganti
+            .with_for_update(of=Attendance)
+            .cte("candidates")
+        )
+
+        updated = (
+            update(Attendance)
+            .where(
+                Attendance.id == candidates.c.id,
+                or_(
+                    candidates.c.org_unit_type.is_(None),
+                    candidates.c.org_unit_type != OrgUnitType.DIREKTORAT.value,
+                ),
+            )
+            .values(status="invalid", updated_at=func.now())
+            .returning(candidates.c.old_status, *FACT_COLUMNS)
+            .cte("updated")
+        )
+
+        total_found = select(func.count()).select_from(candidates).scalar_subquery()
+        # Row yang di-update dikembalikan untuk delta rollup
+        result = await self.db.execute(
+            select(total_found.label("total_found"), *updated.c).select_from(updated)
+        )
+        updated_rows = result.all()
+        if updated_rows:
+            new_facts = [AttendanceFacts.from_row(row) for row in updated_rows]
+            await self.stats.apply(
+                old=[
+                    facts._replace(status=row.old_status)
+                    for facts, row in zip(new_facts, updated_rows)
+                ],
+                new=new_facts,
+            )
+            found = updated_rows[0].total_found
+        else:
+            found = (
+                await self.db.execute(select(func.count()).select_from(candidates))
+            ).scalar_one()
+        await self.db.commit()
+        return {
+            "total_found": found,
+            "updated": len(updated_rows),
+            "skipped": found - len(updated_rows),
+        }
@@ -1,3 +1,6 @@
 from app.modules.attendances.repositories.queries.attendances_queries import AttendanceQueries
+from app.modules.attendances.repositories.queries.attendance_stats_queries import (
+    AttendanceStatsQueries,
+)
 
-__all__ = ["AttendanceQueries"]
+__all__ = ["AttendanceQueries", "AttendanceStatsQueries"]
@@ -0,0 +1,74 @@
+"""
+Attendance Stats Query Repository - Reads from the attendance rollup tables
+"""
+
+from typing import Any, Dict, List
+from datetime import date
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.attendances.models.attendance_stats import AttendanceMonthlyStat
+
+# Status yang berarti employee sudah check-in
+CHECKED_IN_STATUSES = ("present", "invalid")
+
+
+class AttendanceStatsQueries:
+    """Read operations for attendance_daily_stats / attendance_monthly_stats"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def aggregate_by_employee_months(
+        self,
+        employee_ids: List[int],
+        first_month: date,
+        last_month: date,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Rekap per employee untuk bulan-bulan penuh [first_month, last_month].
+
+        Shape sama dengan AttendanceQueries.aggregate_by_employee.
+        """
+        if not employee_ids:
+            return {}
+
+        def count_status(status: str):
+            return func.coalesce(
+                func.sum(AttendanceMonthlyStat.attendance_count).filter(
+                    AttendanceMonthlyStat.status == status
+                ),
+                0,
+            )
+
+        result = await self.db.execute(
+            select(
+                AttendanceMonthlyStat.employee_id,
+                count_status("present").label("total_present"),
+                count_status("absent").label("total_absent"),
+                count_status("leave").label("total_leave"),
+                count_status("hybrid").label("total_hybrid"),
+                func.sum(AttendanceMonthlyStat.work_hours).label("total_work_hours"),
+                func.sum(AttendanceMonthlyStat.overtime_hours).label(
+                    "total_overtime_hours"
+                ),
+            )
+            .where(
+                and_(
+                    AttendanceMonthlyStat.employee_id.in_(employee_ids),
+                    AttendanceMonthlyStat.month.between(first_month, last_month),
+                )
+            )
+            .group_by(AttendanceMonthlyStat.employee_id)
+        )
+        return {
+            row.employee_id: {
+                "total_present": int(row.total_present),
+                "total_absent": int(row.total_absent),
+                "total_leave": int(row.total_leave),
+                "total_hybrid": int(row.total_hybrid),
+                "total_work_hours": row.total_work_hours,
+                "total_overtime_hours": row.total_overtime_hours,
+            }
+            for row in result.all()
+        }
@@ -2,12 +2,25 @@
 Attendance Query Repository - Read operations
 """
 
-from typing import Optional, List, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
 from datetime import date
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.repositories.counting import fetch_page
+from app.core.repositories.keyset import (
+    build_next_cursor,
+    decode_cursor,
+    keyset_condition,
+)
+from app.core.utils.datetime import month_end, month_start
 from app.modules.attendances.models.attendances import Attendance
+from app.modules.attendances.repositories.queries.attendance_stats_queries import (
+    AttendanceStatsQueries,
+)
+
+# Stable sort key for list pages: newest check-in first, NULLs last, id tiebreak
+_LIST_SORT_COLUMNS = (Attendance.check_in_time, Attendance.id)
 
 
 class AttendanceQueries:
@@ -16,6 +29,24 @@ class AttendanceQueries:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def _paginate(self, query, skip: int, limit: int, cursor: Optional[str]):
+        """Apply list ordering plus OFFSET (page mode) or keyset (cursor mode)."""
+        if cursor:
+            values = decode_cursor(cursor, _LIST_SORT_COLUMNS)
+            query = query.where(
+                keyset_condition(_LIST_SORT_COLUMNS, values, nulls_last=True)
+            )
+        else:
+            query = query.offset(skip)
+        return query.order_by(
+            Attendance.check_in_time.desc().nulls_last(), Attendance.id.desc()
+        ).limit(limit)
+
+    @staticmethod
+    def next_cursor(items: List, limit: int) -> Optional[str]:
+        """Cursor for the page after `items` (Attendance or list responses)."""
+        return build_next_cursor(items, limit, lambda a: (a.check_in_time, a.id))
+
     async def get_by_id(self, attendance_id: int) -> Optional[Attendance]:
         result = await self.db.execute(
             select(Attendance).where(Attendance.id == attendance_id)
@@ -70,7 +101,9 @@ class AttendanceQueries:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[Attendance], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Attendance], Optional[int]]:
         query = select(Attendance).where(Attendance.employee_id.in_(employee_ids))
         if start_date:
             query = query.where(Attendance.attendance_date >= start_date)
@@ -79,18 +112,13 @@ class AttendanceQueries:
         if status:
             query = query.where(Attendance.status == status)
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = (
-            query.order_by(Attendance.check_in_time.desc().nulls_last()).offset(skip).limit(limit)
+        return await fetch_page(
+            self.db,
+            query,
+            self._paginate(query, skip, limit, cursor),
+            include_total=include_total,
+            window_total=cursor is None,
         )
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
 
     async def list_by_org_unit(
         self,
@@ -100,7 +128,9 @@ class AttendanceQueries:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[Attendance], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Attendance], Optional[int]]:
         query = select(Attendance).where(Attendance.org_unit_id == org_unit_id)
         if start_date:
             query = query.where(Attendance.attendance_date >= start_date)
@@ -109,18 +139,13 @@ class AttendanceQueries:
         if status:
             query = query.where(Attendance.status == status)
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = (
-            query.order_by(Attendance.check_in_time.desc().nulls_last()).offset(skip).limit(limit)
+        return await fetch_page(
+            self.db,
+            query,
+            self._paginate(query, skip, limit, cursor),
+            include_total=include_total,
+            window_total=cursor is None,
         )
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
 
     async def list_all(
         self,
@@ -131,7 +156,9 @@ class AttendanceQueries:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[Attendance], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Attendance], Optional[int]]:
         query = select(Attendance)
         if employee_ids:
             query = query.where(Attendance.employee_id.in_(employee_ids))
@@ -144,18 +171,16 @@ class AttendanceQueries:
         if status:
             query = query.where(Attendance.status == status)
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = (
-            query.order_by(Attendance.check_in_time.desc().nulls_last()).offset(skip).limit(limit)
+        return await fetch_page(
+            self.db,
+            query,
+            self._paginate(query, skip, limit, cursor),
+            include_total=include_total,
+            window_total=cursor is None,
+            estimate_table=(
+                Attendance.__tablename__ if query.whereclause is None else None
+            ),
         )
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
 
     async def get_report_by_org_unit(
         self,
@@ -177,6 +202,43 @@ class AttendanceQueries:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def stream_report_by_org_unit(
+        self,
+        org_unit_id: int,
+        start_date: date,
+        end_date: date,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream attendance report rows via server-side cursor (yield_per).
+
+        Hanya kolom yang dibutuhkan report (tanpa joined employee/org_unit),
+        urut per employee lalu tanggal agar bisa di-group sambil jalan.
+        """
+        query = (
+            select(
+                Attendance.employee_id,
+                Attendance.attendance_date,
+                Attendance.status,
+                Attendance.check_in_time,
+                Attendance.check_out_time,
+                Attendance.work_hours,
+                Attendance.overtime_hours,
+            )
+            .where(
+                and_(
+                    Attendance.org_unit_id == org_unit_id,
+                    Attendance.attendance_date >= start_date,
+                    Attendance.attendance_date <= end_date,
+                )
+            )
+            .order_by(Attendance.employee_id, Attendance.attendance_date)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(query)
+        async for row in result:
+            yield row
+
     async def get_by_employee_ids(
         self,
         employee_ids: List[int],
@@ -198,3 +260,60 @@ class AttendanceQueries:
         )
         result = await self.db.execute(query)
         return list(result.scalars().all())
+
+    async def aggregate_by_employee(
+        self,
+        employee_ids: List[int],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Rekap attendance per employee dalam rentang tanggal, dihitung di database.
+
+        Satu row per employee (COUNT(*) FILTER per status, SUM jam kerja);
+        employee tanpa attendance tidak ada di hasil. Jika rentang tepat
+        bulan penuh, dibaca dari rollup attendance_monthly_stats.
+
+        Returns:
+            {employee_id: {"total_present", "total_absent", "total_leave",
+             "total_hybrid", "total_work_hours", "total_overtime_hours"}}
+        """
+        if not employee_ids:
+            return {}
+
+        if start_date == month_start(start_date) and end_date == month_end(end_date):
+            return await AttendanceStatsQueries(self.db).aggregate_by_employee_months(
+                employee_ids, start_date, month_start(end_date)
+            )
+
+        def count_status(status: str):
+            return func.count().filter(Attendance.status == status)
+
+        query = (
+            select(
+                Attendance.employee_id,
+                count_status("present").label("total_present"),
+                count_status("absent").label("total_absent"),
+                count_status("leave").label("total_leave"),
+                count_status("hybrid").label("total_hybrid"),
+                func.coalesce(func.sum(Attendance.work_hours), 0).label(
+                    "total_work_hours"
+                ),
+                func.coalesce(func.sum(Attendance.overtime_hours), 0).label(
+                    "total_overtime_hours"
+                ),
+            )
+            .where(
+                and_(
+                    Attendance.employee_id.in_(employee_ids),
+                    Attendance.attendance_date >= start_date,
+                    Attendance.attendance_date <= end_date,
+                )
+            )
+            .group_by(Attendance.employee_id)
+        )
+        result = await self.db.execute(query)
+        return {
+            row["employee_id"]: {k: v for k, v in row.items() if k != "employee_id"}
+            for row in result.mappings().all()
+        }
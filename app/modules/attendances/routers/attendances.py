@@ -1,6 +1,7 @@
 from typing import Optional
 from datetime import date
 from fastapi import APIRouter, Depends, UploadFile, File, Form, Request, Query
+from fastapi.responses import StreamingResponse
 from app.modules.attendances.dependencies import AttendanceServiceDep
 from app.modules.attendances.schemas.requests import (
     CheckInRequest,
@@ -26,6 +27,7 @@ from app.core.schemas import (
     create_paginated_response,
 )
 from app.core.exceptions import UnprocessableEntityException
+from app.core.utils.tabular_export import ExportFormat
 
 router = APIRouter(prefix="/attendances", tags=["Attendances"])
 
@@ -130,6 +132,42 @@ async def get_attendance_report(
     )
 
 
+@router.get("/reports/export", response_class=StreamingResponse)
+@require_permission("attendance:export")
+async def export_attendance_report(
+    service: AttendanceServiceDep,
+    org_unit_id: int = Query(..., gt=0, description="ID org unit (WAJIB)"),
+    start_date: date = Query(..., description="Tanggal mulai (WAJIB)"),
+    end_date: date = Query(..., description="Tanggal akhir (WAJIB)"),
+    export_format: str = Query(
+        ExportFormat.XLSX,
+        alias="format",
+        pattern=f"^({'|'.join(ExportFormat.ALL)})$",
+        description="Format file: xlsx atau csv",
+    ),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Download attendance report untuk org unit tertentu dalam date range.
+
+    File di-stream langsung dari database (satu row per employee per hari
+    kerja), sehingga aman untuk unit besar dan rentang tanggal panjang.
+
+    **Permission required**: attendance:export
+    """
+    filename, media_type, body = await service.export_attendance_report(
+        org_unit_id=org_unit_id,
+        start_date=start_date,
+        end_date=end_date,
+        export_format=export_format,
+    )
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/overview", response_model=PaginatedResponse[EmployeeAttendanceOverview])
 @require_permission("attendance:read_all")
 async def get_attendance_overview(
@@ -254,6 +292,14 @@ async def get_team_attendance(
     ),
     page: int = Query(1, ge=1, description="Nomor halaman"),
     limit: int = Query(10, ge=1, le=250, description="Jumlah item per halaman"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[AttendanceListResponse]:
     """
     Ambil attendance team/subordinates (untuk org unit head).
@@ -271,6 +317,8 @@ async def get_team_attendance(
         status=status,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return create_paginated_response(
         message="Daftar attendance team berhasil diambil",
@@ -278,6 +326,7 @@ async def get_team_attendance(
         page=pagination["page"],
         limit=pagination["limit"],
         total_items=pagination["total_items"],
+        next_cursor=pagination["next_cursor"],
     )
 
 
@@ -301,6 +350,14 @@ async def get_all_attendances(
     ),
     page: int = Query(1, ge=1, description="Nomor halaman"),
     limit: int = Query(10, ge=1, le=250, description="Jumlah item per halaman"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[AttendanceListResponse]:
     """
     Ambil semua attendance dengan berbagai filter.
@@ -317,6 +374,8 @@ async def get_all_attendances(
         status=status,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return create_paginated_response(
         message="Daftar semua attendance berhasil diambil",
@@ -324,6 +383,7 @@ async def get_all_attendances(
         page=pagination["page"],
         limit=pagination["limit"],
         total_items=pagination["total_items"],
+        next_cursor=pagination["next_cursor"],
     )
 
 
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, List
+from typing import AsyncIterator, Optional, Tuple, List
 from datetime import date
 from fastapi import UploadFile, Request
 
@@ -6,6 +6,7 @@ from app.modules.attendances.repositories import AttendanceQueries, AttendanceCo
 from app.modules.employees.repositories import EmployeeQueries
 from app.modules.leave_requests.repositories import LeaveRequestQueries
 from app.modules.holiday_calendar.repositories import HolidayQueries
+from app.core.dependencies.loaders import EntityLoaders
 from app.modules.attendances.schemas import (
     CheckInRequest,
     CheckOutRequest,
@@ -37,6 +38,9 @@ from app.modules.attendances.use_cases.get_attendance_use_case import (
 from app.modules.attendances.use_cases.get_attendance_report_use_case import (
     GetAttendanceReportUseCase,
 )
+from app.modules.attendances.use_cases.export_attendance_report_use_case import (
+    ExportAttendanceReportUseCase,
+)
 from app.modules.attendances.use_cases.get_attendance_overview_use_case import (
     GetAttendanceOverviewUseCase,
 )
@@ -61,6 +65,7 @@ class AttendanceService:
         employee_queries: EmployeeQueries,
         leave_queries: LeaveRequestQueries,
         holiday_queries: HolidayQueries,
+        loaders: EntityLoaders,
     ):
         self.queries = queries
         self.commands = commands
@@ -77,7 +82,7 @@ class AttendanceService:
         )
         self.get_my_attendance_uc = GetMyAttendanceUseCase(queries, employee_queries)
         self.get_team_attendance_uc = GetTeamAttendanceUseCase(
-            queries, employee_queries
+            queries, employee_queries, loaders
         )
         self.get_all_attendances_uc = GetAllAttendancesUseCase(
             queries, employee_queries
@@ -86,6 +91,9 @@ class AttendanceService:
         self.get_attendance_report_uc = GetAttendanceReportUseCase(
             queries, employee_queries
         )
+        self.export_attendance_report_uc = ExportAttendanceReportUseCase(
+            employee_queries
+        )
         self.get_attendance_overview_uc = GetAttendanceOverviewUseCase(
             queries, employee_queries
         )
@@ -138,9 +146,18 @@ class AttendanceService:
         status: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[AttendanceListResponse], dict]:
         return await self.get_team_attendance_uc.execute(
-            employee_id, start_date, end_date, status, page, limit
+            employee_id,
+            start_date,
+            end_date,
+            status,
+            page,
+            limit,
+            cursor,
+            include_total,
         )
 
     async def get_all_attendances(
@@ -153,9 +170,20 @@ class AttendanceService:
         status: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[AttendanceListResponse], dict]:
         return await self.get_all_attendances_uc.execute(
-            type, start_date, end_date, org_unit_id, employee_id, status, page, limit
+            type,
+            start_date,
+            end_date,
+            org_unit_id,
+            employee_id,
+            status,
+            page,
+            limit,
+            cursor,
+            include_total,
         )
 
     async def get_attendance_by_id(self, attendance_id: int) -> AttendanceResponse:
@@ -171,6 +199,17 @@ class AttendanceService:
             org_unit_id, start_date, end_date
         )
 
+    async def export_attendance_report(
+        self,
+        org_unit_id: int,
+        start_date: date,
+        end_date: date,
+        export_format: str,
+    ) -> Tuple[str, str, AsyncIterator[bytes]]:
+        return await self.export_attendance_report_uc.execute(
+            org_unit_id, start_date, end_date, export_format
+        )
+
     async def get_attendance_overview(
         self,
         org_unit_id: Optional[int],
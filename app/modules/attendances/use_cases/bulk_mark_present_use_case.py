@@ -23,71 +23,32 @@ class BulkMarkPresentUseCase:
         request: BulkMarkPresentRequest,
         created_by: "uuid.UUID",
     ) -> BulkMarkPresentSummary:
-        # Get all active employees
-        all_employees = []
-        page = 1
-        limit = 200
-
-        while True:
-            skip = (page - 1) * limit
-            employees, total = await self.employee_queries.list(
-                is_active=True, limit=limit, skip=skip
-            )
-
-            if not employees:
-                break
-
-            all_employees.extend(employees)
-
-            total_pages = (total + limit - 1) // limit if total > 0 else 0
-            if page >= total_pages:
-                break
-            page += 1
-
-        employee_data_list = [
-            {"id": e.id, "org_unit_id": e.org_unit_id} for e in all_employees
+        employees = await self.employee_queries.list_active_org_unit_ids()
+
+        rows = [
+            {
+                "employee_id": emp_id,
+                "org_unit_id": org_id,
+                "attendance_date": request.attendance_date,
+                "status": "present",
+                "check_in_notes": request.notes,
+                "created_by": created_by,
+            }
+            for emp_id, org_id in employees
         ]
 
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        for emp_data in employee_data_list:
-            emp_id = emp_data["id"]
-            org_id = emp_data["org_unit_id"]
-            try:
-                # Check existing
-                existing = await self.queries.get_by_employee_and_date(
-                    emp_id, request.attendance_date
-                )
-
-                if existing:
-                    existing.status = "present"
-                    existing.check_in_notes = request.notes
-                    existing.updated_by = created_by
-                    await self.commands.update(existing)
-                    updated_count += 1
-                else:
-                    from app.modules.attendances.models.attendances import Attendance
-
-                    attendance = Attendance(
-                        employee_id=emp_id,
-                        org_unit_id=org_id,
-                        attendance_date=request.attendance_date,
-                        status="present",
-                        check_in_notes=request.notes,
-                        created_by=created_by,
-                    )
-                    await self.commands.create(attendance)
-                    created_count += 1
-            except Exception as e:
-                await self.queries.db.rollback()
-                print(f"Error processing employee {emp_id}: {str(e)}")
-                skipped_count += 1
-                continue
+        # Existing rows (unique employee_id + attendance_date) ikut di-update
+        counts = await self.commands.bulk_upsert(
+            rows,
+            on_conflict=("status", "check_in_notes"),
+            on_conflict_set={"updated_by": created_by},
+        )
+        created_count = counts["created"]
+        updated_count = counts["updated"]
+        skipped_count = len(employees) - created_count - updated_count
 
         return BulkMarkPresentSummary(
-            total_employees=len(all_employees),
+            total_employees=len(employees),
             created=created_count,
             updated=updated_count,
             skipped=skipped_count,
@@ -6,6 +6,7 @@ from app.modules.leave_requests.repositories import LeaveRequestQueries
 from app.modules.holiday_calendar.repositories import HolidayQueries
 from app.modules.attendances.schemas import CheckInRequest, AttendanceResponse
 from app.core.exceptions import ValidationException
+from app.core.cache import dashboard_cache
 from app.core.utils.file_upload import upload_file_to_gcp, generate_signed_url_for_path
 from app.core.utils.datetime import get_utc_now
 from app.config.settings import settings
@@ -116,6 +117,8 @@ class CheckInUseCase:
         if not attendance:
             raise ValidationException("Gagal membuat atau update data attendance")
 
+        await dashboard_cache.invalidate_employee(employee_id)
+
         check_in_url = (
             generate_signed_url_for_path(attendance.check_in_selfie_path)
             if attendance.check_in_selfie_path
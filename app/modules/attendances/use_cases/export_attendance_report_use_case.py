@@ -0,0 +1,152 @@
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+from app.config.database import get_read_db_context
+from app.modules.attendances.repositories import AttendanceQueries
+from app.modules.employees.models.employee import Employee
+from app.modules.employees.repositories import EmployeeQueries
+from app.modules.attendances.utils.attendance_matrix import (
+    AttendanceMatrix,
+    WorkingCalendar,
+)
+from app.core.exceptions.client_error import BadRequestException
+from app.core.utils.tabular_export import ExportFormat, MEDIA_TYPES, stream_export
+
+REPORT_HEADER = (
+    "Kode Karyawan",
+    "Nama Karyawan",
+    "Jabatan",
+    "Unit Kerja",
+    "Tanggal",
+    "Status",
+    "Check In",
+    "Check Out",
+    "Jam Kerja",
+    "Jam Lembur",
+)
+
+_LOCAL_TZ = ZoneInfo("Asia/Jakarta")
+_EMPLOYEE_PAGE_SIZE = 200
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.astimezone(_LOCAL_TZ).strftime("%H:%M:%S")
+
+
+def _to_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class ExportAttendanceReportUseCase:
+    """
+    Export attendance report (org unit x date range) sebagai CSV/XLSX stream.
+
+    Isi sama dengan GetAttendanceReportUseCase tapi satu row per employee per
+    hari kerja, dan attendance dibaca lewat server-side cursor sehingga tidak
+    pernah dimuat sekaligus.
+    """
+
+    def __init__(self, employee_queries: EmployeeQueries):
+        self.employee_queries = employee_queries
+
+    async def execute(
+        self,
+        org_unit_id: int,
+        start_date: date,
+        end_date: date,
+        export_format: str = ExportFormat.XLSX,
+    ) -> Tuple[str, str, AsyncIterator[bytes]]:
+        """
+        Returns:
+            (filename, media_type, body iterator) untuk StreamingResponse
+        """
+        if start_date > end_date:
+            raise BadRequestException(
+                "Tanggal mulai tidak boleh lebih besar dari tanggal akhir"
+            )
+        if export_format not in ExportFormat.ALL:
+            raise BadRequestException(
+                f"Format export tidak valid. Pilihan: {', '.join(ExportFormat.ALL)}"
+            )
+
+        employees = await self._get_employees(org_unit_id)
+        calendar = WorkingCalendar(start_date, end_date)
+
+        filename = (
+            f"attendance_report_{org_unit_id}_{start_date.isoformat()}"
+            f"_{end_date.isoformat()}.{export_format}"
+        )
+        body = stream_export(
+            export_format,
+            sheet_title="Attendance",
+            header=REPORT_HEADER,
+            rows=self._iter_rows(employees, org_unit_id, calendar),
+        )
+        return filename, MEDIA_TYPES[export_format], body
+
+    async def _get_employees(self, org_unit_id: int) -> List[Employee]:
+        employees: List[Employee] = []
+        cursor = None
+        while True:
+            page, _ = await self.employee_queries.list(
+                org_unit_id=org_unit_id,
+                is_active=True,
+                limit=_EMPLOYEE_PAGE_SIZE,
+                cursor=cursor,
+                include_total=False,
+            )
+            employees.extend(page)
+            cursor = EmployeeQueries.next_cursor(page, _EMPLOYEE_PAGE_SIZE)
+            if cursor is None:
+                return employees
+
+    async def _iter_rows(
+        self,
+        employees: List[Employee],
+        org_unit_id: int,
+        calendar: WorkingCalendar,
+    ) -> AsyncIterator[List[Any]]:
+        # StreamingResponse berjalan setelah request session ditutup,
+        # jadi stream memakai session sendiri (replica jika ada)
+        async with get_read_db_context() as db:
+            attendance_rows = AttendanceQueries(db).stream_report_by_org_unit(
+                org_unit_id=org_unit_id,
+                start_date=calendar.start_date,
+                end_date=calendar.end_date,
+            )
+            pending = await anext(attendance_rows, None)
+
+            # Employees dan stream sama-sama urut employee_id
+            for employee in sorted(employees, key=lambda e: e.id):
+                employee_rows = []
+                while pending is not None and pending.employee_id <= employee.id:
+                    if pending.employee_id == employee.id:
+                        employee_rows.append(pending)
+                    pending = await anext(attendance_rows, None)
+
+                # Satu row matrix per employee: memory tidak bergantung jumlah employee
+                matrix = AttendanceMatrix(
+                    calendar, [(employee.id, employee.type)]
+                ).fill(employee_rows)
+
+                employee_info = [
+                    employee.code,
+                    employee.user.name if employee.user else None,
+                    employee.position,
+                    employee.org_unit.name if employee.org_unit else None,
+                ]
+                for day, status, check_in, check_out, work, overtime in matrix.cells(
+                    employee.id
+                ):
+                    yield employee_info + [
+                        day.isoformat(),
+                        status,
+                        _format_time(check_in),
+                        _format_time(check_out),
+                        _to_float(work),
+                        _to_float(overtime),
+                    ]
+
+            await attendance_rows.aclose()
@@ -28,6 +28,8 @@ class GetAllAttendancesUseCase:
         status: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[AttendanceListResponse], dict]:
         if type:
             start_date, end_date = get_date_range_from_type(type)
@@ -49,6 +51,8 @@ class GetAllAttendancesUseCase:
             status=status,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         attendances_data: List[AttendanceListResponse] = []
@@ -77,5 +81,6 @@ class GetAllAttendancesUseCase:
             "page": page,
             "limit": limit,
             "total_items": total_items,
+            "next_cursor": self.queries.next_cursor(attendances, limit),
         }
         return attendances_data, pagination
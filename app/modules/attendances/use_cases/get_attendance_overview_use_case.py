@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List
 from datetime import date
 from app.modules.attendances.repositories import AttendanceQueries
 from app.modules.employees.repositories import EmployeeQueries
@@ -46,41 +46,12 @@ class GetAttendanceOverviewUseCase:
             return [], pagination_dict
 
         employee_ids = [e.id for e in employees]
-        attendances = await self.queries.get_by_employee_ids(
+        attendance_summary = await self.queries.aggregate_by_employee(
             employee_ids=employee_ids,
             start_date=start_date,
             end_date=end_date,
         )
 
-        attendance_summary = {}
-        for att in attendances:
-            if att.employee_id not in attendance_summary:
-                attendance_summary[att.employee_id] = {
-                    "total_present": 0,
-                    "total_absent": 0,
-                    "total_leave": 0,
-                    "total_hybrid": 0,
-                    "total_work_hours": 0,
-                    "total_overtime_hours": 0,
-                }
-
-            summary = attendance_summary[att.employee_id]
-
-            if att.status == "present":
-                summary["total_present"] += 1
-            elif att.status == "absent":
-                summary["total_absent"] += 1
-            elif att.status == "leave":
-                summary["total_leave"] += 1
-            elif att.status == "hybrid":
-                summary["total_hybrid"] += 1
-
-            if att.work_hours:
-                summary["total_work_hours"] += float(att.work_hours)
-
-            if att.overtime_hours:
-                summary["total_overtime_hours"] += float(att.overtime_hours)
-
         overview_data = []
         for employee in employees:
             employee_id = employee.id
@@ -1,17 +1,16 @@
 from typing import List
 from datetime import date
-from decimal import Decimal
 from app.modules.attendances.repositories import AttendanceQueries
 from app.modules.employees.repositories import EmployeeQueries
 from app.modules.attendances.schemas import (
     EmployeeAttendanceReport,
     AttendanceRecordInReport,
 )
-from app.modules.attendances.schemas.shared import AttendanceStatus
-from app.core.exceptions.client_error import BadRequestException
-from app.core.utils.workforce import (
-    generate_working_days_list as generate_working_days_for_employee,
+from app.modules.attendances.utils.attendance_matrix import (
+    AttendanceMatrix,
+    WorkingCalendar,
 )
+from app.core.exceptions.client_error import BadRequestException
 
 
 class GetAttendanceReportUseCase:
@@ -67,54 +66,27 @@ class GetAttendanceReportUseCase:
             end_date=end_date,
         )
 
-        attendance_by_employee_date = {}
-        for att in attendances:
-            if att.employee_id not in attendance_by_employee_date:
-                attendance_by_employee_date[att.employee_id] = {}
-            attendance_by_employee_date[att.employee_id][att.attendance_date] = att
+        calendar = WorkingCalendar(start_date, end_date)
+        matrix = AttendanceMatrix(
+            calendar, [(employee.id, employee.type) for employee in all_employees]
+        ).fill(attendances)
 
         report_data = []
         for employee in all_employees:
-            # Generate working days
-            employee_working_days = generate_working_days_for_employee(
-                start_date, end_date, employee.type
-            )
-
-            employee_att_dict = attendance_by_employee_date.get(employee.id, {})
-
-            employee_attendances = []
-            total_present_days = 0
-            total_work_hours = 0.0
-            total_overtime_hours = 0.0
-
-            for working_day in employee_working_days:
-                if working_day in employee_att_dict:
-                    att = employee_att_dict[working_day]
-                    record = AttendanceRecordInReport(
-                        attendance_date=att.attendance_date,
-                        status=att.status,
-                        check_in_time=att.check_in_time,
-                        check_out_time=att.check_out_time,
-                        work_hours=att.work_hours,
-                        overtime_hours=att.overtime_hours,
-                    )
-
-                    if att.status in ["present", "hybrid"]:
-                        total_present_days += 1
-                    if att.work_hours:
-                        total_work_hours += float(att.work_hours)
-                    if att.overtime_hours:
-                        total_overtime_hours += float(att.overtime_hours)
-                else:
-                    record = AttendanceRecordInReport(
-                        attendance_date=working_day,
-                        status=AttendanceStatus.ABSENT,
-                        check_in_time=None,
-                        check_out_time=None,
-                        work_hours=None,
-                        overtime_hours=None,
-                    )
-                employee_attendances.append(record)
+            employee_attendances = [
+                AttendanceRecordInReport(
+                    attendance_date=day,
+                    status=status,
+                    check_in_time=check_in,
+                    check_out_time=check_out,
+                    work_hours=work_hours,
+                    overtime_hours=overtime_hours,
+                )
+                for day, status, check_in, check_out, work_hours, overtime_hours in (
+                    matrix.cells(employee.id)
+                )
+            ]
+            totals = matrix.totals(employee.id)
 
             org_unit_name = employee.org_unit.name if employee.org_unit else None
 
@@ -127,13 +99,9 @@ class GetAttendanceReportUseCase:
                 org_unit_id=employee.org_unit_id,
                 org_unit_name=org_unit_name,
                 attendances=employee_attendances,
-                total_present_days=total_present_days,
-                total_work_hours=(
-                    Decimal(str(total_work_hours)) if total_work_hours else None
-                ),
-                total_overtime_hours=(
-                    Decimal(str(total_overtime_hours)) if total_overtime_hours else None
-                ),
+                total_present_days=totals.present_days,
+                total_work_hours=totals.work_hours,
+                total_overtime_hours=totals.overtime_hours,
             )
             report_data.append(employee_report)
 
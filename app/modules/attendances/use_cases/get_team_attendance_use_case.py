@@ -2,6 +2,8 @@ from typing import Optional, Tuple, List
 from datetime import date
 from app.modules.attendances.repositories import AttendanceQueries
 from app.modules.employees.repositories import EmployeeQueries
+from app.modules.employees.utils.reporting_tree import ReportingTreeUtil
+from app.core.dependencies.loaders import EntityLoaders
 from app.modules.attendances.schemas import AttendanceListResponse
 from app.core.utils.file_upload import generate_signed_url_for_path
 
@@ -11,18 +13,17 @@ class GetTeamAttendanceUseCase:
         self,
         queries: AttendanceQueries,
         employee_queries: EmployeeQueries,
+        loaders: EntityLoaders,
     ):
         self.queries = queries
         self.employee_queries = employee_queries
+        self.loaders = loaders
 
     async def _get_all_subordinates(self, employee_id: int) -> List[int]:
         """Get all subordinate IDs recursively"""
-        all_subordinates_ids = []
-        subordinates = await self.employee_queries.get_subordinates(
-            employee_id, recursive=True
+        return await ReportingTreeUtil.get_subordinate_ids(
+            self.employee_queries, employee_id
         )
-        all_subordinates_ids = [e.id for e in subordinates]
-        return all_subordinates_ids
 
     async def execute(
         self,
@@ -32,6 +33,8 @@ class GetTeamAttendanceUseCase:
         status: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[AttendanceListResponse], dict]:
         subordinate_ids = await self._get_all_subordinates(employee_id)
 
@@ -40,17 +43,29 @@ class GetTeamAttendanceUseCase:
                 "page": page,
                 "limit": limit,
                 "total_items": 0,
+                "next_cursor": None,
             }
 
         skip = (page - 1) * limit
         attendances, total_items = await self.queries.list_by_employees(
-            subordinate_ids, start_date, end_date, status, skip, limit
+            subordinate_ids,
+            start_date,
+            end_date,
+            status,
+            skip,
+            limit,
+            cursor,
+            include_total,
+        )
+
+        # Satu query untuk semua employee di halaman ini
+        employees = await self.loaders.employees.load_many(
+            att.employee_id for att in attendances
         )
 
         attendances_data: List[AttendanceListResponse] = []
 
-        for att in attendances:
-            employee = await self.employee_queries.get_by_id(att.employee_id)
+        for att, employee in zip(attendances, employees):
             employee_name = employee.user.name if employee and employee.user else None
             employee_code = employee.code if employee else None
             org_unit_name = (
@@ -74,5 +89,6 @@ class GetTeamAttendanceUseCase:
             "page": page,
             "limit": limit,
             "total_items": total_items,
+            "next_cursor": self.queries.next_cursor(attendances, limit),
         }
         return attendances_data, pagination
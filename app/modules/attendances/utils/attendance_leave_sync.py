@@ -12,7 +12,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.attendances.models.attendances import Attendance
-from app.modules.attendances.repositories import AttendanceQueries, AttendanceCommands
+from app.modules.attendances.repositories import AttendanceCommands
 
 
 logger = logging.getLogger(__name__)
@@ -39,47 +39,31 @@ async def sync_attendances_to_leave(
     Returns:
         Number of attendance records updated/created
     """
-    queries = AttendanceQueries(db)
     commands = AttendanceCommands(db)
-    
-    synced_count = 0
+
+    rows = []
     current_date = start_date
-    
     while current_date <= end_date:
         # Skip weekends (Sunday = 6)
         if current_date.weekday() != 6:
-            attendance = await queries.get_by_employee_and_date(
-                employee_id=employee_id,
-                attendance_date=current_date,
+            rows.append(
+                {
+                    "employee_id": employee_id,
+                    "org_unit_id": org_unit_id,
+                    "attendance_date": current_date,
+                    "status": "leave",
+                }
             )
-            
-            if attendance:
-                # Update existing attendance to 'leave'
-                if attendance.status != "leave":
-                    attendance.status = "leave"
-                    await commands.update(attendance)
-                    synced_count += 1
-                    logger.debug(
-                        f"Updated attendance for employee_id={employee_id}, "
-                        f"date={current_date} to status='leave'"
-                    )
-            else:
-                # Create new attendance with status='leave'
-                new_attendance = Attendance(
-                    employee_id=employee_id,
-                    org_unit_id=org_unit_id,
-                    attendance_date=current_date,
-                    status="leave",
-                )
-                await commands.create(new_attendance)
-                synced_count += 1
-                logger.debug(
-                    f"Created attendance for employee_id={employee_id}, "
-                    f"date={current_date} with status='leave'"
-                )
-        
         current_date += timedelta(days=1)
-    
+
+    # Create missing rows, flip existing ones to 'leave' (skip if already leave)
+    counts = await commands.bulk_upsert(
+        rows,
+        on_conflict=("status",),
+        on_conflict_where=Attendance.status != "leave",
+    )
+    synced_count = counts["created"] + counts["updated"]
+
     logger.info(
         f"Synced {synced_count} attendance records to 'leave' for "
         f"employee_id={employee_id}, range={start_date} to {end_date}"
@@ -107,31 +91,21 @@ async def revert_attendances_from_leave(
     Returns:
         Number of attendance records reverted
     """
-    queries = AttendanceQueries(db)
     commands = AttendanceCommands(db)
-    
-    reverted_count = 0
-    current_date = start_date
-    
-    while current_date <= end_date:
-        attendance = await queries.get_by_employee_and_date(
-            employee_id=employee_id,
-            attendance_date=current_date,
-        )
-        
-        if attendance and attendance.status == "leave":
-            # Only revert if no actual check-in/check-out data
-            if not attendance.check_in_time and not attendance.check_out_time:
-                attendance.status = "absent"
-                await commands.update(attendance)
-                reverted_count += 1
-                logger.debug(
-                    f"Reverted attendance for employee_id={employee_id}, "
-                    f"date={current_date} from 'leave' to 'absent'"
-                )
-        
-        current_date += timedelta(days=1)
-    
+
+    # Only revert if no actual check-in/check-out data
+    reverted_count = await commands.bulk_update_status(
+        [
+            Attendance.employee_id == employee_id,
+            Attendance.attendance_date >= start_date,
+            Attendance.attendance_date <= end_date,
+            Attendance.status == "leave",
+            Attendance.check_in_time.is_(None),
+            Attendance.check_out_time.is_(None),
+        ],
+        "absent",
+    )
+
     logger.info(
         f"Reverted {reverted_count} attendance records from 'leave' for "
         f"employee_id={employee_id}, range={start_date} to {end_date}"
@@ -0,0 +1,271 @@
+"""
+Attendance Matrix Engine
+
+Builds the employee x day attendance matrix used by reports and dashboard
+widgets as NumPy arrays instead of one object per cell:
+- status codes: uint8 matrix (employees x days)
+- work/overtime hours: float64 matrices of the same shape
+- working-day masks: one boolean vector per employee type, from the weekly
+  pattern of is_working_day (and optional holidays), stacked per employee
+
+Per-employee totals are reductions along the day axis over the masked
+matrices, computed for all employees at once.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.utils.workforce import is_working_day
+
+# Status codes stored in the matrix; 0 = no attendance row for that day
+NO_RECORD = 0
+STATUS_CODES: Dict[str, int] = {
+    "present": 1,
+    "absent": 2,
+    "leave": 3,
+    "hybrid": 4,
+    "invalid": 5,
+}
+STATUS_NAMES: Dict[int, str] = {code: name for name, code in STATUS_CODES.items()}
+# Unknown status -> NO_RECORD
+_STATUS_LOOKUP = defaultdict(lambda: NO_RECORD, STATUS_CODES)
+
+# Status yang dihitung sebagai hadir di report
+PRESENT_CODES = (STATUS_CODES["present"], STATUS_CODES["hybrid"])
+
+
+class WorkingCalendar:
+    """
+    Working days in a date range, per employee type.
+
+    Holidays are optional: the dashboard excludes them from its work-day
+    count, reports pass none (a holiday is still a working day there).
+    Masks are boolean vectors indexed by day offset from start_date and
+    cached per employee type.
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        holidays: Iterable[date] = (),
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.size = max((end_date - start_date).days + 1, 0)
+        self.days: List[date] = [
+            start_date + timedelta(days=i) for i in range(self.size)
+        ]
+        self.columns: Dict[date, int] = {day: i for i, day in enumerate(self.days)}
+
+        offsets = np.arange(self.size)
+        # Posisi tiap hari dalam pola mingguan yang dimulai dari start_date
+        self._week_index = offsets % 7
+        holiday_offsets = np.fromiter(
+            (
+                (day - start_date).days
+                for day in set(holidays)
+                if start_date <= day <= end_date
+            ),
+            dtype=np.int64,
+        )
+        self.holiday_mask = np.isin(offsets, holiday_offsets)
+        self._masks: Dict[Optional[str], np.ndarray] = {}
+
+    def mask(self, employee_type: Optional[str]) -> np.ndarray:
+        """True for working days of this employee type that are not holidays."""
+        mask = self._masks.get(employee_type)
+        if mask is None:
+            week = np.array(
+                [
+                    is_working_day(self.start_date + timedelta(days=i), employee_type)
+                    for i in range(7)
+                ],
+                dtype=bool,
+            )
+            mask = week[self._week_index] & ~self.holiday_mask
+            self._masks[employee_type] = mask
+        return mask
+
+    def count_working_days(self, employee_type: Optional[str] = None) -> int:
+        return int(self.mask(employee_type).sum())
+
+
+@dataclass
+class EmployeeTotals:
+    present_days: int
+    status_counts: Dict[str, int]
+    work_hours: Optional[Decimal]
+    overtime_hours: Optional[Decimal]
+
+
+class AttendanceMatrix:
+    """
+    Employee x day attendance matrix over a WorkingCalendar.
+
+    Usage:
+        matrix = AttendanceMatrix(calendar, [(emp.id, emp.type) for emp in employees])
+        matrix.fill(attendances)
+        for day, status, check_in, check_out, work, overtime in matrix.cells(emp.id): ...
+        totals = matrix.totals(emp.id)
+    """
+
+    def __init__(
+        self,
+        calendar: WorkingCalendar,
+        employees: Sequence[tuple],
+    ):
+        """
+        Args:
+            calendar: Working calendar for the report range
+            employees: (employee_id, employee_type) pairs, in output order
+        """
+        self.calendar = calendar
+        shape = (len(employees), calendar.size)
+        self.employee_ids: List[int] = [emp_id for emp_id, _ in employees]
+        self._row: Dict[int, int] = {
+            emp_id: row for row, emp_id in enumerate(self.employee_ids)
+        }
+        self._types: List[Optional[str]] = [emp_type for _, emp_type in employees]
+
+        self._ids = np.array(self.employee_ids, dtype=np.int64)
+
+        self.status = np.zeros(shape, dtype=np.uint8)
+        self.work_hours = np.zeros(shape, dtype=np.float64)
+        self.overtime_hours = np.zeros(shape, dtype=np.float64)
+        # Index of the source attendance row per cell (-1 = none), for output
+        self._source = np.full(shape, -1, dtype=np.int64)
+        self._rows: List[Any] = []
+        self._source_offset = 0
+        self._included: Optional[np.ndarray] = None
+        self._totals: Optional[Dict[str, np.ndarray]] = None
+
+    def fill(self, attendances: Iterable[Any]) -> "AttendanceMatrix":
+        """
+        Place attendance rows (ORM objects or Row) into the matrix.
+
+        Rows for employees or days outside the matrix are ignored.
+        """
+        rows = list(attendances)
+        count = len(rows)
+        if not count or not self.employee_ids:
+            self._included = None
+            self._totals = None
+            return self
+
+        # Satu pass per kolom lewat map/attrgetter (C level), bukan loop per cell
+        employee_ids = np.fromiter(
+            map(attrgetter("employee_id"), rows), np.int64, count
+        )
+        cols = np.fromiter(
+            map(date.toordinal, map(attrgetter("attendance_date"), rows)),
+            np.int64,
+            count,
+        ) - self.calendar.start_date.toordinal()
+        codes = np.fromiter(
+            map(_STATUS_LOOKUP.__getitem__, map(attrgetter("status"), rows)),
+            np.uint8,
+            count,
+        )
+        work = np.fromiter(
+            (w or 0 for w in map(attrgetter("work_hours"), rows)), np.float64, count
+        )
+        overtime = np.fromiter(
+            (o or 0 for o in map(attrgetter("overtime_hours"), rows)),
+            np.float64,
+            count,
+        )
+
+        # employee_id -> row lewat searchsorted (tanpa dict lookup per cell)
+        order = np.argsort(self._ids)
+        sorted_ids = self._ids[order]
+        pos = np.searchsorted(sorted_ids, employee_ids).clip(0, len(sorted_ids) - 1)
+        valid = (sorted_ids[pos] == employee_ids) & (cols >= 0) & (cols < self.calendar.size)
+        index = (order[pos[valid]], cols[valid])
+
+        self.status[index] = codes[valid]
+        self.work_hours[index] = work[valid]
+        self.overtime_hours[index] = overtime[valid]
+        self._source[index] = self._source_offset + np.flatnonzero(valid)
+        self._source_offset += count
+        self._rows.extend(rows)
+        self._included = None
+        self._totals = None
+        return self
+
+    @property
+    def included_mask(self) -> np.ndarray:
+        """
+        Days shown per employee: working days of the employee's type, plus
+        holidays that still have an attendance row (someone worked).
+        """
+        if self._included is None:
+            calendar = self.calendar
+            working = np.array(
+                [calendar.mask(emp_type) for emp_type in self._types], dtype=bool
+            ).reshape(self.status.shape)
+            worked_holiday = calendar.holiday_mask & (self.status != NO_RECORD)
+            self._included = working | worked_holiday
+        return self._included
+
+    def cells(self, employee_id: int):
+        """
+        Yield (day, status, check_in, check_out, work_hours, overtime_hours)
+        for every included day. Days without a row are reported as "absent".
+        """
+        row = self._row[employee_id]
+        days = self.calendar.days
+        rows = self._rows
+        codes = self.status[row].tolist()
+        sources = self._source[row].tolist()
+        for col in np.flatnonzero(self.included_mask[row]).tolist():
+            code = codes[col]
+            if code == NO_RECORD:
+                yield days[col], "absent", None, None, None, None
+            else:
+                att = rows[sources[col]]
+                yield (
+                    days[col],
+                    STATUS_NAMES[code],
+                    att.check_in_time,
+                    att.check_out_time,
+                    att.work_hours,
+                    att.overtime_hours,
+                )
+
+    def _compute_totals(self) -> Dict[str, np.ndarray]:
+        """Reductions along the day axis for every employee at once."""
+        if self._totals is None:
+            mask = self.included_mask
+            # Hari di luar mask diberi kode yang tidak pernah cocok
+            masked = np.where(mask, self.status, np.uint8(255))
+            totals = {
+                name: (masked == code).sum(axis=1)
+                for name, code in STATUS_CODES.items()
+            }
+            totals["_present"] = np.isin(masked, PRESENT_CODES).sum(axis=1)
+            totals["_work"] = np.where(mask, self.work_hours, 0.0).sum(axis=1)
+            totals["_overtime"] = np.where(mask, self.overtime_hours, 0.0).sum(axis=1)
+            self._totals = totals
+        return self._totals
+
+    def totals(self, employee_id: int) -> EmployeeTotals:
+        """Per-employee totals over the included days."""
+        row = self._row[employee_id]
+        totals = self._compute_totals()
+        return EmployeeTotals(
+            present_days=int(totals["_present"][row]),
+            status_counts={name: int(totals[name][row]) for name in STATUS_CODES},
+            work_hours=_to_decimal(float(totals["_work"][row])),
+            overtime_hours=_to_decimal(float(totals["_overtime"][row])),
+        )
+
+
+def _to_decimal(value: float) -> Optional[Decimal]:
+    return Decimal(str(round(value, 2))) if value else None
@@ -1,13 +1,41 @@
 """
 Dashboard repository for local database queries
+
+Each widget is served by a single aggregate statement (scalar subqueries and
+COUNT(*) FILTER) so a widget costs one round trip regardless of how many
+numbers it shows.
 """
-from typing import List, Optional
+from typing import Optional
 from datetime import date
 from sqlalchemy import select, func, and_
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.attendances.models.attendances import Attendance
+from app.modules.attendances.models.attendance_stats import (
+    AttendanceDailyStat,
+    AttendanceMonthlyStat,
+)
+from app.modules.attendances.repositories.queries.attendance_stats_queries import (
+    CHECKED_IN_STATUSES,
+)
+from app.modules.employees.models.employee import Employee
+from app.modules.holiday_calendar.models.holiday import Holiday
 from app.modules.leave_requests.models.leave_request import LeaveRequest
+from app.modules.org_units.models.org_unit import OrgUnit
+from app.modules.users.users.models.user import User
+
+
+def _leave_covers(target_date: date):
+    """Leave requests tidak punya status/approval: setiap row berlaku."""
+    return and_(
+        LeaveRequest.start_date <= target_date,
+        LeaveRequest.end_date >= target_date,
+    )
+
+
+def _active_employee():
+    return and_(Employee.is_active.is_(True), Employee.deleted_at.is_(None))
 
 
 class DashboardRepository:
@@ -16,151 +44,165 @@ class DashboardRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_today_attendance(
-        self, employee_id: int, target_date: date
-    ) -> Optional[Attendance]:
-        """Get employee's attendance for specific date"""
-        query = select(Attendance).where(
-            and_(
-                Attendance.employee_id == employee_id,
-                func.date(Attendance.check_in_time) == target_date,
-                Attendance.deleted_at.is_(None),
-            )
-        ).order_by(Attendance.check_in_time.desc())
-
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
-
-    async def count_monthly_attendance(
-        self, employee_id: int, month_start: date, month_end: date
-    ) -> int:
-        """Count employee's attendance records in date range"""
-        query = select(func.count(Attendance.id)).where(
-            and_(
-                Attendance.employee_id == employee_id,
-                func.date(Attendance.check_in_time) >= month_start,
-                func.date(Attendance.check_in_time) <= month_end,
-                Attendance.deleted_at.is_(None),
+    async def get_employee_summary(
+        self,
+        employee_id: int,
+        target_date: date,
+        month_start: date,
+        month_end: date,
+    ) -> Optional[RowMapping]:
+        """
+        Personal widget data in one statement: profile, org unit, today's
+        attendance, checked-in days this month (monthly rollup), leave
+        request count and holiday dates in the month.
+        """
+        present_days = (
+            select(func.coalesce(func.sum(AttendanceMonthlyStat.attendance_count), 0))
+            .where(
+                and_(
+                    AttendanceMonthlyStat.employee_id == Employee.id,
+                    AttendanceMonthlyStat.month == month_start,
+                    AttendanceMonthlyStat.status.in_(CHECKED_IN_STATUSES),
+                )
             )
+            .scalar_subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def count_leave_requests_by_status(
-        self, employee_id: int, status: str
-    ) -> int:
-        """Count employee's leave requests by status"""
-        query = select(func.count(LeaveRequest.id)).where(
-            and_(
-                LeaveRequest.employee_id == employee_id,
-                LeaveRequest.status == status,
-                LeaveRequest.deleted_at.is_(None),
+        leave_requests = (
+            select(func.count(LeaveRequest.id))
+            .where(LeaveRequest.employee_id == Employee.id)
+            .scalar_subquery()
+        )
+        holidays = (
+            select(func.array_agg(Holiday.date))
+            .where(
+                and_(
+                    Holiday.date.between(month_start, month_end),
+                    Holiday.is_active.is_(True),
+                )
             )
+            .scalar_subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    # ==================== HR Admin Dashboard Queries ====================
-
-    async def count_active_employees(self) -> int:
-        """Count total active employees in system"""
-        # Note: Employee data is in gRPC service, this is placeholder
-        # Real implementation should call EmployeeGRPCClient
-        return 0
-
-    async def count_pending_leave_approvals(self) -> int:
-        """Count all pending leave requests"""
-        query = select(func.count(LeaveRequest.id)).where(
-            and_(
-                # LeaveRequest.status == "pending",
-                LeaveRequest.deleted_at.is_(None),
+
+        query = (
+            select(
+                func.coalesce(User.name, Employee.name).label("name"),
+                Employee.code,
+                Employee.position,
+                Employee.type,
+                Employee.org_unit_id,
+                OrgUnit.name.label("org_unit_name"),
+                Attendance.check_in_time,
+                Attendance.check_out_time,
+                Attendance.status,
+                present_days.label("present_days"),
+                leave_requests.label("leave_requests"),
+                holidays.label("holidays"),
+            )
+            .select_from(Employee)
+            .outerjoin(User, User.id == Employee.user_id)
+            .outerjoin(OrgUnit, OrgUnit.id == Employee.org_unit_id)
+            .outerjoin(
+                Attendance,
+                and_(
+                    Attendance.employee_id == Employee.id,
+                    Attendance.attendance_date == target_date,
+                ),
             )
+            .where(and_(Employee.id == employee_id, Employee.deleted_at.is_(None)))
         )
         result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def count_employees_on_leave_today(self, target_date: date) -> int:
-        """Count employees on approved leave today"""
-        query = select(func.count(LeaveRequest.employee_id.distinct())).where(
-            and_(
-                LeaveRequest.status == "approved",
-                LeaveRequest.start_date <= target_date,
-                LeaveRequest.end_date >= target_date,
-                LeaveRequest.deleted_at.is_(None),
+        return result.mappings().one_or_none()
+
+    async def get_hr_admin_summary(self, target_date: date) -> RowMapping:
+        """
+        Company-wide counters in one statement: active/inactive employees,
+        employees on leave and employees checked in (daily rollup) today.
+        """
+        employees = (
+            select(
+                func.count().filter(Employee.is_active.is_(True)).label("total_active"),
+                func.count()
+                .filter(Employee.is_active.is_(False))
+                .label("total_inactive"),
             )
+            .where(Employee.deleted_at.is_(None))
+            .subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def count_attendances_today(self, target_date: date) -> int:
-        """Count employees who checked in today"""
-        query = select(func.count(Attendance.employee_id.distinct())).where(
-            and_(
-                func.date(Attendance.check_in_time) == target_date,
-                Attendance.deleted_at.is_(None),
+        on_leave = (
+            select(func.count(LeaveRequest.employee_id.distinct()))
+            .where(_leave_covers(target_date))
+            .scalar_subquery()
+        )
+        present = (
+            select(func.coalesce(func.sum(AttendanceDailyStat.attendance_count), 0))
+            .where(
+                and_(
+                    AttendanceDailyStat.attendance_date == target_date,
+                    AttendanceDailyStat.status.in_(CHECKED_IN_STATUSES),
+                )
             )
+            .scalar_subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
 
+        query = select(
+            employees.c.total_active,
+            employees.c.total_inactive,
+            on_leave.label("on_leave_today"),
+            present.label("present_today"),
+        )
+        result = await self.db.execute(query)
+        return result.mappings().one()
 
-    async def get_team_employee_ids(self, org_unit_id: int) -> List[int]:
-        """Get employee IDs in specific org unit
-
-        Note: This requires calling EmployeeGRPCClient to get employees by org_unit_id
-        This method is placeholder - actual implementation in service layer
+    async def get_team_summary(
+        self, employee_id: int, target_date: date
+    ) -> Optional[RowMapping]:
         """
-        return []
-
-    async def count_team_attendance_today(
-        self, employee_ids: List[int], target_date: date
-    ) -> int:
-        """Count team members who checked in today"""
-        if not employee_ids:
-            return 0
-
-        query = select(func.count(Attendance.employee_id.distinct())).where(
-            and_(
-                Attendance.employee_id.in_(employee_ids),
-                func.date(Attendance.check_in_time) == target_date,
-                Attendance.deleted_at.is_(None),
-            )
+        Team counters for the employee's org unit in one statement: team
+        size, checked in today (CHECKED_IN_STATUSES, as in the HR summary)
+        and on leave today. None if the employee has no org unit.
+        """
+        org_unit_id = (
+            select(Employee.org_unit_id)
+            .where(Employee.id == employee_id)
+            .scalar_subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def count_team_on_leave_today(
-        self, employee_ids: List[int], target_date: date
-    ) -> int:
-        """Count team members on approved leave today"""
-        if not employee_ids:
-            return 0
-
-        query = select(func.count(LeaveRequest.employee_id.distinct())).where(
-            and_(
-                LeaveRequest.employee_id.in_(employee_ids),
-                LeaveRequest.status == "approved",
-                LeaveRequest.start_date <= target_date,
-                LeaveRequest.end_date >= target_date,
-                LeaveRequest.deleted_at.is_(None),
+        team = (
+            select(Employee.id)
+            .where(and_(Employee.org_unit_id == org_unit_id, _active_employee()))
+            .cte("team")
+        )
+        team_ids = select(team.c.id)
+
+        team_size = select(func.count()).select_from(team).scalar_subquery()
+        team_present = (
+            select(func.count())
+            .select_from(Attendance)
+            .where(
+                and_(
+                    Attendance.employee_id.in_(team_ids),
+                    Attendance.attendance_date == target_date,
+                    # Predikat yang sama dengan widget HR (rollup harian)
+                    Attendance.status.in_(CHECKED_IN_STATUSES),
+                )
             )
+            .scalar_subquery()
         )
-        result = await self.db.execute(query)
-        return result.scalar() or 0
-
-    async def count_team_pending_leave_requests(
-        self, employee_ids: List[int]
-    ) -> int:
-        """Count pending leave requests from team"""
-        if not employee_ids:
-            return 0
-
-        query = select(func.count(LeaveRequest.id)).where(
-            and_(
-                LeaveRequest.employee_id.in_(employee_ids),
-                LeaveRequest.status == "pending",
-                LeaveRequest.deleted_at.is_(None),
+        team_on_leave = (
+            select(func.count(LeaveRequest.employee_id.distinct()))
+            .where(
+                and_(
+                    LeaveRequest.employee_id.in_(team_ids),
+                    _leave_covers(target_date),
+                )
             )
+            .scalar_subquery()
         )
+
+        query = select(
+            OrgUnit.name.label("org_unit_name"),
+            team_size.label("team_size"),
+            team_present.label("team_present"),
+            team_on_leave.label("team_on_leave"),
+        ).where(OrgUnit.id == org_unit_id)
         result = await self.db.execute(query)
-        return result.scalar() or 0
+        return result.mappings().one_or_none()
@@ -2,31 +2,137 @@
 Employee Command Repository - Write operations
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update
+from sqlalchemy import inspect, select, text, update
 
+from app.core.cache.subordinate_cache import subordinate_cache
 from app.core.utils.datetime import get_utc_now
 from app.modules.employees.models.employee import Employee
 
+# Effective supervisor per member of an org unit subtree:
+# - affected: the unit plus descendants reachable through units without
+#   their own head (units with a head keep their own reporting line)
+# - chain: the unit and its non-deleted ancestors; the nearest head wins,
+#   skipping the member itself (a head reports to the next head up)
+_REASSIGN_SUPERVISORS_SQL = text("""
+    WITH RECURSIVE affected AS (
+        SELECT id FROM org_units WHERE id = :org_unit_id
+        UNION ALL
+        SELECT c.id FROM org_units c
+        INNER JOIN affected a ON c.parent_id = a.id
+        WHERE c.head_id IS NULL AND c.deleted_at IS NULL
+    ),
+    chain AS (
+        SELECT id, parent_id, COALESCE(CAST(:head_id AS integer), head_id) AS head_id,
+               0 AS depth
+        FROM org_units WHERE id = :org_unit_id AND deleted_at IS NULL
+        UNION ALL
+        SELECT p.id, p.parent_id, p.head_id, ch.depth + 1 FROM org_units p
+        INNER JOIN chain ch ON p.id = ch.parent_id
+        WHERE p.deleted_at IS NULL
+    ),
+    targets AS (
+        SELECT e.id AS employee_id,
+               e.supervisor_id AS old_supervisor_id,
+               (
+                   SELECT ch.head_id FROM chain ch
+                   WHERE ch.head_id IS NOT NULL AND ch.head_id <> e.id
+                   ORDER BY ch.depth
+                   LIMIT 1
+               ) AS supervisor_id
+        FROM employees e
+        WHERE e.org_unit_id IN (SELECT id FROM affected)
+          AND e.deleted_at IS NULL
+    )
+    UPDATE employees
+    SET supervisor_id = t.supervisor_id,
+        updated_by = CAST(:updated_by AS uuid),
+        updated_at = now()
+    FROM targets t
+    WHERE employees.id = t.employee_id
+      AND employees.supervisor_id IS DISTINCT FROM t.supervisor_id
+    RETURNING employees.id, t.old_supervisor_id, t.supervisor_id
+""")
+
+
+def _touched_supervisors(employee: Employee) -> Set[Optional[int]]:
+    """Supervisors whose subordinate set changes with this pending update."""
+    state = inspect(employee)
+    supervisor = state.attrs.supervisor_id.history
+    if supervisor.has_changes():
+        return {*supervisor.deleted, *supervisor.added}
+    if state.attrs.deleted_at.history.has_changes():
+        return {employee.supervisor_id}
+    return set()
+
 
 class EmployeeCommands:
-    """Write operations for Employee model"""
+    """
+    Write operations for Employee model.
+
+    Every write that changes a reporting line drops the cached subordinate
+    sets of the affected supervisors and all their superiors.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _invalidate_reporting_lines(
+        self, supervisor_ids: Iterable[Optional[int]]
+    ) -> None:
+        from app.modules.employees.repositories.queries import EmployeeQueries
+
+        ids = {i for i in supervisor_ids if i}
+        if not ids:
+            return
+        chain = await EmployeeQueries(self.db).get_supervisor_chain_ids(ids)
+        await subordinate_cache.invalidate_many(chain)
+
     async def create(self, employee: Employee) -> Employee:
         self.db.add(employee)
         await self.db.commit()
         await self.db.refresh(employee)
+        await self._invalidate_reporting_lines([employee.supervisor_id])
         return employee
 
     async def update(self, employee: Employee) -> Employee:
+        touched = _touched_supervisors(employee)
         await self.db.commit()
         await self.db.refresh(employee)
+        await self._invalidate_reporting_lines(touched)
         return employee
 
+    async def reassign_org_unit_supervisors(
+        self,
+        org_unit_id: int,
+        updated_by: Optional[str],
+        head_id: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Set supervisor_id of every member in the org unit subtree to its
+        effective head, in one UPDATE ... FROM (recursive CTE).
+
+        head_id overrides the unit's stored head (None = read from DB).
+
+        Returns:
+            List[int]: IDs of employees whose supervisor_id changed
+        """
+        result = await self.db.execute(
+            _REASSIGN_SUPERVISORS_SQL,
+            {
+                "org_unit_id": org_unit_id,
+                "head_id": head_id,
+                "updated_by": str(updated_by) if updated_by else None,
+            },
+        )
+        rows = result.all()
+        await self.db.commit()
+
+        touched = {r.old_supervisor_id for r in rows} | {r.supervisor_id for r in rows}
+        await self._invalidate_reporting_lines(touched)
+        return [r.id for r in rows]
+
     async def delete(self, employee_id: int, user_id: int) -> bool:
         from app.modules.employees.repositories.queries import EmployeeQueries
         
@@ -39,6 +145,7 @@ class EmployeeCommands:
         employee.deleted_by = user_id
         employee.is_active = False
         await self.db.commit()
+        await self._invalidate_reporting_lines([employee.supervisor_id])
         return True
 
     async def hard_delete(self, employee_id: int) -> bool:
@@ -49,8 +156,10 @@ class EmployeeCommands:
         if not employee:
             return False
 
+        supervisor_id = employee.supervisor_id
         await self.db.delete(employee)
         await self.db.commit()
+        await self._invalidate_reporting_lines([supervisor_id])
         return True
 
     async def restore(self, employee_id: int) -> Optional[Employee]:
@@ -66,6 +175,7 @@ class EmployeeCommands:
         employee.is_active = True
         await self.db.commit()
         await self.db.refresh(employee)
+        await self._invalidate_reporting_lines([employee.supervisor_id])
         return employee
 
     async def bulk_update_supervisor(
@@ -74,10 +184,18 @@ class EmployeeCommands:
         new_supervisor_id: Optional[int],
         updated_by: int
     ) -> int:
+        old_supervisors = await self.db.execute(
+            select(Employee.supervisor_id.distinct()).where(
+                Employee.id.in_(employee_ids)
+            )
+        )
+        touched = {*old_supervisors.scalars().all(), new_supervisor_id}
+
         result = await self.db.execute(
             update(Employee)
             .where(Employee.id.in_(employee_ids))
             .values(supervisor_id=new_supervisor_id, updated_by=updated_by)
         )
         await self.db.commit()
+        await self._invalidate_reporting_lines(touched)
         return result.rowcount
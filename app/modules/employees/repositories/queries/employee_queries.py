@@ -2,11 +2,17 @@
 Employee Query Repository - Read operations
 """
 
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, text
 from sqlalchemy.orm import selectinload
 
+from app.core.repositories.counting import fetch_page
+from app.core.repositories.keyset import (
+    build_next_cursor,
+    decode_cursor,
+    keyset_condition,
+)
 from app.modules.employees.models.employee import Employee
 
 
@@ -16,6 +22,11 @@ class EmployeeQueries:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def next_cursor(items: List[Employee], limit: int) -> Optional[str]:
+        """Cursor for the employee list page after `items`."""
+        return build_next_cursor(items, limit, lambda e: (e.id,))
+
     def _base_options(self):
         return [
             selectinload(Employee.user),
@@ -181,7 +192,9 @@ class EmployeeQueries:
         is_active: Optional[bool] = None,
         limit: int = 10,
         skip: int = 0,
-    ) -> Tuple[List[Employee], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Employee], Optional[int]]:
         query = select(Employee)
 
         if org_unit_id:
@@ -203,16 +216,26 @@ class EmployeeQueries:
 
         query = query.where(Employee.deleted_at.is_(None))
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
+        base_query = query
 
-        # Data query
-        query = query.options(*self._base_options()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+        # Data query (keyset on id when a cursor is given, OFFSET otherwise)
+        if cursor:
+            (last_id,) = decode_cursor(cursor, (Employee.id,))
+            query = query.where(
+                keyset_condition((Employee.id,), (last_id,), descending=False)
+            )
+        else:
+            query = query.offset(skip)
+        query = (
+            query.options(*self._base_options()).order_by(Employee.id).limit(limit)
+        )
+        return await fetch_page(
+            self.db,
+            base_query,
+            query,
+            include_total=include_total,
+            window_total=cursor is None,
+        )
 
     async def get_all_by_org_unit(
         self,
@@ -236,7 +259,8 @@ class EmployeeQueries:
                 .join(OrgUnit, Employee.org_unit_id == OrgUnit.id)
                 .where(
                     and_(
-                        OrgUnit.path.like(f"{org.path}%"), Employee.deleted_at.is_(None)
+                        OrgUnit.path.descendant_of(org.path),
+                        Employee.deleted_at.is_(None),
                     )
                 )
             )
@@ -270,6 +294,51 @@ class EmployeeQueries:
 
             return items, total
 
+    async def get_subordinate_ids(self, supervisor_id: int) -> List[int]:
+        """
+        Semua subordinate transitif (id saja) dalam satu recursive CTE.
+
+        UNION (bukan UNION ALL) supaya data siklik supervisor tidak loop.
+        """
+        tree = (
+            select(Employee.id)
+            .where(
+                and_(
+                    Employee.supervisor_id == supervisor_id,
+                    Employee.deleted_at.is_(None),
+                )
+            )
+            .cte("subordinates", recursive=True)
+        )
+        tree = tree.union(
+            select(Employee.id).where(
+                and_(
+                    Employee.supervisor_id == tree.c.id,
+                    Employee.deleted_at.is_(None),
+                )
+            )
+        )
+        result = await self.db.execute(select(tree.c.id).order_by(tree.c.id))
+        return list(result.scalars().all())
+
+    async def get_supervisor_chain_ids(self, employee_ids: Iterable[int]) -> Set[int]:
+        """employee_ids beserta semua atasan di atasnya (ke arah root)."""
+        ids = {i for i in employee_ids if i}
+        if not ids:
+            return set()
+        chain = (
+            select(Employee.id, Employee.supervisor_id)
+            .where(Employee.id.in_(ids))
+            .cte("chain", recursive=True)
+        )
+        chain = chain.union(
+            select(Employee.id, Employee.supervisor_id).where(
+                Employee.id == chain.c.supervisor_id
+            )
+        )
+        result = await self.db.execute(select(chain.c.id))
+        return set(result.scalars().all())
+
     async def get_all_by_supervisor(self, supervisor_id: int) -> List[Employee]:
         result = await self.db.execute(
             select(Employee)
@@ -287,6 +356,22 @@ class EmployeeQueries:
         if not ids:
             return []
         result = await self.db.execute(
-            select(Employee).options(*self._base_options()).where(Employee.id.in_(ids))
+            select(Employee)
+            .options(*self._base_options())
+            .where(and_(Employee.id.in_(ids), Employee.deleted_at.is_(None)))
         )
         return list(result.scalars().unique().all())
+
+    async def list_active_org_unit_ids(self) -> List[Tuple[int, Optional[int]]]:
+        """(employee_id, org_unit_id) semua employee aktif, tanpa load relasi."""
+        result = await self.db.execute(
+            select(Employee.id, Employee.org_unit_id)
+            .where(
+                and_(
+                    Employee.is_active.is_(True),
+                    Employee.deleted_at.is_(None),
+                )
+            )
+            .order_by(Employee.id)
+        )
+        return [(row.id, row.org_unit_id) for row in result.all()]
@@ -36,14 +36,25 @@ async def list_employees(
     search: Optional[str] = None,
     org_unit_id: Optional[int] = None,
     is_active: Optional[bool] = None,
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[EmployeeResponse]:
-    items, pagination = await service.list(page, limit, search, org_unit_id, is_active)
+    items, pagination = await service.list(
+        page, limit, search, org_unit_id, is_active, cursor, include_total
+    )
     return create_paginated_response(
         message="Success",
         data=items,
         page=pagination["page"],
         limit=pagination["limit"],
         total_items=pagination["total_items"],
+        next_cursor=pagination["next_cursor"],
     )
 
 
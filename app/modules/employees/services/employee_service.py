@@ -161,12 +161,19 @@ class EmployeeService:
         search: Optional[str] = None,
         org_unit_id: Optional[int] = None,
         is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[EmployeeResponse], Dict[str, Any]]:
         employees, total = await self.list_uc.execute(
-            page, limit, search, org_unit_id, is_active
+            page, limit, search, org_unit_id, is_active, cursor, include_total
         )
         items = [EmployeeResponse.model_validate(e) for e in employees]
-        pagination = {"page": page, "limit": limit, "total_items": total}
+        pagination = {
+            "page": page,
+            "limit": limit,
+            "total_items": total,
+            "next_cursor": EmployeeQueries.next_cursor(employees, limit),
+        }
         return items, pagination
 
     async def list_deleted(
@@ -6,6 +6,7 @@ from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.org_units.repositories import OrgUnitQueries
 from app.modules.users.users.repositories import UserQueries, UserCommands
 from app.core.messaging import EventPublisher
+from app.core.cache import current_user_cache
 from app.grpc.clients.sso_client import SSOUserGRPCClient
 from app.core.exceptions import ConflictException
 
@@ -96,6 +97,7 @@ class CreateEmployeeUseCase:
         employee.set_created_by(created_by)
 
         created = await self.commands.create(employee)
+        await current_user_cache.invalidate(local_user.id)
         # Reload to get relationships
         created = await self.queries.get_by_id(created.id)
 
@@ -5,6 +5,7 @@ from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.org_units.repositories import OrgUnitQueries
 from app.modules.users.users.repositories import UserCommands
 from app.core.messaging import EventPublisher
+from app.core.cache import current_user_cache
 from app.grpc.clients.sso_client import SSOUserGRPCClient
 from app.core.exceptions import NotFoundException, BadRequestException
 
@@ -68,6 +69,7 @@ class DeleteEmployeeUseCase:
             )
 
         await self.commands.delete(employee_id, deleted_by)
+        await current_user_cache.invalidate(employee.user_id)
 
         deleted = await self.queries.get_by_id_with_deleted(employee_id)
         if self.event_publisher:
@@ -16,7 +16,9 @@ class ListEmployeesUseCase:
         search: Optional[str] = None,
         org_unit_id: Optional[int] = None,
         is_active: Optional[bool] = None,
-    ) -> Tuple[List[Employee], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Employee], Optional[int]]:
         """Returns (items, total_count)"""
         skip = (page - 1) * limit
 
@@ -26,6 +28,8 @@ class ListEmployeesUseCase:
             search=search,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
         return employees, total
 
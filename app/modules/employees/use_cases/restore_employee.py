@@ -5,6 +5,7 @@ from app.modules.employees.models.employee import Employee
 from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.users.users.repositories import UserCommands
 from app.core.messaging import EventPublisher
+from app.core.cache import current_user_cache
 from app.grpc.clients.sso_client import SSOUserGRPCClient
 from app.core.exceptions import NotFoundException, BadRequestException
 
@@ -53,6 +54,7 @@ class RestoreEmployeeUseCase:
 
         # 2. Restore Employee
         restored = await self.commands.restore(employee_id)
+        await current_user_cache.invalidate(employee.user_id)
 
         # 3. Publish Event
         if self.event_publisher:
@@ -6,6 +6,7 @@ from app.modules.employees.repositories import EmployeeQueries, EmployeeCommands
 from app.modules.org_units.repositories import OrgUnitQueries
 from app.modules.users.users.repositories import UserQueries, UserCommands
 from app.core.messaging import EventPublisher
+from app.core.cache import current_user_cache
 from app.grpc.clients.sso_client import SSOUserGRPCClient
 from app.core.exceptions import (
     ConflictException,
@@ -74,6 +75,7 @@ class UpdateEmployeeUseCase:
 
         if not employee.user_id:
             raise BadRequestException("Employee has no linked user")
+        previous_user_id = employee.user_id
 
         # 1. Update SSO and Local User details (only email/phone)
         sso_update_data = {}
@@ -136,6 +138,10 @@ class UpdateEmployeeUseCase:
 
         employee.set_updated_by(updated_by)
         await self.commands.update(employee)
+        # User lama juga di-invalidate jika employee di-relink ke user lain
+        await current_user_cache.invalidate_many(
+            [previous_user_id, employee.user_id]
+        )
 
         employee = await self.queries.get_by_id(employee_id)
         if self.event_publisher:
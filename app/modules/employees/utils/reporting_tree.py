@@ -0,0 +1,31 @@
+"""
+Reporting Tree Utility
+Resolves "my team" scopes from the cached subordinate sets.
+"""
+
+from typing import List
+
+from app.config.database import use_primary
+from app.core.cache.subordinate_cache import subordinate_cache
+from app.modules.employees.repositories import EmployeeQueries
+
+
+class ReportingTreeUtil:
+    """Utility for transitive subordinate lookups"""
+
+    @staticmethod
+    async def get_subordinate_ids(
+        queries: EmployeeQueries, supervisor_id: int
+    ) -> List[int]:
+        """
+        All active transitive subordinate IDs of supervisor_id.
+        Served from Redis; the recursive CTE only runs on a cache miss,
+        on primary (the set is an authorization scope, a lagging replica
+        must not be cached).
+        """
+
+        async def load(supervisor_id: int) -> List[int]:
+            use_primary(queries.db)
+            return await queries.get_subordinate_ids(supervisor_id)
+
+        return await subordinate_cache.get_or_load(supervisor_id, load)
@@ -5,6 +5,7 @@ LeaveRequest Module Dependencies
 from typing import Annotated
 from fastapi import Depends
 from app.core.dependencies.database import PostgresDB
+from app.core.dependencies.loaders import LoadersDep
 from app.modules.leave_requests.repositories import (
     LeaveRequestQueries,
     LeaveRequestCommands,
@@ -65,9 +66,16 @@ def get_leave_request_service(
     employee_queries: EmployeeQueriesDep,
     assignment_commands: AssignmentCommandsDep,
     assignment_queries: AssignmentQueriesDep,
+    loaders: LoadersDep,
 ) -> LeaveRequestService:
     return LeaveRequestService(
-        db, queries, commands, employee_queries, assignment_commands, assignment_queries
+        db,
+        queries,
+        commands,
+        employee_queries,
+        assignment_commands,
+        assignment_queries,
+        loaders,
     )
 
 
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import String, Integer, Date, Text, CheckConstraint, ForeignKey
+from sqlalchemy import String, Integer, Date, Text, CheckConstraint, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
@@ -72,6 +72,10 @@ class LeaveRequest(Base, TimestampMixin):
     __table_args__ = (
         CheckConstraint("leave_type IN ('leave', 'holiday')", name="check_leave_type"),
         CheckConstraint("total_days > 0", name="check_total_days_positive"),
+        Index("ix_leave_requests_dates", "start_date", "end_date"),
+        Index(
+            "ix_leave_requests_employee_dates", "employee_id", "start_date", "end_date"
+        ),
     )
 
     def __repr__(self) -> str:
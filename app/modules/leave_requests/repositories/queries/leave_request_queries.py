@@ -4,11 +4,20 @@ LeaveRequest Query Repository - Read operations
 
 from typing import Optional, List, Tuple
 from datetime import date
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.repositories.counting import fetch_page
+from app.core.repositories.keyset import (
+    build_next_cursor,
+    decode_cursor,
+    keyset_condition,
+)
 from app.modules.leave_requests.models.leave_request import LeaveRequest
 
+# Stable sort key for list pages: newest first, id tiebreak
+_LIST_SORT_COLUMNS = (LeaveRequest.created_at, LeaveRequest.id)
+
 
 class LeaveRequestQueries:
     """Read operations for LeaveRequest"""
@@ -16,6 +25,11 @@ class LeaveRequestQueries:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def next_cursor(items: List, limit: int) -> Optional[str]:
+        """Cursor for the page after `items` (LeaveRequest or list responses)."""
+        return build_next_cursor(items, limit, lambda lr: (lr.created_at, lr.id))
+
     async def get_by_id(self, leave_request_id: int) -> Optional[LeaveRequest]:
         result = await self.db.execute(
             select(LeaveRequest).where(LeaveRequest.id == leave_request_id)
@@ -30,25 +44,16 @@ class LeaveRequestQueries:
         leave_type: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequest], int]:
-        query = select(LeaveRequest).where(LeaveRequest.employee_id == employee_id)
-        if start_date:
-            query = query.where(LeaveRequest.start_date >= start_date)
-        if end_date:
-            query = query.where(LeaveRequest.end_date <= end_date)
-        if leave_type:
-            query = query.where(LeaveRequest.leave_type == leave_type)
-
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = query.order_by(LeaveRequest.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequest], Optional[int]]:
+        query = self._filtered(
+            select(LeaveRequest).where(LeaveRequest.employee_id == employee_id),
+            start_date,
+            end_date,
+            leave_type,
+        )
+        return await self._fetch_page(query, skip, limit, cursor, include_total)
 
     async def list_all(
         self,
@@ -58,27 +63,58 @@ class LeaveRequestQueries:
         leave_type: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequest], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequest], Optional[int]]:
         query = select(LeaveRequest)
         if employee_id is not None:
             query = query.where(LeaveRequest.employee_id == employee_id)
+        query = self._filtered(query, start_date, end_date, leave_type)
+        return await self._fetch_page(query, skip, limit, cursor, include_total)
+
+    @staticmethod
+    def _filtered(
+        query,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        leave_type: Optional[str],
+    ):
         if start_date:
             query = query.where(LeaveRequest.start_date >= start_date)
         if end_date:
             query = query.where(LeaveRequest.end_date <= end_date)
         if leave_type:
             query = query.where(LeaveRequest.leave_type == leave_type)
+        return query
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = query.order_by(LeaveRequest.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+    async def _fetch_page(
+        self,
+        base_query,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool,
+    ) -> Tuple[List[LeaveRequest], Optional[int]]:
+        # Data query (keyset when a cursor is given, OFFSET otherwise)
+        query = base_query
+        if cursor:
+            values = decode_cursor(cursor, _LIST_SORT_COLUMNS)
+            query = query.where(keyset_condition(_LIST_SORT_COLUMNS, values))
+        else:
+            query = query.offset(skip)
+        query = query.order_by(
+            LeaveRequest.created_at.desc(), LeaveRequest.id.desc()
+        ).limit(limit)
+        return await fetch_page(
+            self.db,
+            base_query,
+            query,
+            include_total=include_total,
+            window_total=cursor is None,
+            estimate_table=(
+                LeaveRequest.__tablename__ if base_query.whereclause is None else None
+            ),
+        )
 
     async def check_overlapping(
         self,
@@ -120,22 +156,13 @@ class LeaveRequestQueries:
         leave_type: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequest], int]:
-        query = select(LeaveRequest).where(LeaveRequest.employee_id.in_(employee_ids))
-        if start_date:
-            query = query.where(LeaveRequest.start_date >= start_date)
-        if end_date:
-            query = query.where(LeaveRequest.end_date <= end_date)
-        if leave_type:
-            query = query.where(LeaveRequest.leave_type == leave_type)
-
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = query.order_by(LeaveRequest.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequest], Optional[int]]:
+        query = self._filtered(
+            select(LeaveRequest).where(LeaveRequest.employee_id.in_(employee_ids)),
+            start_date,
+            end_date,
+            leave_type,
+        )
+        return await self._fetch_page(query, skip, limit, cursor, include_total)
@@ -38,6 +38,14 @@ async def get_my_leave_requests(
     ),
     page: int = Query(1, ge=1, description="Nomor halaman"),
     limit: int = Query(10, ge=1, le=250, description="Jumlah item per halaman"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[LeaveRequestResponse]:
     """
     Ambil daftar leave requests employee sendiri.
@@ -45,13 +53,15 @@ async def get_my_leave_requests(
 
     **Permission required**: leave:read
     """
-    items, total_items = await service.get_my_leave_requests(
+    items, total_items, next_cursor = await service.get_my_leave_requests(
         employee_id=current_user.employee_id or 0,
         start_date=start_date,
         end_date=end_date,
         leave_type=leave_type,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return create_paginated_response(
         message="Daftar leave request berhasil diambil",
@@ -59,6 +69,7 @@ async def get_my_leave_requests(
         page=page,
         limit=limit,
         total_items=total_items,
+        next_cursor=next_cursor,
     )
 
 
@@ -99,19 +110,29 @@ async def list_all_leave_requests(
     ),
     page: int = Query(1, ge=1, description="Nomor halaman"),
     limit: int = Query(10, ge=1, le=250, description="Jumlah item per halaman"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[LeaveRequestListResponse]:
     """
     Ambil daftar semua leave requests (HR Admin/Super Admin only).
 
     **Permission required**: leave:read_all
     """
-    items, total_items = await service.list_all_leave_requests(
+    items, total_items, next_cursor = await service.list_all_leave_requests(
         employee_id=employee_id,
         start_date=start_date,
         end_date=end_date,
         leave_type=leave_type,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return create_paginated_response(
         message="Daftar leave request berhasil diambil",
@@ -119,6 +140,7 @@ async def list_all_leave_requests(
         page=page,
         limit=limit,
         total_items=total_items,
+        next_cursor=next_cursor,
     )
 
 
@@ -198,6 +220,14 @@ async def get_team_leave_requests(
     ),
     page: int = Query(1, ge=1, description="Nomor halaman"),
     limit: int = Query(10, ge=1, le=250, description="Jumlah item per halaman"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[LeaveRequestListResponse]:
     """
     Ambil leave requests team/subordinates (untuk org unit head).
@@ -208,13 +238,15 @@ async def get_team_leave_requests(
     if current_user.employee_id is None:
         raise UnprocessableEntityException("employee id tidak valid")
 
-    items, total_items = await service.get_team_leave_requests(
+    items, total_items, next_cursor = await service.get_team_leave_requests(
         employee_id=current_user.employee_id,
         start_date=start_date,
         end_date=end_date,
         leave_type=leave_type,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     return create_paginated_response(
         message="Daftar leave request berhasil diambil",
@@ -222,4 +254,5 @@ async def get_team_leave_requests(
         page=page,
         limit=limit,
         total_items=total_items,
+        next_cursor=next_cursor,
     )
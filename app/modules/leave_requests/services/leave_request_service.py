@@ -8,6 +8,7 @@ from app.modules.leave_requests.repositories import (
     LeaveRequestCommands,
 )
 from app.modules.employees.repositories import EmployeeQueries
+from app.core.dependencies.loaders import EntityLoaders
 from app.modules.employee_assignments.repositories import (
     AssignmentCommands,
     AssignmentQueries,
@@ -51,6 +52,7 @@ class LeaveRequestService:
         employee_queries: EmployeeQueries,
         assignment_commands: AssignmentCommands,
         assignment_queries: AssignmentQueries,
+        loaders: EntityLoaders,
     ):
         self.db = db
         self.queries = queries
@@ -70,10 +72,10 @@ class LeaveRequestService:
         self.delete_uc = DeleteLeaveRequestUseCase(db, queries, commands)
         self.list_my_uc = ListMyLeaveRequestsUseCase(queries)
         self.list_all_uc = ListAllLeaveRequestsUseCase(
-            queries, employee_queries, assignment_queries
+            queries, employee_queries, loaders, assignment_queries
         )
         self.list_team_uc = ListTeamLeaveRequestsUseCase(
-            queries, employee_queries, assignment_queries
+            queries, employee_queries, loaders, assignment_queries
         )
 
     async def create_leave_request(
@@ -107,9 +109,18 @@ class LeaveRequestService:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestResponse], Optional[int], Optional[str]]:
         return await self.list_my_uc.execute(
-            employee_id, start_date, end_date, leave_type, page, limit
+            employee_id,
+            start_date,
+            end_date,
+            leave_type,
+            page,
+            limit,
+            cursor,
+            include_total,
         )
 
     async def list_all_leave_requests(
@@ -120,9 +131,18 @@ class LeaveRequestService:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestListResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestListResponse], Optional[int], Optional[str]]:
         return await self.list_all_uc.execute(
-            employee_id, start_date, end_date, leave_type, page, limit
+            employee_id,
+            start_date,
+            end_date,
+            leave_type,
+            page,
+            limit,
+            cursor,
+            include_total,
         )
 
     async def get_team_leave_requests(
@@ -133,7 +153,16 @@ class LeaveRequestService:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestListResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestListResponse], Optional[int], Optional[str]]:
         return await self.list_team_uc.execute(
-            employee_id, start_date, end_date, leave_type, page, limit
+            employee_id,
+            start_date,
+            end_date,
+            leave_type,
+            page,
+            limit,
+            cursor,
+            include_total,
         )
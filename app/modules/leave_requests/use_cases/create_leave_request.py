@@ -22,6 +22,7 @@ from app.modules.employee_assignments.repositories import (
     AssignmentQueries,
 )
 from app.core.exceptions import NotFoundException, BadRequestException
+from app.core.cache import dashboard_cache
 from app.modules.leave_requests.utils.total_days import (
     validate_no_overlapping_leave,
     validate_leave_dates,
@@ -144,7 +145,8 @@ class CreateLeaveRequestUseCase:
             end_date=request.end_date,
             org_unit_id=emp.org_unit_id,
         )
-            
+        await dashboard_cache.invalidate_employee(emp.id, emp.org_unit_id)
+
         replacement_info = None
         if replacement_emp:
             replacement_info = ReplacementInfo(
@@ -5,6 +5,7 @@ from app.modules.leave_requests.repositories import (
     LeaveRequestCommands,
 )
 from app.core.exceptions import NotFoundException
+from app.core.cache import dashboard_cache
 from app.modules.attendances.utils.attendance_leave_sync import revert_attendances_from_leave
 
 
@@ -35,4 +36,11 @@ class DeleteLeaveRequestUseCase:
             end_date=leave_request.end_date,
         )
 
+        employee_id = leave_request.employee_id
+        org_unit_id = (
+            leave_request.employee.org_unit_id if leave_request.employee else None
+        )
+
         await self.commands.delete(leave_request_id)
+
+        await dashboard_cache.invalidate_employee(employee_id, org_unit_id)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional, List, Tuple
 from datetime import date
 from app.modules.leave_requests.schemas.responses import (
@@ -7,7 +8,9 @@ from app.modules.leave_requests.schemas.responses import (
 from app.modules.leave_requests.schemas.shared import LeaveType
 from app.modules.leave_requests.repositories import LeaveRequestQueries
 from app.modules.employees.repositories import EmployeeQueries
+from app.modules.employees.utils.reporting_tree import ReportingTreeUtil
 from app.modules.employee_assignments.repositories import AssignmentQueries
+from app.core.dependencies.loaders import EntityLoaders
 from app.core.exceptions import BadRequestException
 
 
@@ -23,7 +26,9 @@ class ListMyLeaveRequestsUseCase:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestResponse], Optional[int], Optional[str]]:
         if page < 1:
             raise BadRequestException("Halaman harus lebih besar dari 0")
         if limit < 1 or limit > 100:
@@ -38,10 +43,12 @@ class ListMyLeaveRequestsUseCase:
             leave_type=leave_type,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         items = [LeaveRequestResponse.model_validate(lr) for lr in leave_requests]
-        return items, total_items
+        return items, total_items, self.queries.next_cursor(leave_requests, limit)
 
 
 class ListAllLeaveRequestsUseCase:
@@ -49,10 +56,12 @@ class ListAllLeaveRequestsUseCase:
         self,
         queries: LeaveRequestQueries,
         employee_queries: EmployeeQueries,
+        loaders: EntityLoaders,
         assignment_queries: Optional[AssignmentQueries] = None,
     ):
         self.queries = queries
         self.employee_queries = employee_queries
+        self.loaders = loaders
         self.assignment_queries = assignment_queries
 
     async def execute(
@@ -63,7 +72,9 @@ class ListAllLeaveRequestsUseCase:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestListResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestListResponse], Optional[int], Optional[str]]:
         if page < 1:
             raise BadRequestException("Halaman harus lebih besar dari 0")
         if limit < 1 or limit > 100:
@@ -78,21 +89,26 @@ class ListAllLeaveRequestsUseCase:
             leave_type=leave_type,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+        # Employee dan replacement di-load dalam satu batch (satu query IN)
+        employees, replacements = await asyncio.gather(
+            self.loaders.employees.load_many(lr.employee_id for lr in leave_requests),
+            self.loaders.employees.load_many(
+                lr.replacement_employee_id for lr in leave_requests
+            ),
         )
 
         items = []
-        for lr in leave_requests:
-            emp = await self.employee_queries.get_by_id(lr.employee_id)
+        for lr, emp, replacement_emp in zip(leave_requests, employees, replacements):
             employee_name = emp.user.name if emp and emp.user else None
             employee_number = emp.code if emp else None
 
             replacement_employee_name = None
-            if lr.replacement_employee_id:
-                replacement_emp = await self.employee_queries.get_by_id(
-                    lr.replacement_employee_id
-                )
-                if replacement_emp and replacement_emp.user:
-                    replacement_employee_name = replacement_emp.user.name
+            if replacement_emp and replacement_emp.user:
+                replacement_employee_name = replacement_emp.user.name
 
             items.append(
                 LeaveRequestListResponse(
@@ -111,7 +127,8 @@ class ListAllLeaveRequestsUseCase:
                 )
             )
 
-        return items, total_items
+        next_cursor = self.queries.next_cursor(leave_requests, limit)
+        return items, total_items, next_cursor
 
 
 class ListTeamLeaveRequestsUseCase:
@@ -119,10 +136,12 @@ class ListTeamLeaveRequestsUseCase:
         self,
         queries: LeaveRequestQueries,
         employee_queries: EmployeeQueries,
+        loaders: EntityLoaders,
         assignment_queries: Optional[AssignmentQueries] = None,
     ):
         self.queries = queries
         self.employee_queries = employee_queries
+        self.loaders = loaders
         self.assignment_queries = assignment_queries
 
     async def execute(
@@ -133,16 +152,16 @@ class ListTeamLeaveRequestsUseCase:
         leave_type: Optional[str] = None,
         page: int = 1,
         limit: int = 10,
-    ) -> Tuple[List[LeaveRequestListResponse], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[LeaveRequestListResponse], Optional[int], Optional[str]]:
         # Get all subordinates recursively
-        subordinates, _ = await self.employee_queries.get_subordinates(
-            employee_id, recursive=True
+        subordinate_ids = await ReportingTreeUtil.get_subordinate_ids(
+            self.employee_queries, employee_id
         )
 
-        subordinate_ids = [e.id for e in subordinates]
-
         if not subordinate_ids:
-            return [], 0
+            return [], (0 if include_total else None), None
 
         if page < 1:
             raise BadRequestException("Halaman harus lebih besar dari 0")
@@ -158,21 +177,25 @@ class ListTeamLeaveRequestsUseCase:
             leave_type=leave_type,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+        employees, replacements = await asyncio.gather(
+            self.loaders.employees.load_many(lr.employee_id for lr in leave_requests),
+            self.loaders.employees.load_many(
+                lr.replacement_employee_id for lr in leave_requests
+            ),
         )
 
         items = []
-        for lr in leave_requests:
-            emp = next((e for e in subordinates if e.id == lr.employee_id), None)
+        for lr, emp, replacement_emp in zip(leave_requests, employees, replacements):
             employee_name = emp.user.name if emp and emp.user else None
             employee_number = emp.code if emp else None
 
             replacement_employee_name = None
-            if lr.replacement_employee_id:
-                replacement_emp = await self.employee_queries.get_by_id(
-                    lr.replacement_employee_id
-                )
-                if replacement_emp and replacement_emp.user:
-                    replacement_employee_name = replacement_emp.user.name
+            if replacement_emp and replacement_emp.user:
+                replacement_employee_name = replacement_emp.user.name
 
             items.append(
                 LeaveRequestListResponse(
@@ -191,4 +214,5 @@ class ListTeamLeaveRequestsUseCase:
                 )
             )
 
-        return items, total_items
+        next_cursor = self.queries.next_cursor(leave_requests, limit)
+        return items, total_items, next_cursor
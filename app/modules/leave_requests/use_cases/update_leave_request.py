@@ -8,6 +8,7 @@ from app.modules.leave_requests.repositories import (
 )
 from app.modules.employees.repositories import EmployeeQueries
 from app.core.exceptions import NotFoundException, BadRequestException
+from app.core.cache import dashboard_cache
 from app.modules.leave_requests.utils.total_days import (
     validate_no_overlapping_leave,
     validate_leave_dates,
@@ -120,4 +121,6 @@ class UpdateLeaveRequestUseCase:
                 org_unit_id=emp.org_unit_id,
             )
 
+        await dashboard_cache.invalidate_employee(emp.id, emp.org_unit_id)
+
         return LeaveRequestResponse.model_validate(updated)
@@ -13,6 +13,7 @@ from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from app.config.database import Base
 from app.core.models.base_model import TimestampMixin
+from app.core.models.types import Ltree
 
 if TYPE_CHECKING:
     from app.modules.employees.models.employee import Employee
@@ -36,7 +37,7 @@ class OrgUnit(Base, TimestampMixin):
         index=True,
     )
     level: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    path: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    path: Mapped[str] = mapped_column(Ltree, nullable=False)
     head_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey(
@@ -76,7 +77,7 @@ class OrgUnit(Base, TimestampMixin):
 
     # Indexes
     __table_args__ = (
-        Index("ix_org_units_path_pattern", "path", postgresql_using="btree"),
+        Index("ix_org_units_path_gist", "path", postgresql_using="gist"),
     )
 
     def is_deleted(self) -> bool:
@@ -2,9 +2,11 @@
 OrgUnit Command Repository - Write operations
 """
 
-from typing import Optional
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, func, literal, update
 
+from app.core.models.types import Ltree
 from app.core.utils.datetime import get_utc_now
 from app.modules.org_units.models.org_unit import OrgUnit
 
@@ -26,6 +28,44 @@ class OrgUnitCommands:
         await self.db.refresh(org_unit)
         return org_unit
 
+    async def move_subtree(
+        self, org_unit: OrgUnit, new_path: str, updated_by: Optional[str] = None
+    ) -> List[int]:
+        """
+        Pindahkan org_unit beserta seluruh subtree ke new_path dalam satu UPDATE.
+
+        Prefix path lama diganti new_path dan level dihitung ulang dari
+        nlevel, untuk semua descendant (termasuk yang soft-deleted) tanpa
+        batas jumlah.
+
+        Tidak commit: caller meng-commit UPDATE ini bersama perubahan
+        parent_id (lihat UpdateOrgUnitUseCase), supaya keduanya atomik.
+
+        Returns:
+            List[int]: ID descendant yang path-nya berubah (tanpa org_unit sendiri)
+        """
+        old = literal(org_unit.path, Ltree)
+        new = literal(new_path, Ltree)
+        moved_path = case(
+            (OrgUnit.path == old, new),
+            else_=new.op("||", return_type=Ltree)(
+                func.subpath(OrgUnit.path, func.nlevel(old), type_=Ltree)
+            ),
+        )
+
+        values = {"path": moved_path, "level": func.nlevel(moved_path)}
+        if updated_by is not None:
+            values["updated_by"] = updated_by
+
+        result = await self.db.execute(
+            update(OrgUnit)
+            .where(OrgUnit.path.descendant_of(old))
+            .values(**values)
+            .returning(OrgUnit.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        return [i for i in result.scalars().all() if i != org_unit.id]
+
     async def delete(self, org_unit_id: int, user_id: int) -> bool:
         from app.modules.org_units.repositories.queries import OrgUnitQueries
         
@@ -7,6 +7,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, text
 from sqlalchemy.orm import selectinload
 
+from app.core.repositories.counting import fetch_page
+from app.core.repositories.keyset import (
+    build_next_cursor,
+    decode_cursor,
+    keyset_condition,
+)
 from app.modules.org_units.models.org_unit import OrgUnit
 
 
@@ -16,6 +22,11 @@ class OrgUnitQueries:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def next_cursor(items: List[OrgUnit], limit: int) -> Optional[str]:
+        """Cursor for the org unit list page after `items`."""
+        return build_next_cursor(items, limit, lambda o: (o.id,))
+
     def _base_options(self):
         from app.modules.employees.models.employee import Employee
 
@@ -56,7 +67,9 @@ class OrgUnitQueries:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[OrgUnit], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[OrgUnit], Optional[int]]:
         query = select(OrgUnit).where(OrgUnit.deleted_at.is_(None))
 
         if parent_id is not None:
@@ -71,16 +84,26 @@ class OrgUnitQueries:
                 or_(OrgUnit.name.ilike(pattern), OrgUnit.code.ilike(pattern))
             )
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await self.db.execute(count_query)).scalar_one()
-
-        # Data query
-        query = query.options(*self._base_options()).offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        items = list(result.scalars().all())
+        base_query = query
 
-        return items, total
+        # Data query (keyset on id when a cursor is given, OFFSET otherwise)
+        if cursor:
+            (last_id,) = decode_cursor(cursor, (OrgUnit.id,))
+            query = query.where(
+                keyset_condition((OrgUnit.id,), (last_id,), descending=False)
+            )
+        else:
+            query = query.offset(skip)
+        query = (
+            query.options(*self._base_options()).order_by(OrgUnit.id).limit(limit)
+        )
+        return await fetch_page(
+            self.db,
+            base_query,
+            query,
+            include_total=include_total,
+            window_total=cursor is None,
+        )
 
     async def list_deleted(
         self,
@@ -126,7 +149,8 @@ class OrgUnitQueries:
 
             query = select(OrgUnit).where(
                 and_(
-                    OrgUnit.path.like(f"{parent.path}.%"),
+                    OrgUnit.path.descendant_of(parent.path),
+                    OrgUnit.id != parent.id,
                     OrgUnit.deleted_at.is_(None),
                 )
             )
@@ -184,7 +208,7 @@ class OrgUnitQueries:
             root = await self.get_by_id(root_id)
             if not root:
                 return []
-            query = query.where(OrgUnit.path.like(f"{root.path}%"))
+            query = query.where(OrgUnit.path.descendant_of(root.path))
 
         if max_depth > 0:
             query = query.where(OrgUnit.level <= max_depth)
@@ -249,6 +273,8 @@ class OrgUnitQueries:
         if not ids:
             return []
         result = await self.db.execute(
-            select(OrgUnit).options(*self._base_options()).where(OrgUnit.id.in_(ids))
+            select(OrgUnit)
+            .options(*self._base_options())
+            .where(and_(OrgUnit.id.in_(ids), OrgUnit.deleted_at.is_(None)))
         )
         return list(result.scalars().all())
@@ -90,10 +90,18 @@ async def list_org_units(
     search: Optional[str] = None,
     parent_id: Optional[int] = None,
     type_filter: Optional[str] = None,
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor halaman berikutnya (meta.next_cursor). Jika diisi, page diabaikan",
+    ),
+    include_total: bool = Query(
+        True,
+        description="Hitung total item. Set false untuk infinite scroll (lebih cepat)",
+    ),
 ) -> PaginatedResponse[OrgUnitResponse]:
     """List organization units with pagination and filters"""
     items, pagination = await service.list_org_units(
-        page, limit, search, parent_id, type_filter
+        page, limit, search, parent_id, type_filter, cursor, include_total
     )
     return create_paginated_response(
         message="Daftar org unit berhasil diambil",
@@ -101,6 +109,7 @@ async def list_org_units(
         page=pagination["page"],
         limit=pagination["limit"],
         total_items=pagination["total_items"],
+        next_cursor=pagination["next_cursor"],
     )
 
 
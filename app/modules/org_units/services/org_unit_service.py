@@ -117,12 +117,19 @@ class OrgUnitService:
         search: Optional[str] = None,
         parent_id: Optional[int] = None,
         type_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Tuple[List[OrgUnitResponse], Dict[str, Any]]:
         org_units, total = await self.list_uc.execute(
-            page, limit, search, parent_id, type_filter
+            page, limit, search, parent_id, type_filter, cursor, include_total
         )
         items = [OrgUnitResponse.from_orm_with_head(ou) for ou in org_units]
-        pagination = {"page": page, "limit": limit, "total_items": total}
+        pagination = {
+            "page": page,
+            "limit": limit,
+            "total_items": total,
+            "next_cursor": OrgUnitQueries.next_cursor(org_units, limit),
+        }
         return items, pagination
 
     async def get_org_unit_children(
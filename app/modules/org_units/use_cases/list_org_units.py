@@ -14,7 +14,9 @@ class ListOrgUnitsUseCase:
         search: Optional[str] = None,
         parent_id: Optional[int] = None,
         type_filter: Optional[str] = None,
-    ) -> Tuple[List[OrgUnit], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[OrgUnit], Optional[int]]:
         skip = (page - 1) * limit
         org_units, total = await self.queries.list(
             parent_id=parent_id,
@@ -22,6 +24,8 @@ class ListOrgUnitsUseCase:
             search=search,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+            include_total=include_total,
         )
         return org_units, total
 
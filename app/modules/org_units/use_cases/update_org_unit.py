@@ -3,7 +3,7 @@ Update OrgUnit Use Case
 Clean implementation using extracted utils.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List
 import logging
 
 from app.modules.org_units.models.org_unit import OrgUnit
@@ -19,6 +19,14 @@ from app.modules.employees.utils.events import EmployeeEventUtil
 
 logger = logging.getLogger(__name__)
 
+# Affected rows are loaded for event publishing in batches of this size
+_EVENT_LOAD_BATCH_SIZE = 500
+
+
+def _chunks(ids: List[int]) -> Iterator[List[int]]:
+    for start in range(0, len(ids), _EVENT_LOAD_BATCH_SIZE):
+        yield ids[start:start + _EVENT_LOAD_BATCH_SIZE]
+
 
 class UpdateOrgUnitUseCase:
     def __init__(
@@ -96,12 +104,19 @@ class UpdateOrgUnitUseCase:
             org_unit.is_active = update_data["is_active"]
 
         org_unit.set_updated_by(updated_by)
-        await self.commands.update(org_unit)
 
         # Track affected entities for event publishing
         affected_employee_ids = []
         affected_org_unit_ids = []
 
+        # Recalculate path if parent changed - delegate to util. The subtree
+        # UPDATE and parent_id are committed together by commands.update.
+        if parent_changed:
+            affected_org_unit_ids = await OrgUnitPathUtil.recalculate_path(
+                self.queries, self.commands, org_unit
+            )
+        await self.commands.update(org_unit)
+
         # Handle head change - delegate to util
         if ("head_id" in update_data or parent_changed) and self.employee_queries and self.employee_commands:
             new_head_id = org_unit.head_id
@@ -116,38 +131,30 @@ class UpdateOrgUnitUseCase:
                 updated_by,
             )
 
-        # Recalculate path if parent changed - delegate to util
-        if parent_changed:
-            affected_org_unit_ids = await OrgUnitPathUtil.recalculate_path(
-                self.queries, self.commands, org_unit
-            )
-
         updated = await self.queries.get_by_id(org_unit_id)
 
         await OrgUnitEventUtil.publish(self.event_publisher, "updated", updated)
 
         if self.event_publisher and affected_employee_ids:
             logger.info(f"Publishing employee.updated for {len(affected_employee_ids)} affected employees")
-            for employee_id in affected_employee_ids:
-                affected_employee = await self.employee_queries.get_by_id(employee_id)
-                if affected_employee:
+            for chunk in _chunks(affected_employee_ids):
+                for affected_employee in await self.employee_queries.batch_get(chunk):
                     await EmployeeEventUtil.publish(
                         self.event_publisher,
                         "updated",
                         affected_employee
                     )
-                    logger.debug(f"Published employee.updated for employee {employee_id}")
+                    logger.debug(f"Published employee.updated for employee {affected_employee.id}")
 
         if self.event_publisher and affected_org_unit_ids:
             logger.info(f"Publishing org_unit.updated for {len(affected_org_unit_ids)} affected descendants")
-            for descendant_id in affected_org_unit_ids:
-                affected_org_unit = await self.queries.get_by_id(descendant_id)
-                if affected_org_unit:
+            for chunk in _chunks(affected_org_unit_ids):
+                for affected_org_unit in await self.queries.batch_get(chunk):
                     await OrgUnitEventUtil.publish(
                         self.event_publisher,
                         "updated",
                         affected_org_unit
                     )
-                    logger.debug(f"Published org_unit.updated for descendant {descendant_id}")
+                    logger.debug(f"Published org_unit.updated for descendant {affected_org_unit.id}")
 
         return updated
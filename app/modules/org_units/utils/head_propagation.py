@@ -32,51 +32,19 @@ class OrgUnitHeadUtil:
         - If Head cleared, resolve effective supervisor from parent
         - Propagate to child Org Units that don't have their own Head
 
+        The whole subtree is resolved and updated by one statement
+        (EmployeeCommands.reassign_org_unit_supervisors).
+
         Returns:
             list[int]: List of affected employee IDs whose supervisor_id was updated
         """
-        affected_employee_ids = []
-        effective_supervisor_id = new_head_id
-        if not effective_supervisor_id:
-            effective_supervisor_id = await OrgUnitHeadUtil.resolve_supervisor_for_unit(
-                org_queries, org_unit_id
-            )
-
-        members, _ = await emp_queries.list(org_unit_id=org_unit_id, limit=1000)
+        affected_employee_ids = await emp_commands.reassign_org_unit_supervisors(
+            org_unit_id, updated_by, head_id=new_head_id
+        )
         logger.info(
-            f"Updating {len(members)} members for OrgUnit {org_unit_id}. Effective Sup: {effective_supervisor_id}"
+            f"Head change on OrgUnit {org_unit_id} ({old_head_id} -> {new_head_id}): "
+            f"{len(affected_employee_ids)} employees reassigned"
         )
-
-        for emp in members:
-            target_sup = effective_supervisor_id
-
-            if target_sup == emp.id:
-                logger.info(
-                    f"Employee {emp.id} is the generic supervisor. Re-resolving excluding self."
-                )
-                target_sup = await OrgUnitHeadUtil.resolve_supervisor_for_unit(
-                    org_queries, org_unit_id, exclude_employee_id=emp.id
-                )
-                logger.info(f"Re-resolved supervisor for {emp.id}: {target_sup}")
-
-            if emp.supervisor_id != target_sup:
-                logger.info(
-                    f"Updating Employee {emp.id}: supervisor {emp.supervisor_id} -> {target_sup}"
-                )
-                emp.supervisor_id = target_sup
-                emp.set_updated_by(updated_by)
-                await emp_commands.update(emp)
-                affected_employee_ids.append(emp.id)
-
-        children, _ = await org_queries.get_children(org_unit_id, recursive=False)
-        for child in children:
-            if not child.head_id:
-                child_affected = await OrgUnitHeadUtil.handle_head_change(
-                    org_queries, org_commands, emp_queries, emp_commands,
-                    child.id, None, None, updated_by
-                )
-                affected_employee_ids.extend(child_affected)
-
         return affected_employee_ids
 
     @staticmethod
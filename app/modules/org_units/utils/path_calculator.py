@@ -1,6 +1,9 @@
 """
 OrgUnit Path Calculator Utility
 Handles path and level recalculation for org unit hierarchy.
+
+Paths are ltree values of unit ids from the root ("1.4.12"); level equals
+the number of labels (nlevel).
 """
 
 from typing import Optional
@@ -23,57 +26,26 @@ class OrgUnitPathUtil:
     ) -> list[int]:
         """
         Recalculate path for org unit and all its descendants.
-        Called when parent_id changes.
+        Called when parent_id changes. The whole subtree is rewritten by a
+        single UPDATE (see OrgUnitCommands.move_subtree); nothing is
+        committed, the caller commits it together with the parent_id change.
 
         Returns:
             list[int]: List of affected org unit IDs whose path was updated
         """
-        affected_org_unit_ids = []
-        old_path = org_unit.path
-
+        parent = None
         if org_unit.parent_id:
             parent = await queries.get_by_id(org_unit.parent_id)
-            if parent:
-                org_unit.path = f"{parent.path}.{org_unit.id}"
-                org_unit.level = parent.level + 1
-                await commands.update(org_unit)
-
-                descendants = await OrgUnitPathUtil._update_descendants(
-                    queries, commands, org_unit, old_path
-                )
-                affected_org_unit_ids.extend(descendants)
-        else:
-            org_unit.path = str(org_unit.id)
-            org_unit.level = 1
-            await commands.update(org_unit)
+            if not parent:
+                return []
 
-        return affected_org_unit_ids
-
-    @staticmethod
-    async def _update_descendants(
-        queries: OrgUnitQueries,
-        commands: OrgUnitCommands,
-        org_unit: OrgUnit,
-        old_path: str,
-    ) -> list[int]:
-        """
-        Update path/level for all descendants after parent path change
+        new_path, _ = OrgUnitPathUtil.build_initial_path(parent, org_unit.id)
+        if new_path == org_unit.path:
+            return []
 
-        Returns:
-            list[int]: List of affected descendant org unit IDs
-        """
-        affected_ids = []
-        children, _ = await queries.get_children(
-            org_unit.id, recursive=True, skip=0, limit=1000
+        return await commands.move_subtree(
+            org_unit, new_path, updated_by=org_unit.updated_by
         )
-        for child in children:
-            child.path = child.path.replace(old_path, org_unit.path, 1)
-            parts = child.path.split(".")
-            child.level = len(parts)
-            await commands.update(child)
-            affected_ids.append(child.id)
-
-        return affected_ids
 
     @staticmethod
     def build_initial_path(parent: Optional[OrgUnit], org_unit_id: int) -> tuple[str, int]:
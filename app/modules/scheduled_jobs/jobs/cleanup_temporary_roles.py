@@ -4,6 +4,7 @@ Job untuk cleanup expired temporary user roles.
 Business Logic:
 - Berjalan setiap hari jam 01:00 WIB
 - Menghapus user_roles dengan is_temporary=True yang valid_until < now
+- Invalidate cache CurrentUser untuk user yang role-nya dihapus
 """
 
 from typing import Dict, Any
@@ -13,8 +14,10 @@ from sqlalchemy import delete, and_
 
 from app.core.scheduler.base import BaseScheduledJob
 from app.config.database import get_db_context
+from app.config.db_pool import Workload
 from app.modules.users.rbac.models.user_role import UserRole
 from app.core.utils.datetime import get_utc_now
+from app.core.cache import current_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -43,19 +46,26 @@ class CleanupTemporaryRolesJob(BaseScheduledJob):
         logger.info(f"Memulai cleanup temporary roles untuk waktu: {now}")
 
         try:
-            async with get_db_context() as db:
+            async with get_db_context(Workload.SCHEDULER) as db:
                 # Delete expired temporary roles
-                stmt = delete(UserRole).where(
-                    and_(
-                        UserRole.is_temporary == True,  # noqa: E712
-                        UserRole.valid_until < now,
+                stmt = (
+                    delete(UserRole)
+                    .where(
+                        and_(
+                            UserRole.is_temporary == True,  # noqa: E712
+                            UserRole.valid_until < now,
+                        )
                     )
+                    .returning(UserRole.user_id)
                 )
 
                 result = await db.execute(stmt)
-                deleted_count = result.rowcount
+                affected_user_ids = list(result.scalars().all())
+                deleted_count = len(affected_user_ids)
                 await db.commit()
 
+                await current_user_cache.invalidate_many(affected_user_ids)
+
                 message = f"Cleanup temporary roles selesai. Deleted: {deleted_count}"
                 logger.info(message)
 
@@ -8,6 +8,7 @@ Business Logic:
 - Skip employee dengan org_unit.type = "Direktorat"
 - Update status menjadi "invalid" untuk attendance tersebut
 - Hanya memproses attendance untuk hari ini
+- Semua filter dan update dijalankan dalam satu UPDATE ... RETURNING
 """
 
 from typing import Dict, Any
@@ -16,12 +17,9 @@ import logging
 
 from app.core.scheduler.base import BaseScheduledJob
 from app.config.database import get_db_context
-from sqlalchemy import select, and_
-from sqlalchemy.orm import joinedload
-from app.modules.attendances.models.attendances import Attendance
-from app.modules.employees.models.employee import Employee
+from app.config.db_pool import Workload
+from app.modules.attendances.repositories import AttendanceCommands
 from app.modules.holiday_calendar.repositories import HolidayQueries
-from app.core.enums.org_unit import OrgUnitType
 
 logger = logging.getLogger(__name__)
 
@@ -55,16 +53,12 @@ class MarkInvalidNoCheckoutJob(BaseScheduledJob):
         """
         today = date.today()
 
-        updated_count = 0
-        skipped_count = 0
-        error_count = 0
-
         logger.info(
             f"Memulai mark invalid no checkout untuk attendance tanggal: {today}"
         )
 
         try:
-            async with get_db_context() as db:
+            async with get_db_context(Workload.SCHEDULER) as db:
                 # Cek apakah hari ini adalah hari libur
                 holiday_queries = HolidayQueries(db)
                 is_holiday = await holiday_queries.is_holiday(today)
@@ -88,63 +82,14 @@ class MarkInvalidNoCheckoutJob(BaseScheduledJob):
                         },
                     }
 
-                query = (
-                    select(Attendance)
-                    .options(
-                        joinedload(Attendance.employee).joinedload(Employee.org_unit)
-                    )
-                    .where(
-                        and_(
-                            Attendance.attendance_date == today,
-                            Attendance.check_in_time.isnot(None),
-                            Attendance.check_out_time.is_(None),
-                            Attendance.status.notin_(["invalid", "leave"])
-                        )
-                    )
-                )
-
-                result = await db.execute(query)
-                attendances = result.scalars().unique().all()
-
-                total_found = len(attendances)
-                logger.info(
-                    f"Ditemukan {total_found} attendance dengan check-in tapi tanpa check-out"
-                )
+                attendance_commands = AttendanceCommands(db)
+                counts = await attendance_commands.mark_invalid_no_checkout(today)
 
-                for attendance in attendances:
-                    try:
-                        # Skip jika employee org_unit.type = Direktorat
-                        if (
-                            attendance.employee 
-                            and attendance.employee.org_unit 
-                            and attendance.employee.org_unit.type == OrgUnitType.DIREKTORAT.value
-                        ):
-                            logger.debug(
-                                f"Skip attendance ID {attendance.id} (employee_id={attendance.employee_id}) "
-                                f"karena org_unit.type=Direktorat"
-                            )
-                            skipped_count += 1
-                            continue
-
-                        # Update status menjadi 'invalid'
-                        attendance.status = "invalid"
-
-                        await db.flush()
-                        updated_count += 1
-
-                        logger.debug(
-                            f"Attendance ID {attendance.id} (employee_id={attendance.employee_id}) "
-                            f"di-mark invalid karena tidak checkout"
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error update attendance ID {attendance.id}: {e}"
-                        )
-                        error_count += 1
-
-                # Commit semua changes
-                await db.commit()
+                total_found = counts["total_found"]
+                updated_count = counts["updated"]
+                # Skipped: employee dengan org_unit.type = Direktorat
+                skipped_count = counts["skipped"]
+                error_count = 0
 
                 message = (
                     f"Mark invalid no checkout selesai. "
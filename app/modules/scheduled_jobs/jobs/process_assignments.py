@@ -14,6 +14,7 @@ import logging
 
 from app.core.scheduler.base import BaseScheduledJob
 from app.config.database import get_db_context
+from app.config.db_pool import Workload
 from app.modules.employee_assignments.repositories import (
     AssignmentQueries,
     AssignmentCommands,
@@ -56,7 +57,7 @@ class ProcessAssignmentsJob(BaseScheduledJob):
         logger.info(f"Memulai process assignments untuk tanggal: {today}")
 
         try:
-            async with get_db_context() as db:
+            async with get_db_context(Workload.SCHEDULER) as db:
                 queries = AssignmentQueries(db)
                 commands = AssignmentCommands(db)
 
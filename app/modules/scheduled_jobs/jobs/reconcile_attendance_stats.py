@@ -0,0 +1,82 @@
+"""
+Job untuk rekonsiliasi tabel rollup attendance (attendance_daily_stats,
+attendance_monthly_stats).
+
+Business Logic:
+- Berjalan setiap hari jam 23:45 WIB (setelah mark invalid no checkout)
+- Rollup dipelihara incremental oleh AttendanceCommands; job ini menghitung
+  ulang dari tabel attendances untuk memperbaiki drift (write di luar
+  AttendanceCommands, koreksi manual di database, dsb.)
+- Rebuild RECONCILE_DAYS hari terakhir (daily) dan semua bulan yang
+  bersinggungan dengan rentang tersebut (monthly)
+"""
+
+from typing import Dict, Any
+from datetime import date, timedelta
+import logging
+
+from app.core.scheduler.base import BaseScheduledJob
+from app.config.database import get_db_context
+from app.config.db_pool import Workload
+from app.modules.attendances.repositories import AttendanceStatsCommands
+
+logger = logging.getLogger(__name__)
+
+# Cukup untuk mencakup bulan berjalan dan bulan sebelumnya
+RECONCILE_DAYS = 35
+
+
+class ReconcileAttendanceStatsJob(BaseScheduledJob):
+    """
+    Job untuk menghitung ulang rollup attendance dari tabel attendances.
+    """
+
+    job_id = "reconcile_attendance_stats"
+    description = "Rekonsiliasi rollup attendance harian/bulanan dari tabel attendances"
+    cron = "45 23 * * *"  # Setiap hari jam 23:45 WIB
+    enabled = True
+    max_retries = 3
+
+    async def execute(self) -> Dict[str, Any]:
+        """
+        Execute job: rebuild rollup untuk RECONCILE_DAYS hari terakhir.
+
+        Returns:
+            Dict dengan hasil eksekusi
+        """
+        end_date = date.today()
+        start_date = end_date - timedelta(days=RECONCILE_DAYS - 1)
+
+        logger.info(
+            f"Memulai rekonsiliasi attendance stats: {start_date} s/d {end_date}"
+        )
+
+        try:
+            async with get_db_context(Workload.SCHEDULER) as db:
+                counts = await AttendanceStatsCommands(db).rebuild(
+                    start_date, end_date
+                )
+                await db.commit()
+
+            message = (
+                f"Rekonsiliasi attendance stats selesai. "
+                f"Daily rows: {counts['daily_rows']}, "
+                f"Monthly rows: {counts['monthly_rows']}"
+            )
+            logger.info(message)
+
+            return {
+                "success": True,
+                "message": message,
+                "data": {
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat(),
+                    "daily_rows": counts["daily_rows"],
+                    "monthly_rows": counts["monthly_rows"],
+                },
+            }
+
+        except Exception as e:
+            error_message = f"Error saat execute rekonsiliasi attendance stats: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            raise Exception(error_message)
@@ -4,6 +4,7 @@ Role Command Repository - Write operations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.modules.users.rbac.models.user_role import UserRole
 
@@ -19,6 +20,14 @@ class RoleCommands:
         self.db.add(user_role)
         await self.db.commit()
 
+    async def assign_role_if_absent(self, user_id: str, role_id: int) -> None:
+        """Assign role with ON CONFLICT DO NOTHING. Does not commit."""
+        await self.db.execute(
+            insert(UserRole)
+            .values(user_id=user_id, role_id=role_id)
+            .on_conflict_do_nothing()
+        )
+
     async def remove_role(self, user_id: str, role_id: int) -> None:
         stmt = select(UserRole).where(
             UserRole.user_id == user_id, UserRole.role_id == role_id
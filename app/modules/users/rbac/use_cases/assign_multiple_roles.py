@@ -10,6 +10,7 @@ from app.modules.users.rbac.repositories import RoleQueries, RoleCommands
 from app.modules.users.users.repositories import UserQueries
 from app.modules.users.rbac.schemas.responses import MultipleRoleAssignmentResponse
 from app.core.exceptions import NotFoundException
+from app.core.cache import current_user_cache
 
 
 class AssignMultipleRolesUseCase:
@@ -41,4 +42,6 @@ class AssignMultipleRolesUseCase:
                 raise NotFoundException(f"Role '{role_name}' tidak ditemukan")
             await self.role_commands.assign_role(user_id, role.id)
 
+        await current_user_cache.invalidate(user_id)
+
         return MultipleRoleAssignmentResponse(user_id=user_id, roles=role_names)
@@ -8,6 +8,7 @@ from app.modules.users.rbac.repositories import RoleQueries, RoleCommands
 from app.modules.users.users.repositories import UserQueries
 from app.modules.users.rbac.schemas.responses import RoleAssignmentResponse
 from app.core.exceptions import NotFoundException
+from app.core.cache import current_user_cache
 
 
 class AssignRoleToUserUseCase:
@@ -36,5 +37,6 @@ class AssignRoleToUserUseCase:
             raise NotFoundException(f"Role '{role_name}' tidak ditemukan")
 
         await self.role_commands.assign_role(user_id, role.id)
+        await current_user_cache.invalidate(user_id)
 
         return RoleAssignmentResponse(user_id=user_id, role_name=role_name)
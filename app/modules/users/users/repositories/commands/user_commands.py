@@ -4,6 +4,7 @@ User Command Repository - Write operations
 
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime
 
 from app.modules.users.users.models.user import User
@@ -28,27 +29,34 @@ class UserCommands:
         await self.db.refresh(user)
         return user
 
-    async def create_from_sso(
+    async def insert_from_sso_if_absent(
         self,
         sso_id: str,
         name: str,
         email: Optional[str] = None,
-        phone: Optional[str] = None,
-        gender: Optional[str] = None,
         avatar_path: Optional[str] = None,
-    ) -> User:
-        """Create user from SSO data. sso_id becomes user.id."""
-        user = User(
-            id=sso_id, 
-            name=name,
-            email=email,
-            phone=phone,
-            gender=gender,
-            avatar_path=avatar_path,
-            is_active=True,
-            synced_at=datetime.utcnow(),
+    ) -> bool:
+        """
+        Insert user from SSO data with ON CONFLICT DO NOTHING.
+
+        Returns True if this call inserted the row, False if it already existed.
+        Does not commit; caller owns the transaction.
+        """
+        stmt = (
+            insert(User)
+            .values(
+                id=sso_id,
+                name=name,
+                email=email,
+                avatar_path=avatar_path,
+                is_active=True,
+                synced_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing()
+            .returning(User.id)
         )
-        return await self.create(user)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
 
     async def sync_from_sso(
         self,
@@ -2,12 +2,18 @@
 User Query Repository - Read operations
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, distinct, null, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime, timedelta
 
 from app.modules.users.users.models.user import User
+from app.modules.users.rbac.models.role import Role
+from app.modules.users.rbac.models.permission import Permission
+from app.modules.users.rbac.models.user_role import UserRole
+from app.modules.users.rbac.models.role_permission import RolePermission
+from app.modules.employees.models.employee import Employee
 
 
 class UserQueries:
@@ -21,6 +27,48 @@ class UserQueries:
         result = await self.db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_auth_identity(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve everything needed to build CurrentUser in a single round trip.
+
+        Returns dict with is_active, roles, permissions, employee_id and
+        org_unit_id, or None if the user does not exist.
+        """
+        stmt = (
+            select(
+                User.is_active,
+                func.array_remove(
+                    func.array_agg(distinct(Role.name)), null(), type_=ARRAY(String)
+                ).label("roles"),
+                func.array_remove(
+                    func.array_agg(distinct(Permission.code)), null(), type_=ARRAY(String)
+                ).label("permissions"),
+                Employee.id.label("employee_id"),
+                Employee.org_unit_id,
+            )
+            .select_from(User)
+            .outerjoin(UserRole, UserRole.user_id == User.id)
+            .outerjoin(Role, Role.id == UserRole.role_id)
+            .outerjoin(RolePermission, RolePermission.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+            .outerjoin(
+                Employee,
+                and_(Employee.user_id == User.id, Employee.deleted_at.is_(None)),
+            )
+            .where(User.id == user_id)
+            .group_by(User.id, Employee.id)
+        )
+        row = (await self.db.execute(stmt)).mappings().first()
+        if not row:
+            return None
+        return {
+            "is_active": row["is_active"],
+            "roles": list(row["roles"] or []),
+            "permissions": list(row["permissions"] or []),
+            "employee_id": row["employee_id"],
+            "org_unit_id": row["org_unit_id"],
+        }
+
     async def get_by_email(self, email: str) -> Optional[User]:
         result = await self.db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
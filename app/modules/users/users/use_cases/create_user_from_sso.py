@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Optional
 
 from app.core.utils.logging import get_logger
-from app.modules.users.users.models import User
 from app.modules.users.users.repositories import UserCommands
 from app.modules.users.rbac.repositories import RoleQueries, RoleCommands
 
@@ -34,28 +33,31 @@ class CreateUserFromSSOUseCase:
         self.role_queries = role_queries
         self.role_commands = role_commands
 
-    async def execute(self, data: CreateUserFromSSODTO) -> User:
+    async def execute(self, data: CreateUserFromSSODTO) -> bool:
         """
         Create HRIS user from SSO data.
-        
-        1. Creates basic user record
-        2. Assigns default 'employee' role
+
+        1. Inserts basic user record (ON CONFLICT DO NOTHING)
+        2. Assigns default 'employee' role if this call created the user
+
+        Does not commit; caller owns the transaction.
+
+        Returns:
+            True if the user was created by this call, False if it already existed.
         """
-        # Create user
-        user = await self.user_commands.create_from_sso(
+        created = await self.user_commands.insert_from_sso_if_absent(
             sso_id=data.id,
             name=data.name,
             email=data.email,
             avatar_path=data.avatar_url,
         )
+        if not created:
+            return False
 
-        try:
-            role = await self.role_queries.get_role_by_name("employee")
-            if role:
-                await self.role_commands.assign_role(user.id, role.id)
-            else:
-                logger.warning("Default role 'employee' not found during JIT provisioning")
-        except Exception as e:
-            logger.warning(f"Failed to assign role to user {user.id}: {str(e)}")
+        role = await self.role_queries.get_role_by_name("employee")
+        if role:
+            await self.role_commands.assign_role_if_absent(data.id, role.id)
+        else:
+            logger.warning("Default role 'employee' not found during JIT provisioning")
 
-        return user
+        return True
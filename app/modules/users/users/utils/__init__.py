@@ -0,0 +1,10 @@
+"""
+User Module Utilities
+"""
+
+from app.modules.users.users.utils.jit_provisioning import (
+    JITProvisioner,
+    jit_provisioner,
+)
+
+__all__ = ["JITProvisioner", "jit_provisioner"]
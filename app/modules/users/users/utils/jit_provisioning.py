@@ -0,0 +1,142 @@
+"""
+Single-flight JIT user provisioning.
+
+A brand-new SSO user typically fires several API calls at once. Provisioning
+is coalesced per user:
+- In-process: concurrent callers await one shared asyncio future
+- Across workers: a short Redis lock lets one worker insert while others wait
+  for the lock to be released (Redis only), then check the DB once
+The insert itself is ON CONFLICT DO NOTHING, so a lost lock is still safe.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Dict
+
+import redis.asyncio as aioredis
+
+from app.config.database import get_db_context
+from app.config.redis import redis_client
+from app.core.utils.logging import get_logger
+from app.modules.users.users.repositories import UserCommands, UserQueries
+from app.modules.users.rbac.repositories import RoleQueries, RoleCommands
+from app.modules.users.users.use_cases.create_user_from_sso import (
+    CreateUserFromSSOUseCase,
+    CreateUserFromSSODTO,
+)
+
+logger = get_logger(__name__)
+
+# Delete the lock only if it is still ours (it may have expired and been
+# taken by another worker in the meantime)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class JITProvisioner:
+    """Per-user single-flight wrapper around CreateUserFromSSOUseCase."""
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        lock_prefix: str = "hris:jit_lock",
+        lock_timeout_seconds: int = 10,
+        wait_timeout_seconds: float = 5.0,
+        poll_interval_seconds: float = 0.02,
+        max_poll_interval_seconds: float = 0.5,
+    ):
+        self.redis = redis
+        self.lock_prefix = lock_prefix
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_poll_interval_seconds = max_poll_interval_seconds
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def provision(self, data: CreateUserFromSSODTO) -> None:
+        """Ensure the user exists, sharing one provisioning per user id."""
+        key = str(data.id)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            await asyncio.shield(inflight)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            await self._provision_with_lock(data)
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so it is not logged when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _provision_with_lock(self, data: CreateUserFromSSODTO) -> None:
+        lock_key = f"{self.lock_prefix}:{data.id}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.set(
+                lock_key, token, nx=True, ex=self.lock_timeout_seconds
+            )
+        except Exception as e:
+            logger.warning(f"JIT lock unavailable for {data.id}, provisioning anyway: {e}")
+            await self._provision(data)
+            return
+
+        if not acquired:
+            if await self._wait_for_user(data.id, lock_key):
+                return
+            logger.warning(f"JIT provisioning of {data.id} not found after wait")
+            await self._provision(data)
+            return
+
+        try:
+            await self._provision(data)
+        finally:
+            try:
+                await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                logger.warning(f"Failed to release JIT lock for {data.id}: {e}")
+
+    async def _provision(self, data: CreateUserFromSSODTO) -> None:
+        async with get_db_context() as db:
+            use_case = CreateUserFromSSOUseCase(
+                UserCommands(db), RoleQueries(db), RoleCommands(db)
+            )
+            created = await use_case.execute(data)
+            await db.commit()
+        if created:
+            logger.info(f"JIT provisioned user {data.id}")
+
+    async def _wait_for_user(self, user_id, lock_key: str) -> bool:
+        """
+        Wait for another worker's provisioning to land.
+
+        Polls only the Redis lock (exponential backoff); the holder releases
+        it after commit, so the DB is checked once, with one session.
+        """
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        interval = self.poll_interval_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.redis.exists(lock_key):
+                    break
+            except Exception as e:
+                logger.warning(f"JIT lock check failed for {user_id}: {e}")
+                break
+            interval = min(interval * 2, self.max_poll_interval_seconds)
+
+        async with get_db_context() as db:
+            return await UserQueries(db).get_by_id(user_id) is not None
+
+
+jit_provisioner = JITProvisioner(redis=redis_client)
@@ -9,6 +9,7 @@ from datetime import datetime
 
 from app.config.redis import redis_client
 from app.config.database import get_db_context
+from app.config.db_pool import Workload
 from app.core.scheduler.manager import init_scheduler
 from app.modules.scheduled_jobs.repositories.job_execution_repository import (
     JobExecutionRepository,
@@ -23,6 +24,9 @@ from app.modules.scheduled_jobs.jobs.auto_create_daily_attendance import (
 from app.modules.scheduled_jobs.jobs.mark_invalid_no_checkout import (
     MarkInvalidNoCheckoutJob,
 )
+from app.modules.scheduled_jobs.jobs.reconcile_attendance_stats import (
+    ReconcileAttendanceStatsJob,
+)
 from app.modules.scheduled_jobs.jobs.process_assignments import ProcessAssignmentsJob
 from app.modules.scheduled_jobs.jobs.cleanup_temporary_roles import (
     CleanupTemporaryRolesJob,
@@ -58,7 +62,7 @@ async def setup_scheduler():
         ) -> None:
             """Callback untuk save job execution log ke database"""
             try:
-                async with get_db_context() as db:
+                async with get_db_context(Workload.SCHEDULER) as db:
                     repo = JobExecutionRepository(db)
                     service = JobManagementService(repo)
                     await service.log_job_execution(
@@ -80,6 +84,7 @@ async def setup_scheduler():
         jobs_to_register = [
             AutoCreateDailyAttendanceJob(),
             MarkInvalidNoCheckoutJob(),
+            ReconcileAttendanceStatsJob(),
             ProcessAssignmentsJob(),
             CleanupTemporaryRolesJob(),
         ]
@@ -0,0 +1,164 @@
+"""
+Attendance Matrix Benchmark
+
+Compares the per-employee/per-day loop previously used by the attendance
+report with AttendanceMatrix on synthetic data (no database needed).
+Run: python scripts/benchmark_attendance_matrix.py [employees] [days]
+"""
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.utils.workforce import generate_working_days_list
+from app.modules.attendances.utils.attendance_matrix import (
+    AttendanceMatrix,
+    WorkingCalendar,
+)
+
+
+@dataclass
+class FakeAttendance:
+    employee_id: int
+    attendance_date: date
+    status: str
+    check_in_time: Optional[object]
+    check_out_time: Optional[object]
+    work_hours: Optional[Decimal]
+    overtime_hours: Optional[Decimal]
+
+
+def make_data(n_employees: int, n_days: int):
+    start = date(2025, 1, 1)
+    end = start + timedelta(days=n_days - 1)
+    employees = [
+        (emp_id, random.choice(["on_site", "hybrid", "ho"]))
+        for emp_id in range(1, n_employees + 1)
+    ]
+    attendances = []
+    for emp_id, _ in employees:
+        for offset in range(n_days):
+            if random.random() < 0.9:
+                attendances.append(
+                    FakeAttendance(
+                        employee_id=emp_id,
+                        attendance_date=start + timedelta(days=offset),
+                        status=random.choice(["present", "absent", "hybrid", "leave"]),
+                        check_in_time=None,
+                        check_out_time=None,
+                        work_hours=Decimal("8.00"),
+                        overtime_hours=Decimal("0.50"),
+                    )
+                )
+    return start, end, employees, attendances
+
+
+def legacy(start, end, employees, attendances):
+    """The report loop before AttendanceMatrix."""
+    by_employee_date = {}
+    for att in attendances:
+        by_employee_date.setdefault(att.employee_id, {})[att.attendance_date] = att
+
+    results = []
+    for emp_id, emp_type in employees:
+        att_dict = by_employee_date.get(emp_id, {})
+        cells = []
+        present = 0
+        work = 0.0
+        overtime = 0.0
+        for day in generate_working_days_list(start, end, emp_type):
+            att = att_dict.get(day)
+            if att:
+                cells.append((day, att.status, att.work_hours, att.overtime_hours))
+                if att.status in ["present", "hybrid"]:
+                    present += 1
+                if att.work_hours:
+                    work += float(att.work_hours)
+                if att.overtime_hours:
+                    overtime += float(att.overtime_hours)
+            else:
+                cells.append((day, "absent", None, None))
+        results.append(
+            (
+                cells,
+                present,
+                Decimal(str(work)) if work else None,
+                Decimal(str(overtime)) if overtime else None,
+            )
+        )
+    return results
+
+
+def matrix(start, end, employees, attendances):
+    calendar = WorkingCalendar(start, end)
+    m = AttendanceMatrix(calendar, employees).fill(attendances)
+    results = []
+    for emp_id, _ in employees:
+        totals = m.totals(emp_id)
+        results.append(
+            (
+                list(m.cells(emp_id)),
+                totals.present_days,
+                totals.work_hours,
+                totals.overtime_hours,
+            )
+        )
+    return results
+
+
+def legacy_totals(start, end, employees, attendances):
+    """Per-employee totals only (no cells), as the legacy loop computes them."""
+    return [result[1:] for result in legacy(start, end, employees, attendances)]
+
+
+def matrix_totals(start, end, employees, attendances):
+    """Per-employee totals only: fill + masked reductions, no per-cell output."""
+    calendar = WorkingCalendar(start, end)
+    m = AttendanceMatrix(calendar, employees).fill(attendances)
+    return [m.totals(emp_id) for emp_id, _ in employees]
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    n_employees = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 92
+    random.seed(42)
+    data = make_data(n_employees, n_days)
+
+    # Sanity check: both produce the same per-employee totals
+    for old, new in zip(legacy(*data), matrix(*data)):
+        assert old[1] == new[1], "present_days mismatch"
+        assert [c[:2] for c in old[0]] == [c[:2] for c in new[0]], "cells mismatch"
+        assert old[2] == new[2] and old[3] == new[3], "hours mismatch"
+
+    print(f"{n_employees} employees x {n_days} days ({len(data[3])} attendances)")
+    for label, old_fn, new_fn in (
+        ("report (cells + totals)", legacy, matrix),
+        ("totals only", legacy_totals, matrix_totals),
+    ):
+        legacy_s = timed(old_fn, *data)
+        matrix_s = timed(new_fn, *data)
+        print(f"  {label}")
+        print(f"    legacy loop : {legacy_s * 1000:8.1f} ms")
+        print(f"    matrix      : {matrix_s * 1000:8.1f} ms")
+        print(f"    speedup     : {legacy_s / matrix_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Dashboard Query Plan Check
+
+Seeds synthetic org units, employees, attendances and leave requests into
+the configured (local) Postgres inside a transaction, runs ANALYZE, then
+EXPLAINs every DashboardRepository statement and fails if any of them
+sequentially scans attendances or leave_requests. Everything is rolled back.
+
+Run (after `alembic upgrade head`):
+    python scripts/check_dashboard_query_plans.py [employees] [days]
+"""
+
+import asyncio
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config.settings import settings
+from app.core.utils.datetime import month_end, month_start
+from app.modules.dashboard.repositories.dashboard_repository import (
+    DashboardRepository,
+)
+
+# Tables that must be reached through an index
+WATCHED_TABLES = {"attendances", "leave_requests"}
+
+SEED_SQL = [
+    """
+    INSERT INTO org_units (code, name, type, path)
+    SELECT 'PLANCHK-OU-' || g, 'Plan Check ' || g, 'Divisi', ('planchk.' || g)::ltree
+    FROM generate_series(1, 20) g
+    """,
+    """
+    INSERT INTO employees (code, name, site, org_unit_id, is_active)
+    SELECT 'PLANCHK-' || g, 'Employee ' || g, 'on_site',
+           (SELECT id FROM org_units WHERE code = 'PLANCHK-OU-' || (g % 20 + 1)),
+           g % 10 <> 0
+    FROM generate_series(1, :employees) g
+    """,
+    """
+    INSERT INTO attendances
+        (employee_id, org_unit_id, attendance_date, status, check_in_time)
+    SELECT e.id, e.org_unit_id, d::date,
+           (ARRAY['present', 'absent', 'leave', 'hybrid', 'invalid'])[1 + (e.id + d::date - CAST(:start AS date)) % 5],
+           CASE WHEN (e.id + d::date - CAST(:start AS date)) % 5 IN (0, 4) THEN d + interval '8 hours' END
+    FROM employees e
+    CROSS JOIN generate_series(CAST(:start AS timestamp), CAST(:end AS timestamp), interval '1 day') d
+    WHERE e.code LIKE 'PLANCHK-%'
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO leave_requests
+        (employee_id, leave_type, start_date, end_date, total_days, reason)
+    SELECT e.id, 'leave', CAST(:start AS date) + e.id % :days,
+           CAST(:start AS date) + e.id % :days + 2, 3, 'plan check'
+    FROM employees e
+    WHERE e.code LIKE 'PLANCHK-%' AND e.id % 3 = 0
+    """,
+    "ANALYZE org_units, employees, attendances, leave_requests",
+]
+
+
+def iter_plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def seq_scans(plan_row: Dict[str, Any]) -> List[str]:
+    plan = plan_row["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        node["Relation Name"]
+        for node in iter_plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan"
+        and node.get("Relation Name") in WATCHED_TABLES
+    ]
+
+
+async def main():
+    n_employees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+    end = date.today()
+    start = end - timedelta(days=n_days - 1)
+
+    engine = create_async_engine(settings.database_url)
+    failures = 0
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            params = {
+                "employees": n_employees,
+                "days": n_days,
+                "start": start,
+                "end": end,
+            }
+            for statement in SEED_SQL:
+                await conn.execute(text(statement), params)
+
+            employee_id = (
+                await conn.execute(
+                    text("SELECT id FROM employees WHERE code = 'PLANCHK-1'")
+                )
+            ).scalar_one()
+
+            # From here on every SELECT is turned into EXPLAIN (FORMAT JSON),
+            # so repository methods return their own plan as the single row
+            @event.listens_for(conn.sync_connection, "before_cursor_execute", retval=True)
+            def explain(_conn, _cursor, statement, parameters, _context, _executemany):
+                if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                    statement = "EXPLAIN (FORMAT JSON) " + statement
+                return statement, parameters
+
+            repo = DashboardRepository(AsyncSession(bind=conn))
+            checks = {
+                "get_employee_summary": repo.get_employee_summary(
+                    employee_id, end, month_start(end), month_end(end)
+                ),
+                "get_hr_admin_summary": repo.get_hr_admin_summary(end),
+                "get_team_summary": repo.get_team_summary(employee_id, end),
+            }
+            for name, check in checks.items():
+                scanned = seq_scans(await check)
+                status = "OK" if not scanned else f"SEQ SCAN on {', '.join(scanned)}"
+                failures += bool(scanned)
+                print(f"  {name:<22}: {status}")
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+    print(f"{n_employees} employees x {n_days} days seeded (rolled back)")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import select
 from app.config.database import AsyncSessionLocal
+from app.core.cache import current_user_cache, invalidation_bus
+from app.core.security.permission_registry import RELOAD_TOPIC
 from app.modules.users.rbac.models.role import Role
 from app.modules.users.rbac.models.permission import Permission
 from app.modules.users.rbac.models.role_permission import RolePermission
@@ -435,6 +437,12 @@ async def seed_rbac():
                     print(f"  Assigned {perm_code} to {role_name}")
 
         await session.commit()
+
+        # Role-permission mapping may have changed: tell every running
+        # worker to reload permission bits and drop cached CurrentUser entries
+        await invalidation_bus.publish(RELOAD_TOPIC)
+        await current_user_cache.invalidate_all()
+
         print("RBAC seeding complete!")
 
 